@@ -2,6 +2,8 @@
 import dash
 import dash_bootstrap_components as dbc
 
+from monitoring.metrics import instrumentar_app
+
 app = dash.Dash(
     __name__,
     suppress_callback_exceptions=True,
@@ -13,5 +15,8 @@ app = dash.Dash(
 
 server = app.server
 
+# Instrumenta todos os callbacks registrados a partir daqui (rota /metrics)
+metricas = instrumentar_app(app)
+
 # Para rodar esse arquivo deve-se fazer através do arquivo index.py
 # python index.py
@@ -0,0 +1,478 @@
+# benchmarks/loadtest.py
+"""
+Teste de carga simulando vários planejadores usando o app ao mesmo tempo.
+
+Cada usuário virtual repete sequências realistas de callbacks, enviadas no
+mesmo formato que o navegador usa em ``/_dash-update-component``:
+
+- editar_tabela:     edição de uma linha da tabela de pontos de içamento
+                     (home, modo servidor: só a página e a linha alterada
+                     trafegam)
+- trocar_guindaste:  seleção no dropdown -> redesenho do mapa operacional
+- girar:             arrasto do slider de giro (validação + gráficos)
+- calcular:          botão calcular -> gráficos com as reações
+
+Cada usuário abre a tabela de pontos uma vez e importa ``--linhas`` pontos
+pelo upload (CSV), de modo que as edições e o mapa trabalham sobre uma
+tabela desse tamanho.
+
+Uso:
+    python -m benchmarks.loadtest --usuarios 8 --duracao 30
+    python -m benchmarks.loadtest --url http://localhost:8050 --usuarios 32
+
+Sem ``--url`` as requisições passam pelo test client do Flask dentro do
+mesmo processo (uma thread por usuário). Com ``--url`` o alvo é um
+servidor real, por exemplo ``gunicorn index:server -w 4``.
+"""
+import argparse
+import base64
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+ROTA = "/_dash-update-component"
+GUINDASTE = "guindaste_80TON"  # id no catálogo de tabelas de carga
+
+
+def _separar_outputs(chave):
+    """'..a.b...c.d..' -> [('a', 'b'), ('c', 'd')]; 'a.b' -> [('a', 'b')]"""
+    if chave.startswith(".."):
+        partes = chave[2:-2].split("...")
+    else:
+        partes = [chave]
+    return [tuple(p.rsplit(".", 1)) for p in partes]
+
+
+def montar_payload(callback_map, output, valores, disparado):
+    """
+    Monta o corpo JSON de uma chamada de callback.
+
+    output:     qualquer um dos outputs do callback, ex. "store-reacoes.data"
+    valores:    {"id.propriedade": valor} para inputs e states
+    disparado:  lista de "id.propriedade" que dispararam a chamada
+    """
+    chave = next(k for k in callback_map if output in k)
+    spec = callback_map[chave]
+    outputs = [{"id": i, "property": p} for i, p in _separar_outputs(chave)]
+
+    def itens(lista):
+        saida = []
+        for d in lista:
+            valor = valores.get(f"{d['id']}.{d['property']}")
+            if d["id"].startswith("{"):
+                # id com padrão (ALL): o valor já é a lista de
+                # {"id": {...}, "property": ..., "value": ...}
+                saida.append(valor or [])
+            else:
+                saida.append(dict(d, value=valor))
+        return saida
+
+    return chave, {
+        "output": chave,
+        "outputs": outputs if chave.startswith("..") else outputs[0],
+        "inputs": itens(spec["inputs"]),
+        "state": itens(spec["state"]),
+        "changedPropIds": list(disparado),
+    }
+
+
+class ClienteDash:
+    """Envia chamadas de callback via test client do Flask ou HTTP."""
+
+    def __init__(self, app, url=None):
+        self.url = url.rstrip("/") if url else None
+        self.callback_map = app.callback_map
+        self._client = None if url else app.server.test_client()
+        self.tabela = None  # tabela de pontos deste usuário (_abrir_tabela)
+
+    def chamar(self, output, valores, disparado):
+        chave, payload = montar_payload(self.callback_map, output, valores, disparado)
+        corpo = json.dumps(payload).encode()
+
+        t0 = time.perf_counter()
+        if self._client is not None:
+            r = self._client.post(ROTA, data=corpo, content_type="application/json")
+            status, dados = r.status_code, r.get_data()
+        else:
+            req = urllib.request.Request(
+                self.url + ROTA,
+                data=corpo,
+                headers={"Content-Type": "application/json"},
+            )
+            try:
+                with urllib.request.urlopen(req, timeout=60) as r:
+                    status, dados = r.status, r.read()
+            except urllib.error.HTTPError as e:
+                status, dados = e.code, e.read()
+        dt = time.perf_counter() - t0
+
+        if status == 200:
+            resposta = json.loads(dados).get("response", {})
+        else:
+            resposta = {}
+        # 204 = PreventUpdate, tratado como sucesso
+        return chave, dt, status in (200, 204), len(corpo) + len(dados), resposta
+
+
+# =====================================================
+# SEQUÊNCIAS
+# =====================================================
+
+
+def _estado_patolas():
+    from pages import calc_patolas as pg
+
+    return {
+        "patolas-data-table.data": pg.tabela_patolas.initial_data,
+        "centro-massa-data-table.data": pg.tabela_cm.initial_data,
+        "lanca-data-table.data": pg.tabela_lanca.initial_data,
+        "carga-data-table.data": pg.tabela_carga.initial_data,
+        "vento-data-table.data": pg.tabela_vento.initial_data,
+        "solo-data-table.data": pg.tabela_solo.initial_data,
+        "pesos-data-table.data": pg.tabela_pesos.initial_data,
+        "angulo-giro.value": 0,
+        "calculo-guindaste.value": "",
+        "calculo-projeto.value": "teste-de-carga",
+    }
+
+
+def _linhas_icamento(rng, n):
+    return [
+        {
+            "Ponto": f"P{i}",
+            "Lanca": float(rng.choice([22.6, 30.0, 37.5])),
+            "Raio": round(float(rng.uniform(4, 20)), 2),
+            "Carga": round(float(rng.uniform(1, 20)), 2),
+        }
+        for i in range(n)
+    ]
+
+
+def _estado_tabela(resposta, tabela=None):
+    tabela = dict(tabela or {})
+    for chave, (componente, propriedade) in {
+        "pagina": ("dados-iniciais-data-table", "data"),
+        "conjunto": ("dados-iniciais-conjunto", "data"),
+        "alteracoes": ("dados-iniciais-alteracoes", "data"),
+    }.items():
+        valor = resposta.get(componente, {}).get(propriedade)
+        if valor is not None or chave not in tabela:
+            tabela[chave] = valor
+    tabela["pagina"] = tabela["pagina"] or []
+    return tabela
+
+
+def _abrir_tabela(cliente, rng, linhas):
+    """
+    Tabela de pontos do usuário (modo servidor). Na primeira chamada cria o
+    conjunto e importa ``linhas`` pontos pelo upload, como o CSV de um
+    planejador; depois o mesmo conjunto é reaproveitado.
+    Retorna (chamadas feitas, estado da tabela).
+    """
+    if cliente.tabela is not None:
+        return [], cliente.tabela
+
+    pagina = {
+        "dados-iniciais-data-table.page_current": 0,
+        "dados-iniciais-data-table.page_size": 50,
+    }
+    resultados = [
+        cliente.chamar(
+            "dados-iniciais-conjunto.data",
+            pagina,
+            ["dados-iniciais-data-table.page_current"],
+        )
+    ]
+    tabela = _estado_tabela(resultados[-1][4])
+
+    if linhas:
+        csv = pd.DataFrame(_linhas_icamento(rng, linhas)).to_csv(index=False)
+        resultados.append(
+            cliente.chamar(
+                "dados-iniciais-conjunto.data",
+                {
+                    **pagina,
+                    "dados-iniciais-upload.contents": "data:text/csv;base64,"
+                    + base64.b64encode(csv.encode()).decode(),
+                    "dados-iniciais-upload.filename": "pontos.csv",
+                    "dados-iniciais-conjunto.data": tabela["conjunto"],
+                },
+                ["dados-iniciais-upload.contents"],
+            )
+        )
+        tabela = _estado_tabela(resultados[-1][4], tabela)
+
+    cliente.tabela = tabela
+    return resultados, tabela
+
+
+def _guardar_estado_grafico(cliente, resultado):
+    """Versão do mapa aplicada "no navegador", lida na próxima chamada."""
+    estado = resultado[4].get("estado-grafico-operacional", {})
+    if "data" in estado:
+        cliente.tabela = dict(cliente.tabela, grafico=estado["data"])
+
+
+def seq_editar_tabela(cliente, rng, linhas):
+    resultados, tabela = _abrir_tabela(cliente, rng, linhas)
+    yield from resultados
+
+    # edita uma linha da página visível; só ela volta do servidor
+    anteriores = tabela["pagina"]
+    editadas = [dict(r) for r in anteriores]
+    if editadas:
+        k = int(rng.integers(len(editadas)))
+        novo = _linhas_icamento(rng, 1)[0]
+        editadas[k].update(Raio=novo["Raio"], Carga=novo["Carga"])
+    resultado = cliente.chamar(
+        "dados-iniciais-alteracoes.data",
+        {
+            "dados-iniciais-data-table.page_current": 0,
+            "dados-iniciais-data-table.page_size": 50,
+            "dados-iniciais-data-table.data_timestamp": int(time.time() * 1000),
+            "dados-iniciais-data-table.data": editadas,
+            "dados-iniciais-data-table.data_previous": anteriores,
+            "dados-iniciais-conjunto.data": tabela["conjunto"],
+        },
+        ["dados-iniciais-data-table.data_timestamp"],
+    )
+    yield resultado
+    alteracoes = resultado[4].get("dados-iniciais-alteracoes", {}).get("data")
+    cliente.tabela = _estado_tabela(resultado[4], tabela)
+
+    valores = {
+        "meu-dropdown-valor.data": GUINDASTE,
+        "dados-iniciais-alteracoes.data": alteracoes or tabela["alteracoes"],
+        "estado-grafico-operacional.data": tabela.get("grafico"),
+    }
+    resultado = cliente.chamar(
+        "grafico-operacional.figure",
+        valores,
+        ["dados-iniciais-alteracoes.data"],
+    )
+    yield resultado
+    _guardar_estado_grafico(cliente, resultado)
+    yield cliente.chamar(
+        "dados-iniciais-output-feedback.children",
+        valores,
+        ["dados-iniciais-alteracoes.data"],
+    )
+
+
+def seq_trocar_guindaste(cliente, rng, linhas):
+    item = {"type": "meu-dropdown-opcao", "valor": GUINDASTE}
+    padrao = json.dumps(
+        {"type": "meu-dropdown-opcao", "valor": ["ALL"]}, separators=(",", ":")
+    )
+    resultado = cliente.chamar(
+        "meu-dropdown-output.children",
+        {
+            f"{padrao}.n_clicks": [
+                {"id": item, "property": "n_clicks", "value": 1}
+            ]
+        },
+        [f"{json.dumps(item, sort_keys=True, separators=(',', ':'))}.n_clicks"],
+    )
+    yield resultado
+    valor = resultado[4].get("meu-dropdown-valor", {}).get("data")
+    resultados, tabela = _abrir_tabela(cliente, rng, linhas)
+    yield from resultados
+    resultado = cliente.chamar(
+        "grafico-operacional.figure",
+        {
+            "meu-dropdown-valor.data": valor,
+            "dados-iniciais-alteracoes.data": tabela["alteracoes"],
+            "estado-grafico-operacional.data": tabela.get("grafico"),
+        },
+        ["meu-dropdown-valor.data"],
+    )
+    yield resultado
+    _guardar_estado_grafico(cliente, resultado)
+
+
+def seq_girar(cliente, rng, linhas, passos=5):
+    valores = _estado_patolas()
+    inicio = int(rng.integers(0, 360))
+    for k in range(passos):
+        valores["angulo-giro.value"] = (inicio + 10 * k) % 360
+        yield cliente.chamar("msg-validacao.children", valores, ["angulo-giro.value"])
+        yield cliente.chamar(
+            "grafico-vista-superior.figure", valores, ["angulo-giro.value"]
+        )
+
+
+def seq_calcular(cliente, rng, linhas):
+    valores = _estado_patolas()
+    valores["angulo-giro.value"] = int(rng.integers(0, 360))
+    valores["btn-calcular.n_clicks"] = 1
+    resultado = cliente.chamar(
+        "store-reacoes.data", valores, ["btn-calcular.n_clicks"]
+    )
+    yield resultado
+    valores["store-reacoes.data"] = resultado[4].get("store-reacoes", {}).get("data")
+    yield cliente.chamar(
+        "grafico-vista-superior.figure", valores, ["store-reacoes.data"]
+    )
+
+
+SEQUENCIAS = {
+    "editar_tabela": seq_editar_tabela,
+    "trocar_guindaste": seq_trocar_guindaste,
+    "girar": seq_girar,
+    "calcular": seq_calcular,
+}
+
+
+# =====================================================
+# EXECUÇÃO
+# =====================================================
+
+
+class Coletor:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencias = defaultdict(list)
+        self.erros = defaultdict(int)
+        self.bytes = defaultdict(int)
+
+    def registrar(self, chave, dt, ok, n_bytes):
+        with self._lock:
+            self.latencias[chave].append(dt)
+            self.bytes[chave] += n_bytes
+            if not ok:
+                self.erros[chave] += 1
+
+    def relatorio(self, duracao):
+        linhas = {}
+        for chave, tempos in sorted(self.latencias.items()):
+            t = np.asarray(tempos) * 1000
+            p50, p95, p99 = np.percentile(t, [50, 95, 99])
+            linhas[chave] = {
+                "chamadas": len(t),
+                "erros": self.erros[chave],
+                "p50_ms": p50,
+                "p95_ms": p95,
+                "p99_ms": p99,
+                "max_ms": float(t.max()),
+                "vazao_por_s": len(t) / duracao,
+                "bytes_medio": self.bytes[chave] / len(t),
+            }
+        return linhas
+
+
+def usuario(app, url, sequencias, linhas, ate, iteracoes, semente, coletor):
+    cliente = ClienteDash(app, url)
+    rng = np.random.default_rng(semente)
+    escolha = random.Random(semente)
+    n = 0
+    while time.perf_counter() < ate and (iteracoes is None or n < iteracoes):
+        nome = escolha.choice(sequencias)
+        for chave, dt, ok, n_bytes, _ in SEQUENCIAS[nome](cliente, rng, linhas):
+            coletor.registrar(chave, dt, ok, n_bytes)
+        n += 1
+
+
+def executar(
+    usuarios=4,
+    duracao=10.0,
+    iteracoes=None,
+    sequencias=None,
+    linhas=20,
+    url=None,
+    semente=0,
+):
+    """Roda o teste e devolve (relatório por callback, duração real em s)."""
+    import index
+
+    sequencias = sequencias or list(SEQUENCIAS)
+    coletor = Coletor()
+
+    t0 = time.perf_counter()
+    ate = t0 + duracao
+    with ThreadPoolExecutor(max_workers=usuarios) as pool:
+        futuros = [
+            pool.submit(
+                usuario,
+                index.app,
+                url,
+                sequencias,
+                linhas,
+                ate,
+                iteracoes,
+                semente + i,
+                coletor,
+            )
+            for i in range(usuarios)
+        ]
+        for f in futuros:
+            f.result()
+    total = time.perf_counter() - t0
+
+    return coletor.relatorio(total), total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Teste de carga dos callbacks")
+    parser.add_argument("--usuarios", type=int, default=4)
+    parser.add_argument("--duracao", type=float, default=10.0, help="segundos")
+    parser.add_argument("--iteracoes", type=int, help="sequências por usuário")
+    parser.add_argument(
+        "--sequencias",
+        default=",".join(SEQUENCIAS),
+        help="lista separada por vírgula",
+    )
+    parser.add_argument(
+        "--linhas", type=int, default=20, help="pontos importados na tabela de cada usuário"
+    )
+    parser.add_argument("--url", help="servidor alvo; padrão: test client")
+    parser.add_argument("--json", dest="saida", help="grava o relatório em JSON")
+    args = parser.parse_args(argv)
+
+    relatorio, total = executar(
+        usuarios=args.usuarios,
+        duracao=args.duracao,
+        iteracoes=args.iteracoes,
+        sequencias=args.sequencias.split(","),
+        linhas=args.linhas,
+        url=args.url,
+    )
+
+    print(
+        f"{'callback':<62} {'n':>6} {'err':>4} {'p50':>9} {'p95':>9} "
+        f"{'p99':>9} {'req/s':>8}"
+    )
+    for chave, r in relatorio.items():
+        print(
+            f"{chave[:62]:<62} {r['chamadas']:>6} {r['erros']:>4} "
+            f"{r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} "
+            f"{r['vazao_por_s']:>8.2f}"
+        )
+    n_total = sum(r["chamadas"] for r in relatorio.values())
+    print(f"\n{n_total} chamadas em {total:.1f} s ({n_total / total:.1f} req/s)")
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(
+                {"usuarios": args.usuarios, "duracao_s": total, "callbacks": relatorio},
+                f,
+                indent=2,
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,428 @@
+# benchmarks/run.py
+"""
+Benchmarks dos caminhos críticos do engine, do modelo e dos gráficos.
+
+Uso:
+    python -m benchmarks.run                         # roda tudo, imprime tabela
+    python -m benchmarks.run --json saida.json       # grava resultados
+    python -m benchmarks.run --baseline base.json    # compara e falha se regredir
+    python -m benchmarks.run -k interp --rapido      # filtra casos pelo nome
+
+O arquivo JSON gerado pode ser usado diretamente como baseline de uma
+rodada futura. Um caso é considerado regressão quando a mediana passa de
+``baseline * (1 + tolerancia)`` e melhoria quando fica abaixo de
+``baseline * (1 - tolerancia)``.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_PATH = os.path.join(BASE_DIR, "data", "guindaste_80TON.xlsx")
+
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+CASOS = []
+
+
+def caso(nome, **params):
+    """Registra uma função de preparação que devolve o callable medido."""
+
+    def decorador(preparar):
+        CASOS.append((nome, params, preparar))
+        return preparar
+
+    return decorador
+
+
+def _tabela_guindaste():
+    if not hasattr(_tabela_guindaste, "df"):
+        _tabela_guindaste.df = pd.read_excel(DATA_PATH)
+    return _tabela_guindaste.df
+
+
+def _entrada():
+    from tests.test_calc_reactions import criar_entrada_dummy
+
+    return criar_entrada_dummy()
+
+
+def _dados_tabelas():
+    from tests.dados import dados_tabelas_patolas
+
+    return dados_tabelas_patolas()
+
+
+# =====================================================
+# ENGINE
+# =====================================================
+
+
+@caso("engine.calc_reactions")
+def _calc_reactions():
+    from engine.calc_reactions import calc_reactions
+
+    entrada = _entrada()
+    return lambda: calc_reactions(entrada)
+
+
+for _n in (100, 1000):
+
+    @caso(f"engine.calc_reactions_loop[n={_n}]", n=_n)
+    def _calc_reactions_loop(n=_n):
+        from dataclasses import replace
+
+        from engine.calc_reactions import calc_reactions
+
+        base = _entrada()
+        entradas = [
+            replace(base, angulo_giro_deg=a) for a in np.linspace(0, 360, n)
+        ]
+
+        def rodar():
+            for e in entradas:
+                calc_reactions(e)
+
+        return rodar
+
+
+for _n in (1000, 100_000):
+
+    @caso(f"engine.calc_reactions_lote[n={_n}]", n=_n)
+    def _calc_reactions_lote(n=_n):
+        from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+
+        p = parametros_entrada(_entrada())
+        p["angulo_giro_deg"] = np.linspace(0, 360, n)
+        return lambda: calc_reactions_lote(**p)
+
+
+@caso("engine.monte_carlo[n=100000]", n=100_000)
+def _monte_carlo():
+    from engine.monte_carlo import Distribuicao, analise_monte_carlo
+
+    entrada = _entrada()
+    dist = {
+        "carga": Distribuicao.normal(7.8, 1.0),
+        "vento_i": Distribuicao.normal(0.0, 2e3),
+        "Xcm": Distribuicao.normal(0.0, 0.2),
+    }
+    return lambda: analise_monte_carlo(
+        entrada, dist, n_amostras=100_000, n_processos=1
+    )
+
+
+@caso("engine.dinamica[1000x3000]", cenarios=1000, passos=3000)
+def _dinamica():
+    from engine.dinamica import simular_dinamica
+
+    entrada = _entrada()
+    rng = np.random.default_rng(0)
+    cenarios = pd.DataFrame(
+        {
+            "giro_final": rng.uniform(30, 180, 1000),
+            "velocidade_giro": rng.uniform(1, 4, 1000),
+            "rajada": rng.uniform(0, 5e3, 1000),
+        }
+    )
+    return lambda: simular_dinamica(entrada, cenarios, duracao=30.0, dt=0.01)
+
+
+@caso("engine.otimizar_apoio[200x40]", contrapesos=200, areas=40)
+def _otimizar_apoio():
+    from engine.otimizador_apoio import otimizar_apoio
+
+    entrada = _entrada()
+    contrapesos = np.linspace(0, 50, 200)
+    areas = np.linspace(0.25, 10, 40)
+    return lambda: otimizar_apoio(
+        entrada, contrapesos, areas, pressao_admissivel=150e3, n_threads=1
+    )
+
+
+# =====================================================
+# MODELO
+# =====================================================
+
+
+@caso("engine.varredura[200x200]", pontos=40_000)
+def _varredura():
+    from engine.curva_carga import CurvaCarga
+    from engine.varredura import varrer
+
+    entrada = _entrada()
+    curva = CurvaCarga(_tabela_guindaste())
+    raios = np.linspace(2.0, 30.0, 200)
+    cargas = np.linspace(1.0, 30.0, 200)
+    return lambda: varrer(entrada, "raio", raios, "carga", cargas, curva=curva)
+
+
+@caso("modelo.construir_entrada+is_valid")
+def _construir_entrada():
+    from pages.calc_patolas import construir_entrada
+
+    dados = _dados_tabelas()
+    return lambda: construir_entrada(**dados).is_valid()
+
+
+# =====================================================
+# GRÁFICOS
+# =====================================================
+
+for _n in (60, 120, 240):
+
+    @caso(f"mapa.OperationalMapComponent[grid={_n}]", grid=_n)
+    def _mapa(n=_n):
+        from components.plotly_component import OperationalMapComponent
+
+        df = _tabela_guindaste()
+        return lambda: OperationalMapComponent(df, grid_points=n)
+
+
+for _n in (10**2, 10**3, 10**4, 10**5, 10**6):
+
+    @caso(f"mapa.interp[n={_n:.0e}]", n=_n)
+    def _interp(n=_n):
+        from components.plotly_component import OperationalMapComponent
+
+        mapa = OperationalMapComponent(_tabela_guindaste())
+        rng = np.random.default_rng(0)
+        x = rng.uniform(mapa.x_grid[0], mapa.x_grid[-1], n)
+        y = rng.uniform(mapa.y_grid[0], mapa.y_grid[-1], n)
+        return lambda: mapa.interp(x, y)
+
+
+@caso("figura.mapa_operacional")
+def _figura_mapa():
+    from components.plotly_component import OperationalMapComponent
+
+    mapa = OperationalMapComponent(_tabela_guindaste())
+    return mapa._build_figure
+
+
+@caso("figura.vista_superior")
+def _figura_superior():
+    from pages.calc_patolas import construir_entrada, plot_vista_superior
+
+    dados = _dados_tabelas()
+    entrada = construir_entrada(**dados)
+    reacoes = {"P1": 1.0, "P2": 1.0, "P3": -1.0, "P4": 1.0}
+    return lambda: plot_vista_superior(
+        pd.DataFrame(dados["pat"]),
+        entrada.centro_massa,
+        entrada.lanca,
+        entrada.angulo_giro_deg,
+        entrada.vento,
+        reacoes=reacoes,
+    )
+
+
+@caso("figura.tabela_carga_png")
+def _figura_tabela_carga():
+    import io
+
+    from relatorios.tabelas_carga import figura_tabela
+    from storage.catalogo import catalogo_padrao
+
+    catalogo = catalogo_padrao()
+    entrada = catalogo.entrada("guindaste_80TON")
+    malha = catalogo.malha(entrada.id)
+
+    def renderizar():
+        figura_tabela(entrada, malha).savefig(io.BytesIO(), format="png")
+
+    return renderizar
+
+
+@caso("figura.varredura[200x200]", pontos=40_000)
+def _figura_varredura():
+    from engine.varredura import varrer
+    from pages.calc_patolas import plot_varredura
+
+    raios = np.linspace(2.0, 30.0, 200)
+    cargas = np.linspace(1.0, 30.0, 200)
+    resultado = varrer(
+        _entrada(), "raio", raios, "carga", cargas, pressao_admissivel=250e3
+    )
+    return lambda: plot_varredura(resultado)
+
+
+def _conjunto_pontos(n):
+    from pages.home import tab1Columns
+    from storage.conjuntos import ConjuntoDados, novo_conjunto
+
+    rng = np.random.default_rng(1)
+    linhas = [
+        {
+            "Ponto": f"P{i}",
+            "Lanca": float(rng.choice([22.6, 30.0, 37.5])),
+            "Raio": float(rng.uniform(4, 20)),
+            "Carga": float(rng.uniform(1, 20)),
+        }
+        for i in range(n)
+    ]
+    conjunto = ConjuntoDados.de_colunas_tabela(tab1Columns, linhas)
+    return conjunto, novo_conjunto(conjunto)
+
+
+@caso("figura.update_graph[pontos=200]", pontos=200)
+def _update_graph():
+    from pages.home import update_graph
+
+    _, chave = _conjunto_pontos(200)
+    alteracoes = {"conjunto": chave, "completo": True}
+    return lambda: update_graph("guindaste_80TON", alteracoes)
+
+
+def _editar_um_ponto(n):
+    from pages.home import update_graph
+
+    conjunto, chave = _conjunto_pontos(n)
+    *_, estado = update_graph("guindaste_80TON", {"conjunto": chave, "completo": True})
+    aplicado = [estado]  # estado-grafico-operacional no navegador
+
+    def editar():
+        linha = conjunto.registros([n // 2])[0]
+        linha["Carga"] = (linha["Carga"] + 7.0) % 20.0
+        anterior = conjunto.versao
+        ids = conjunto.atualizar([linha])
+        *_, aplicado[0] = update_graph(
+            "guindaste_80TON",
+            {
+                "conjunto": chave,
+                "versao": conjunto.versao,
+                "versao_anterior": anterior,
+                "alteradas": conjunto.registros(ids),
+                "removidas": [],
+            },
+            aplicado[0],
+        )
+
+    return editar
+
+
+@caso("figura.update_graph_edicao[pontos=5]", pontos=5)
+def _update_graph_edicao_5():
+    return _editar_um_ponto(5)
+
+
+@caso("figura.update_graph_edicao[pontos=5000]", pontos=5000)
+def _update_graph_edicao_5000():
+    return _editar_um_ponto(5000)
+
+
+# =====================================================
+# EXECUÇÃO
+# =====================================================
+
+
+def medir(func, repeticoes, tempo_min):
+    """Mediana e mínimo do tempo por chamada, em segundos."""
+    func()  # aquecimento
+
+    # calibra o número de chamadas por repetição
+    numero = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(numero):
+            func()
+        dt = time.perf_counter() - t0
+        if dt >= tempo_min or numero >= 1_000_000:
+            break
+        numero *= 10 if dt < tempo_min / 10 else 2
+
+    tempos = [dt / numero]
+    for _ in range(repeticoes - 1):
+        t0 = time.perf_counter()
+        for _ in range(numero):
+            func()
+        tempos.append((time.perf_counter() - t0) / numero)
+
+    return {
+        "mediana_s": statistics.median(tempos),
+        "min_s": min(tempos),
+        "repeticoes": repeticoes,
+        "chamadas_por_repeticao": numero,
+    }
+
+
+def comparar(resultados, baseline, tolerancia):
+    """Retorna {nome: (razao, status)} com status 'regressao', 'melhoria' ou 'ok'."""
+    comparacao = {}
+    for nome, r in resultados.items():
+        base = baseline.get("resultados", {}).get(nome)
+        if base is None:
+            continue
+        razao = r["mediana_s"] / base["mediana_s"]
+        if razao > 1 + tolerancia:
+            status = "regressao"
+        elif razao < 1 - tolerancia:
+            status = "melhoria"
+        else:
+            status = "ok"
+        comparacao[nome] = (razao, status)
+    return comparacao
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", dest="filtro", help="roda só casos que contém o texto")
+    parser.add_argument("--json", dest="saida", help="grava resultados em JSON")
+    parser.add_argument("--baseline", help="JSON de uma rodada anterior")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    parser.add_argument("--rapido", action="store_true", help="menos repetições")
+    args = parser.parse_args(argv)
+
+    repeticoes, tempo_min = (3, 0.05) if args.rapido else (7, 0.2)
+
+    resultados = {}
+    for nome, params, preparar in CASOS:
+        if args.filtro and args.filtro not in nome:
+            continue
+        r = medir(preparar(), repeticoes, tempo_min)
+        r["parametros"] = params
+        resultados[nome] = r
+        print(f"{nome:<45} {r['mediana_s'] * 1e3:12.4f} ms", flush=True)
+
+    saida = {
+        "meta": {
+            "data": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "tolerancia": args.tolerancia,
+        },
+        "resultados": resultados,
+    }
+
+    codigo = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        comparacao = comparar(resultados, baseline, args.tolerancia)
+        print()
+        for nome, (razao, status) in comparacao.items():
+            print(f"{nome:<45} x{razao:7.3f}  {status}")
+            resultados[nome]["razao_baseline"] = razao
+            resultados[nome]["status"] = status
+        if any(s == "regressao" for _, s in comparacao.values()):
+            codigo = 1
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(saida, f, indent=2)
+
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
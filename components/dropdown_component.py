@@ -1,98 +1,140 @@
-import dash
-from dash import html
-from dash.dependencies import Input, Output
-import dash_bootstrap_components as dbc
-
-
-class DropdownButtonComponent:
-    """
-    Componente reutilizável de Dropdown Button (dbc.DropdownMenu)
-    com callback interno para atualizar o label do botão com a opção selecionada.
-    """
-
-    def __init__(self, app, id_base, options=None, label="Selecionar Opção"):
-        self.app = app
-        self.id_base = id_base
-        self.label = label
-
-        # IDs únicos
-        self.dropdown_id = f"{id_base}-dropdown"
-        self.output_id = f"{id_base}-output"
-        self.output_graph_id = f"{id_base}-output-graph"  # <<< NOVO
-
-        # Lista de opções
-        self.options = (
-            options if options is not None else ["Opção 1", "Opção 2", "Opção 3"]
-        )
-
-        # Registrar callbacks
-        self._register_callbacks()
-
-    def layout(self):
-        """Retorna o layout pronto para ser usado em Tabs ou Containers."""
-
-        menu_items = [
-            dbc.DropdownMenuItem(opt, id=f"{self.dropdown_id}-{i}")
-            for i, opt in enumerate(self.options)
-        ]
-
-        return html.Div(
-            [
-                html.H4(self.label, className="mb-3"),
-                dbc.DropdownMenu(
-                    # O label inicial será 'self.label' e será atualizado pelo callback
-                    label=self.label,
-                    children=menu_items,
-                    color="primary",
-                    className="mb-3",
-                    id=self.dropdown_id,
-                ),
-                # O output mostra o item selecionado
-                html.Div(id=self.output_id, className="text-info"),
-                # <<< Onde o gráfico será exibido
-                # html.Div(id=self.output_graph_id),
-            ]
-        )
-
-    def _register_callbacks(self):
-        """
-        Registra callbacks automaticamente para todos os itens do dropdown.
-        Atualiza tanto o rótulo do botão quanto o Div de saída.
-        """
-
-        # Inputs dinâmicos dos itens (usamos n_clicks como gatilho)
-        inputs = [
-            Input(f"{self.dropdown_id}-{i}", "n_clicks")
-            for i in range(len(self.options))
-        ]
-
-        @self.app.callback(
-            [
-                Output(self.dropdown_id, "label"),  # 1. Atualiza o rótulo do botão
-                Output(self.output_id, "children"),
-            ],  # 2. Atualiza o Div de saída
-            inputs,
-        )
-        def update_output(*clicks):
-            ctx = dash.callback_context
-
-            # Se não houver clique, retorna o estado inicial (ou a última seleção)
-            if not ctx.triggered:
-                # Retorna o label inicial e nada no output
-                return self.label, ""
-
-            # Pega o ID do componente que disparou o callback
-            triggered_id = ctx.triggered[0]["prop_id"].split(".")[0]
-
-            # Percorre as opções para encontrar a correspondência
-            for i, opt in enumerate(self.options):
-                expected_id = f"{self.dropdown_id}-{i}"
-
-                # Verifica se o ID disparado corresponde ao ID esperado
-                if triggered_id == expected_id:
-                    new_label = opt
-                    feedback = f"Selecionado: {opt}"
-                    return new_label, feedback
-
-            # Fallback (caso o item clicado não seja encontrado, o que é improvável)
-            return self.label, "Erro ao identificar seleção."
+import hashlib
+
+import dash
+from dash import dcc, html
+from dash.dependencies import ALL, Input, Output, State
+import dash_bootstrap_components as dbc
+
+
+def _assinatura(opcoes):
+    """Resumo curto da lista de opções, para saber se o menu mudou."""
+    return hashlib.sha1(repr(opcoes).encode()).hexdigest()[:16]
+
+
+class DropdownButtonComponent:
+    """
+    Componente reutilizável de Dropdown Button (dbc.DropdownMenu)
+    com callback interno para atualizar o label do botão com a opção selecionada.
+
+    options: lista de rótulos, lista de (valor, rótulo) ou uma função que
+    devolve essa lista. Com função, a lista é reconsultada a cada
+    ``atualizar_a_cada`` segundos e o menu só é reenviado quando muda.
+    O valor da opção escolhida fica em ``valor_id`` (dcc.Store).
+    """
+
+    def __init__(
+        self, app, id_base, options=None, label="Selecionar Opção", atualizar_a_cada=10
+    ):
+        self.app = app
+        self.id_base = id_base
+        self.label = label
+        self.atualizar_a_cada = atualizar_a_cada
+
+        # IDs únicos
+        self.dropdown_id = f"{id_base}-dropdown"
+        self.output_id = f"{id_base}-output"
+        self.output_graph_id = f"{id_base}-output-graph"  # <<< NOVO
+        self.valor_id = f"{id_base}-valor"
+        self.opcao_tipo = f"{id_base}-opcao"  # id dos itens: {"type", "valor"}
+        self.intervalo_id = f"{id_base}-intervalo"
+        self.assinatura_id = f"{id_base}-assinatura"
+
+        # Lista de opções
+        self.options = (
+            options if options is not None else ["Opção 1", "Opção 2", "Opção 3"]
+        )
+
+        # Registrar callbacks
+        self._register_callbacks()
+
+    @property
+    def dinamico(self):
+        return callable(self.options)
+
+    def opcoes(self):
+        """[(valor, rótulo)] atuais."""
+        opcoes = self.options() if self.dinamico else self.options
+        return [
+            tuple(opt) if isinstance(opt, (list, tuple)) else (opt, opt)
+            for opt in opcoes
+        ]
+
+    def _itens(self, opcoes):
+        return [
+            dbc.DropdownMenuItem(rotulo, id={"type": self.opcao_tipo, "valor": valor})
+            for valor, rotulo in opcoes
+        ]
+
+    def layout(self):
+        """Retorna o layout pronto para ser usado em Tabs ou Containers."""
+
+        opcoes = self.opcoes()
+        children = [
+            html.H4(self.label, className="mb-3"),
+            dbc.DropdownMenu(
+                # O label inicial será 'self.label' e será atualizado pelo callback
+                label=self.label,
+                children=self._itens(opcoes),
+                color="primary",
+                className="mb-3",
+                id=self.dropdown_id,
+            ),
+            # O output mostra o item selecionado
+            html.Div(id=self.output_id, className="text-info"),
+            dcc.Store(id=self.valor_id),
+            # <<< Onde o gráfico será exibido
+            # html.Div(id=self.output_graph_id),
+        ]
+        if self.dinamico:
+            children += [
+                dcc.Interval(
+                    id=self.intervalo_id, interval=self.atualizar_a_cada * 1000
+                ),
+                dcc.Store(id=self.assinatura_id, data=_assinatura(opcoes)),
+            ]
+        return html.Div(children)
+
+    def _register_callbacks(self):
+        """
+        Registra callbacks automaticamente para todos os itens do dropdown.
+        Atualiza o rótulo do botão, o Div de saída e o valor selecionado.
+        """
+
+        @self.app.callback(
+            [
+                Output(self.dropdown_id, "label"),  # 1. Atualiza o rótulo do botão
+                Output(self.output_id, "children"),  # 2. Atualiza o Div de saída
+                Output(self.valor_id, "data"),  # 3. Valor da opção
+            ],
+            Input({"type": self.opcao_tipo, "valor": ALL}, "n_clicks"),
+            prevent_initial_call=True,
+        )
+        def update_output(clicks):
+            ctx = dash.callback_context
+
+            # Itens recriados (menu atualizado) chegam sem clique
+            if not ctx.triggered or not ctx.triggered[0]["value"]:
+                return dash.no_update, dash.no_update, dash.no_update
+
+            valor = ctx.triggered_id["valor"]
+            rotulos = dict(self.opcoes())
+            if valor not in rotulos:
+                return self.label, "Opção não está mais disponível.", None
+
+            rotulo = rotulos[valor]
+            return rotulo, f"Selecionado: {rotulo}", valor
+
+        if self.dinamico:
+
+            @self.app.callback(
+                Output(self.dropdown_id, "children"),
+                Output(self.assinatura_id, "data"),
+                Input(self.intervalo_id, "n_intervals"),
+                State(self.assinatura_id, "data"),
+                prevent_initial_call=True,
+            )
+            def atualizar_opcoes(_, assinatura):
+                opcoes = self.opcoes()
+                if _assinatura(opcoes) == assinatura:
+                    return dash.no_update, dash.no_update
+                return self._itens(opcoes), _assinatura(opcoes)
@@ -1,65 +1,66 @@
 import numpy as np
 import plotly.graph_objects as go
-from scipy.spatial import Delaunay
-from scipy.interpolate import LinearNDInterpolator
 from dash import html
 
+from engine.curva_carga import CurvaCarga
+from monitoring.tracing import span
+
 
 class OperationalMapComponent:
 
-    def __init__(self, df, title="Mapa Operacional", title_color=None, grid_step=2):
+    def __init__(
+        self,
+        df,
+        title="Mapa Operacional",
+        title_color=None,
+        grid_step=2,
+        grid_points=120,
+        malha=None,
+    ):
         """
         df: DataFrame contendo colunas obrigatórias:
             - Raio
             - Lanca
             - Carga
+        grid_points: número de pontos por eixo da malha interpolada
+        malha: MalhaCarga já calculada (ex.: Catalogo.malha), senão é calculada
         """
 
         self.df = df
         self.title = title
         self.title_color = title_color
         self.grid_step = grid_step
+        self.grid_points = grid_points
+        self.malha = malha
 
         # Chamadas internas
         self._process_data()
-        self.fig = self._build_figure()
+        with span("mapa.construir_figura"):
+            self.fig = self._build_figure()
 
     # =============================================================
     # ------------ 1) PROCESSAMENTO COMPLETO DOS DADOS -------------
     # =============================================================
     def _process_data(self):
 
-        db = self.df
-        x = db.Raio.values
-        z = db.Lanca.values
-
-        # Altura Y calculada fisicamente
-        y = np.sin(np.arccos(x / z)) * z
-        w = db.Carga.values
-
-        self.pts = np.column_stack((x, y))
-
-        # Malha automática
-        self.x_grid = np.linspace(np.min(x) * 1.02, np.max(x) * 0.98, 120)
-        self.y_grid = np.linspace(np.min(y) * 1.02, np.max(y) * 0.98, 120)
-
-        X, Y = np.meshgrid(self.x_grid, self.y_grid)
-        self.X, self.Y = X, Y
+        # Tabela de carga: altura física, triangulação e interpolador
+        with span("mapa.triangulacao"):
+            self.curva = CurvaCarga(self.df)
 
-        # Convex hull mask
-        tri = Delaunay(self.pts)
-        mask_flat = tri.find_simplex(np.column_stack((X.flatten(), Y.flatten()))) >= 0
-        self.mask = mask_flat.reshape(X.shape)
+        self.pts = self.curva.pts
 
-        # Interpolação
-        interp = LinearNDInterpolator(self.pts, w)
-        W = interp(X, Y)
-        self.interp = interp
-        self.W = np.where(self.mask, W, np.nan)
+        # Malha automática (mesma das imagens da tabela de carga)
+        if self.malha is None:
+            with span("mapa.interpolacao_malha", pontos=self.grid_points**2):
+                self.malha = self.curva.malha(self.grid_points)
+        self.x_grid, self.y_grid = self.malha.x, self.malha.y
+        self.X, self.Y = np.meshgrid(self.x_grid, self.y_grid)
+        self.interp = self.curva.interp
 
-        # Linhas de lança
-        Z = np.sqrt(X**2 + Y**2)
-        self.Z = np.where(self.mask, Z, np.nan)
+        # Carga interpolada e linhas de lança, NaN fora da envoltória
+        self.mask = ~np.isnan(self.malha.lanca)
+        self.W = self.malha.carga
+        self.Z = self.malha.lanca
 
     # =============================================================
     # ------------ 2) GERA A FIGURA PLOTLY COMPLETA ---------------
@@ -1,164 +1,420 @@
-import dash
-from dash import dash_table, html
-from dash.dependencies import Input, Output, State
-import dash_bootstrap_components as dbc
-
-
-class TabelaDadosComponent:
-    """
-    Componente reutilizável de DataTable com:
-    - título customizável
-    - opção de permitir ou não adicionar linhas
-    - opção de permitir ou não deletar linhas
-    """
-
-    def __init__(
-        self,
-        app,
-        id_base,
-        columns=None,
-        initial_data=None,
-        title_color="text-dark",
-        allow_add_rows=True,
-        row_deletable=True,
-    ):
-        self.app = app
-        self.id_base = id_base
-        self.title_color = title_color
-
-        self.allow_add_rows = allow_add_rows
-        self.row_deletable = row_deletable
-
-        # IDs
-        self.table_id = f"{id_base}-data-table"
-        self.add_row_button_id = f"{id_base}-add-row-btn"
-        self.output_feedback_id = f"{id_base}-output-feedback"
-
-        # Colunas e dados
-        if columns is None:
-            self.columns = [
-                {"name": "Produto", "id": "Produto", "editable": True},
-                {
-                    "name": "Quantidade",
-                    "id": "Quantidade",
-                    "editable": True,
-                    "type": "numeric",
-                },
-                {
-                    "name": "Valor Unitário",
-                    "id": "Valor_Unitario",
-                    "editable": True,
-                    "type": "numeric",
-                },
-            ]
-            self.initial_data = [
-                {"Produto": "Exemplo", "Quantidade": 10, "Valor_Unitario": 5.5}
-            ]
-        else:
-            self.columns = columns
-            self.initial_data = initial_data if initial_data is not None else []
-
-        self._register_callbacks()
-
-    # ======================================================
-    # Layout
-    # ======================================================
-    def layout(self):
-
-        children = [
-            html.H4(
-                f"Tabela: {self.id_base.capitalize()}",
-                className=(
-                    f"mb-3 text-{self.title_color}"
-                    if not self.title_color.startswith("#")
-                    else "mb-3"
-                ),
-                style=(
-                    {"color": self.title_color}
-                    if self.title_color.startswith("#")
-                    else {}
-                ),
-            ),
-            dash_table.DataTable(
-                id=self.table_id,
-                columns=self.columns,
-                data=self.initial_data,
-                editable=True,
-                row_deletable=self.row_deletable,
-                style_table={"overflowX": "auto", "width": "100%"},
-                style_cell={
-                    "minWidth": "120px",
-                    "width": "120px",
-                    "maxWidth": "120px",
-                    "textAlign": "center",
-                    "overflow": "hidden",
-                    "textOverflow": "ellipsis",
-                },
-                style_header={
-                    "backgroundColor": "#2a4260",
-                    "color": "white",
-                    "fontWeight": "bold",
-                },
-                style_data_conditional=[
-                    {
-                        "if": {"row_index": "odd"},
-                        "backgroundColor": "rgb(248, 248, 248)",
-                    }
-                ],
-                export_format="csv",
-            ),
-        ]
-
-        # Botão adicionar linha (condicional)
-        if self.allow_add_rows:
-            children.append(
-                dbc.Button(
-                    "Adicionar Linha",
-                    id=self.add_row_button_id,
-                    color="primary",
-                    className="mt-3",
-                )
-            )
-
-        children.append(
-            html.Div(id=self.output_feedback_id, className="mt-3 text-success")
-        )
-
-        return dbc.Tab(
-            html.Div(children),
-            label=self.id_base.capitalize(),
-            tab_id=self.id_base,
-        )
-
-    # ======================================================
-    # Callbacks
-    # ======================================================
-    def _register_callbacks(self):
-
-        # Adicionar linha somente se permitido
-        if self.allow_add_rows:
-
-            @self.app.callback(
-                Output(self.table_id, "data"),
-                Input(self.add_row_button_id, "n_clicks"),
-                State(self.table_id, "data"),
-                State(self.table_id, "columns"),
-                prevent_initial_call=True,
-            )
-            def add_row(n_clicks, rows, columns):
-                if rows is None:
-                    rows = []
-
-                rows.append({c["id"]: None for c in columns})
-                return rows
-
-        # Feedback
-        @self.app.callback(
-            Output(self.output_feedback_id, "children"),
-            Input(self.table_id, "data_timestamp"),
-            State(self.table_id, "data"),
-        )
-        def display_data_status(timestamp, data):
-            if timestamp is not None and data is not None:
-                return f"Dados atualizados. Total de {len(data)} registros."
-            return ""
+import dash
+from dash import dash_table, dcc, html
+from dash.dependencies import Input, Output, State
+import dash_bootstrap_components as dbc
+
+from storage.conjuntos import (
+    ConjuntoDados,
+    novo_conjunto,
+    obter_conjunto,
+    salvar_conjunto,
+)
+from storage.importacao import (
+    importar_para_conjunto,
+    ler_progresso,
+    progresso_no_armazem,
+)
+
+
+def barra_progresso(handle):
+    """(value, label, style) de um dbc.Progress a partir do progresso gravado."""
+    estado = ler_progresso(handle)
+    if estado is None:
+        return 0, "", {"display": "none"}
+    fracao, mensagem = estado
+    return round(100 * fracao), mensagem, {}
+
+
+class TabelaDadosComponent:
+    """
+    Componente reutilizável de DataTable com:
+    - título customizável
+    - opção de permitir ou não adicionar linhas
+    - opção de permitir ou não deletar linhas
+    - modo servidor (modo_servidor=True) para tabelas grandes: as linhas
+      ficam em um ConjuntoDados no servidor, paginação/ordenação/filtro são
+      feitos lá e só a página visível vai ao navegador. Callbacks que
+      dependem da tabela escutam ``alteracoes_id``, que recebe só as
+      linhas modificadas:
+          {"conjunto", "versao", "versao_anterior", "total", "completo",
+           "alteradas", "removidas"}
+      com completo=True (conjunto novo ou importação) quem depende da
+      tabela deve reler o conjunto inteiro; expirado=True indica que o
+      conjunto foi despejado no servidor e recriado com a página visível
+    - importação de CSV/XLSX (importavel=True, só no modo servidor): o
+      arquivo é lido em blocos direto para o conjunto, com barra de
+      progresso; ``validar_importacao(df)`` pode rejeitar linhas
+    """
+
+    def __init__(
+        self,
+        app,
+        id_base,
+        columns=None,
+        initial_data=None,
+        title_color="text-dark",
+        allow_add_rows=True,
+        row_deletable=True,
+        modo_servidor=False,
+        page_size=50,
+        importavel=False,
+        validar_importacao=None,
+    ):
+        self.app = app
+        self.id_base = id_base
+        self.title_color = title_color
+
+        self.allow_add_rows = allow_add_rows
+        self.row_deletable = row_deletable
+        self.modo_servidor = modo_servidor
+        self.page_size = page_size
+        self.importavel = importavel
+        self.validar_importacao = validar_importacao
+        if importavel and not modo_servidor:
+            raise ValueError("importavel=True requer modo_servidor=True")
+
+        # IDs
+        self.table_id = f"{id_base}-data-table"
+        self.add_row_button_id = f"{id_base}-add-row-btn"
+        self.output_feedback_id = f"{id_base}-output-feedback"
+        self.conjunto_id = f"{id_base}-conjunto"
+        self.alteracoes_id = f"{id_base}-alteracoes"
+        self.upload_id = f"{id_base}-upload"
+        self.progresso_id = f"{id_base}-progresso"
+        self.intervalo_id = f"{id_base}-intervalo-importacao"
+
+        # Colunas e dados
+        if columns is None:
+            self.columns = [
+                {"name": "Produto", "id": "Produto", "editable": True},
+                {
+                    "name": "Quantidade",
+                    "id": "Quantidade",
+                    "editable": True,
+                    "type": "numeric",
+                },
+                {
+                    "name": "Valor Unitário",
+                    "id": "Valor_Unitario",
+                    "editable": True,
+                    "type": "numeric",
+                },
+            ]
+            self.initial_data = [
+                {"Produto": "Exemplo", "Quantidade": 10, "Valor_Unitario": 5.5}
+            ]
+        else:
+            self.columns = columns
+            self.initial_data = initial_data if initial_data is not None else []
+
+        self._register_callbacks()
+
+    # ======================================================
+    # Layout
+    # ======================================================
+    def _opcoes_tabela(self):
+        if not self.modo_servidor:
+            return {"data": self.initial_data}
+        # página preenchida pelo callback de paginação
+        return {
+            "data": [],
+            "page_action": "custom",
+            "page_current": 0,
+            "page_size": self.page_size,
+            "page_count": 1,
+            "sort_action": "custom",
+            "sort_mode": "multi",
+            "sort_by": [],
+            "filter_action": "custom",
+            "filter_query": "",
+        }
+
+    def layout(self):
+
+        children = [
+            html.H4(
+                f"Tabela: {self.id_base.capitalize()}",
+                className=(
+                    f"mb-3 text-{self.title_color}"
+                    if not self.title_color.startswith("#")
+                    else "mb-3"
+                ),
+                style=(
+                    {"color": self.title_color}
+                    if self.title_color.startswith("#")
+                    else {}
+                ),
+            ),
+            dash_table.DataTable(
+                id=self.table_id,
+                columns=self.columns,
+                editable=True,
+                row_deletable=self.row_deletable,
+                style_table={"overflowX": "auto", "width": "100%"},
+                style_cell={
+                    "minWidth": "120px",
+                    "width": "120px",
+                    "maxWidth": "120px",
+                    "textAlign": "center",
+                    "overflow": "hidden",
+                    "textOverflow": "ellipsis",
+                },
+                style_header={
+                    "backgroundColor": "#2a4260",
+                    "color": "white",
+                    "fontWeight": "bold",
+                },
+                style_data_conditional=[
+                    {
+                        "if": {"row_index": "odd"},
+                        "backgroundColor": "rgb(248, 248, 248)",
+                    }
+                ],
+                export_format="csv",
+                **self._opcoes_tabela(),
+            ),
+        ]
+
+        if self.modo_servidor:
+            children += [
+                dcc.Store(id=self.conjunto_id),
+                dcc.Store(id=self.alteracoes_id),
+            ]
+
+        if self.importavel:
+            children += [
+                dcc.Upload(
+                    html.Div(["Importar CSV/XLSX: arraste ou ", html.A("selecione")]),
+                    id=self.upload_id,
+                    accept=".csv,.txt,.xlsx,.xlsm",
+                    className="mt-3 p-2 text-center border border-secondary rounded",
+                    style={"borderStyle": "dashed"},
+                ),
+                dbc.Progress(
+                    id=self.progresso_id,
+                    value=0,
+                    className="mt-2",
+                    style={"display": "none"},
+                ),
+                dcc.Interval(id=self.intervalo_id, interval=500, disabled=True),
+            ]
+
+        # Botão adicionar linha (condicional)
+        if self.allow_add_rows:
+            children.append(
+                dbc.Button(
+                    "Adicionar Linha",
+                    id=self.add_row_button_id,
+                    color="primary",
+                    className="mt-3",
+                )
+            )
+
+        children.append(
+            html.Div(id=self.output_feedback_id, className="mt-3 text-success")
+        )
+
+        return dbc.Tab(
+            html.Div(children),
+            label=self.id_base.capitalize(),
+            tab_id=self.id_base,
+        )
+
+    # ======================================================
+    # Callbacks
+    # ======================================================
+    def _register_callbacks(self):
+
+        if self.modo_servidor:
+            self._register_callbacks_servidor()
+            return
+
+        # Adicionar linha somente se permitido
+        if self.allow_add_rows:
+
+            @self.app.callback(
+                Output(self.table_id, "data"),
+                Input(self.add_row_button_id, "n_clicks"),
+                State(self.table_id, "data"),
+                State(self.table_id, "columns"),
+                prevent_initial_call=True,
+            )
+            def add_row(n_clicks, rows, columns):
+                if rows is None:
+                    rows = []
+
+                rows.append({c["id"]: None for c in columns})
+                return rows
+
+        # Feedback
+        @self.app.callback(
+            Output(self.output_feedback_id, "children"),
+            Input(self.table_id, "data_timestamp"),
+            State(self.table_id, "data"),
+        )
+        def display_data_status(timestamp, data):
+            if timestamp is not None and data is not None:
+                return f"Dados atualizados. Total de {len(data)} registros."
+            return ""
+
+    def _chave_progresso(self, chave):
+        return f"imp{chave}"
+
+    def _register_callbacks_servidor(self):
+
+        inputs = dict(
+            pagina=Input(self.table_id, "page_current"),
+            tamanho=Input(self.table_id, "page_size"),
+            ordenacao=Input(self.table_id, "sort_by"),
+            filtro=Input(self.table_id, "filter_query"),
+            _editado=Input(self.table_id, "data_timestamp"),
+        )
+        state = dict(
+            linhas=State(self.table_id, "data"),
+            anteriores=State(self.table_id, "data_previous"),
+            chave=State(self.conjunto_id, "data"),
+        )
+        output = [
+            Output(self.table_id, "data"),
+            Output(self.table_id, "page_count"),
+            Output(self.table_id, "page_current"),
+            Output(self.conjunto_id, "data"),
+            Output(self.alteracoes_id, "data"),
+        ]
+        extras = {}
+        if self.allow_add_rows:
+            inputs["_adicionar"] = Input(self.add_row_button_id, "n_clicks")
+        if self.importavel:
+            inputs["arquivo"] = Input(self.upload_id, "contents")
+            state["nome_arquivo"] = State(self.upload_id, "filename")
+            # limpa o upload para permitir reenviar o mesmo arquivo
+            output.append(Output(self.upload_id, "contents"))
+            extras["running"] = [(Output(self.intervalo_id, "disabled"), False, True)]
+
+        @self.app.callback(output=output, inputs=inputs, state=state, **extras)
+        def paginar(
+            pagina,
+            tamanho,
+            ordenacao,
+            filtro,
+            linhas,
+            anteriores,
+            chave,
+            arquivo=None,
+            nome_arquivo=None,
+            **_,
+        ):
+            disparado = {t["prop_id"] for t in dash.callback_context.triggered}
+
+            conjunto = obter_conjunto(chave)
+            completo = conjunto is None
+            expirado = completo and chave is not None
+            if completo:
+                # primeira carga: dados iniciais. Conjunto expirado no
+                # servidor: só resta a página que o navegador mostra, já com
+                # a edição que disparou o callback; o usuário é avisado
+                registros = self.initial_data
+                if expirado:
+                    registros = [
+                        {c: v for c, v in r.items() if c != "id"}
+                        for r in linhas or []
+                    ]
+                conjunto = ConjuntoDados.de_colunas_tabela(self.columns, registros)
+                chave = novo_conjunto(conjunto)
+
+            versao_anterior = None if completo else conjunto.versao
+            alteradas, removidas = [], []
+            importacao = None
+            if f"{self.table_id}.data_timestamp" in disparado and not completo:
+                ids = {r.get("id") for r in linhas or []}
+                removidas = conjunto.remover(
+                    r["id"] for r in anteriores or [] if r.get("id") not in ids
+                )
+                alteradas = conjunto.atualizar(linhas or [])
+            if f"{self.add_row_button_id}.n_clicks" in disparado:
+                alteradas += conjunto.adicionar([{}])
+                pagina = len(conjunto)  # última página, onde a linha nova aparece
+            if f"{self.upload_id}.contents" in disparado and arquivo:
+                importacao = self._importar(arquivo, nome_arquivo, conjunto, chave)
+                # muitas linhas novas: quem depende da tabela relê o conjunto
+                completo = completo or bool(importacao.get("ids"))
+
+            if alteradas or removidas or importacao:
+                salvar_conjunto(chave, conjunto)
+
+            dados, n_paginas = conjunto.pagina(
+                pagina, tamanho or self.page_size, ordenacao, filtro
+            )
+            pagina = min(pagina or 0, n_paginas - 1)
+
+            if completo or alteradas or removidas or importacao:
+                alteracoes = {
+                    "conjunto": chave,
+                    "versao": conjunto.versao,
+                    "versao_anterior": versao_anterior,
+                    "total": len(conjunto),
+                    "completo": completo,
+                    "alteradas": [] if completo else conjunto.registros(alteradas),
+                    "removidas": removidas,
+                }
+                if importacao:
+                    alteracoes["importacao"] = importacao["resumo"]
+                if expirado:
+                    alteracoes["expirado"] = True
+            else:
+                alteracoes = dash.no_update
+
+            saida = [dados, n_paginas, pagina, chave, alteracoes]
+            if self.importavel:
+                saida.append(None if importacao else dash.no_update)
+            return saida
+
+        @self.app.callback(
+            Output(self.output_feedback_id, "children"),
+            Input(self.alteracoes_id, "data"),
+        )
+        def display_data_status(alteracoes):
+            if not alteracoes:
+                return ""
+            texto = f"Dados atualizados. Total de {alteracoes['total']} registros."
+            if alteracoes.get("importacao"):
+                texto += f" Importação: {alteracoes['importacao']}."
+            if alteracoes.get("expirado"):
+                return html.Span(
+                    "Os dados da tabela expiraram no servidor; só as linhas "
+                    f"visíveis foram mantidas ({alteracoes['total']} registros). "
+                    "Reimporte o arquivo para recuperar as demais.",
+                    className="text-warning",
+                )
+            return texto
+
+        if self.importavel:
+
+            @self.app.callback(
+                Output(self.progresso_id, "value"),
+                Output(self.progresso_id, "label"),
+                Output(self.progresso_id, "style"),
+                Input(self.intervalo_id, "n_intervals"),
+                Input(self.alteracoes_id, "data"),
+                State(self.conjunto_id, "data"),
+                prevent_initial_call=True,
+            )
+            def mostrar_progresso(_, alteracoes, chave):
+                return barra_progresso(self._chave_progresso(chave))
+
+    def _importar(self, arquivo, nome_arquivo, conjunto, chave):
+        """Importa o upload para o conjunto; erros de formato viram mensagem."""
+        progresso = progresso_no_armazem(self._chave_progresso(chave))
+        try:
+            resultado = importar_para_conjunto(
+                arquivo,
+                nome_arquivo,
+                conjunto,
+                self.columns,
+                validar=self.validar_importacao,
+                progresso=progresso,
+            )
+        except ValueError as e:
+            progresso(0.0, str(e))
+            return {"ids": [], "resumo": str(e)}
+        return {"ids": resultado.ids, "resumo": resultado.resumo()}
@@ -1,3 +1,4 @@
+# Versão sem tela e para todo o catálogo: python -m relatorios.tabelas_carga
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -1,7 +1,10 @@
 import pandas as pd
 import numpy as np
 
+from monitoring.tracing import rastreado
 
+
+@rastreado()
 def calc_reactions(entrada):
 
     gravity = 9.8
@@ -107,3 +110,186 @@ def calc_reactions(entrada):
     X, residuals, rank, s = np.linalg.lstsq(A, B, rcond=None)
 
     return X, residuals, rank, s
+
+
+# =====================================================
+# SOLUÇÃO VETORIZADA (LOTE)
+# =====================================================
+
+GRAVIDADE = 9.8
+
+# Ordem das incógnitas em X: [Hx, Hy, R1, R2, R3, R4]
+PATOLAS = ["P1", "P2", "P3", "P4"]
+
+
+def parametros_entrada(entrada):
+    """
+    Extrai de uma EntradaGuindaste os argumentos de calc_reactions_lote.
+    Útil para variar só alguns parâmetros:
+
+        p = parametros_entrada(entrada)
+        p["angulo_giro_deg"] = np.arange(360)
+        X = calc_reactions_lote(**p)
+    """
+    return dict(
+        patolas=entrada.patolas[["X", "Y", "Z"]].to_numpy(dtype=float)[:4],
+        centro_massa=entrada.centro_massa[["Xcm", "Ycm", "Zcm"]].to_numpy(dtype=float),
+        raio=float(entrada.lanca["Raio"]),
+        lanca=float(entrada.lanca["Lanca"]),
+        angulo_giro_deg=float(entrada.angulo_giro_deg),
+        carga=float(entrada.cargas["Carga"].sum()),
+        contrapeso=float(entrada.contrapeso),
+        peso_guindaste=float(entrada.peso_guindaste),
+        vento_i=float(entrada.vento["Vi"]),
+        vento_j=float(entrada.vento["Vj"]),
+    )
+
+
+def matriz_sistema(r):
+    """
+    Matriz A de calc_reactions para vetores patola - centro de massa.
+    r: (..., 4, 3) -> A: (..., 7, 6)
+    """
+    r = np.asarray(r, dtype=float)
+    ri, rj, rk = r[..., 0], r[..., 1], r[..., 2]
+    r1_i, r2_i, r3_i, r4_i = np.moveaxis(ri, -1, 0)
+    r1_j, r2_j, r3_j, r4_j = np.moveaxis(rj, -1, 0)
+    r1_k = rk[..., 0]
+
+    m23 = (r2_i - r3_i) * r4_j + (r3_j - r2_j) * r4_i - r2_i * r3_j + r2_j * r3_i
+    m31 = (r3_i - r1_i) * r4_j + (r1_j - r3_j) * r4_i + r1_i * r3_j - r1_j * r3_i
+    m12 = (r1_i - r2_i) * r4_j + (r2_j - r1_j) * r4_i - r1_i * r2_j + r1_j * r2_i
+    m21 = (r2_i - r1_i) * r3_j + (r1_j - r2_j) * r3_i + r1_i * r2_j - r1_j * r2_i
+
+    A = np.zeros(r.shape[:-2] + (7, 6))
+    A[..., 0, 1] = -r1_k
+    A[..., 0, 2:] = rj
+    A[..., 1, 0] = r1_k
+    A[..., 1, 2:] = -ri
+    A[..., 2, 0] = -r1_j
+    A[..., 2, 1] = r1_i
+    A[..., 3, 0] = 1.0
+    A[..., 4, 1] = 1.0
+    A[..., 5, 2:] = 1.0
+    A[..., 6, 2:] = np.stack([m23, m31, m12, m21], axis=-1)
+    return A
+
+
+def ponta_lanca(raio, lanca, angulo_giro_deg):
+    """Vetor R5 da ponta da lança em relação ao centro de giro: (...,) -> (..., 3)"""
+    theta = np.radians(angulo_giro_deg)
+    raio = np.asarray(raio, dtype=float)
+    r5_k = np.sqrt(np.asarray(lanca, dtype=float) ** 2 - raio**2)
+    return np.stack(
+        np.broadcast_arrays(raio * np.cos(theta), raio * np.sin(theta), r5_k), axis=-1
+    )
+
+
+def vetor_cargas(
+    raio,
+    lanca,
+    angulo_giro_deg,
+    carga,
+    contrapeso,
+    peso_guindaste,
+    vento_i,
+    vento_j,
+    fator_vento=1.0,
+):
+    """
+    Vetor B de calc_reactions, com broadcasting: (...,) -> (..., 7)
+
+    fator_vento: posição da resultante do vento ao longo da lança, como
+    fração de R5 (1 = na ponta, como em calc_reactions).
+    """
+    r5_i, r5_j, r5_k = np.moveaxis(ponta_lanca(raio, lanca, angulo_giro_deg), -1, 0)
+    f = np.asarray(fator_vento, dtype=float)
+
+    wl_k = np.asarray(carga, dtype=float) * GRAVIDADE * 1000
+    w0 = (np.asarray(contrapeso) + np.asarray(peso_guindaste)) * GRAVIDADE * 1000
+    wv_i = np.asarray(vento_i, dtype=float)
+    wv_j = np.asarray(vento_j, dtype=float)
+
+    linhas = np.broadcast_arrays(
+        f * r5_k * wv_j + r5_j * wl_k,
+        -(f * r5_k * wv_i + r5_i * wl_k),
+        f * (r5_j * wv_i - r5_i * wv_j),
+        wv_i,
+        wv_j,
+        wl_k + w0,
+        np.zeros_like(wl_k),
+    )
+    return np.stack(linhas, axis=-1)
+
+
+def pseudo_inversa(A):
+    """
+    Pseudo-inversa de A (..., 7, 6) -> (..., 6, 7), reutilizável para
+    qualquer número de vetores B da mesma geometria: X = B @ P^T.
+    Em pilha usa as equações normais, como resolver_sistema.
+    """
+    if A.ndim == 2:
+        return np.linalg.pinv(A)
+    At = np.swapaxes(A, -1, -2)
+    return np.linalg.solve(At @ A, At)
+
+
+def resolver_sistema(A, B):
+    """
+    Solução de mínimos quadrados de A X = B, igual ao lstsq de calc_reactions.
+
+    A única (7, 6): pseudo-inversa uma vez e um produto por caso.
+    A em pilha (..., 7, 6): equações normais, bem mais rápidas que
+    pinv/lstsq em lote; A tem posto completo para patolas não colineares.
+    """
+    if A.ndim == 2:
+        return B @ np.linalg.pinv(A).T
+    At = np.swapaxes(A, -1, -2)
+    return np.linalg.solve(At @ A, At @ B[..., None])[..., 0]
+
+
+@rastreado()
+def calc_reactions_lote(
+    patolas,
+    centro_massa,
+    raio,
+    lanca,
+    angulo_giro_deg,
+    carga,
+    contrapeso,
+    peso_guindaste,
+    vento_i=0.0,
+    vento_j=0.0,
+    fator_vento=1.0,
+):
+    """
+    Versão vetorizada de calc_reactions para muitos casos de uma vez.
+
+    patolas:      (..., 4, 3) coordenadas X, Y, Z das patolas
+    centro_massa: (..., 3)
+    demais:       escalares ou arrays (ton, m, graus, N), com broadcasting
+    fator_vento:  ponto de aplicação do vento como fração de R5 (1 = ponta)
+
+    A matriz A só depende da geometria; quando patolas e centro de massa são
+    fixos a pseudo-inversa é calculada uma vez e cada caso custa um produto
+    matriz-vetor. Retorna X com shape (..., 6), na mesma ordem de
+    calc_reactions: [Hx, Hy, R1, R2, R3, R4].
+    """
+    patolas = np.asarray(patolas, dtype=float)
+    centro_massa = np.asarray(centro_massa, dtype=float)
+
+    r = patolas - centro_massa[..., None, :]
+    A = matriz_sistema(r)
+
+    B = vetor_cargas(
+        raio,
+        lanca,
+        angulo_giro_deg,
+        carga,
+        contrapeso,
+        peso_guindaste,
+        vento_i,
+        vento_j,
+        fator_vento,
+    )
+    return resolver_sistema(A, B)
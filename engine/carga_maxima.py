@@ -0,0 +1,120 @@
+# engine/carga_maxima.py
+"""
+Carga máxima admissível em uma grade raio × ângulo de giro.
+
+As reações são lineares na carga içada W: R(W) = R0 + W dR/dW. Por isso a
+"raiz" de cada critério tem forma fechada e a grade inteira sai de duas
+soluções em lote (W = 0 e W = 1 ton):
+
+- estabilidade: todas as reações R >= 0
+- solo:         todas as reações R <= pressão admissível × área da sapata
+- tabela:       W <= capacidade da tabela de carga (opcional)
+
+Pontos sem nenhuma carga admissível (instáveis ou acima do solo já sem
+carga) ficam com NaN e critério "inviavel", para não serem lidos como uma
+capacidade de 0 ton.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+
+CRITERIOS = np.array(["estabilidade", "solo", "tabela"])
+INVIAVEL = "inviavel"
+
+
+@dataclass
+class ResultadoCargaMaxima:
+    raios: np.ndarray  # (n_raios,) m
+    angulos: np.ndarray  # (n_angulos,) graus
+    carga_max: np.ndarray  # (n_raios, n_angulos) ton, NaN se raio > lança ou inviável
+    # (n_raios, n_angulos) critério que governa, INVIAVEL, ou '' fora da lança
+    criterio: np.ndarray
+    limites: dict  # {criterio: (n_raios, n_angulos) ton}
+
+    def como_dataframe(self):
+        """Tabela longa: Raio, Giro, Carga_max, Criterio."""
+        R, A = np.meshgrid(self.raios, self.angulos, indexing="ij")
+        return pd.DataFrame(
+            {
+                "Raio": R.ravel(),
+                "Giro": A.ravel(),
+                "Carga_max": self.carga_max.ravel(),
+                "Criterio": self.criterio.ravel(),
+            }
+        )
+
+
+def _limite_superior(R0, dR, teto):
+    """
+    Maior W >= 0 tal que R0 + W dR <= teto em todas as patolas (último eixo).
+    Sem restrição -> inf; sem W admissível -> NaN.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = (teto - R0) / dR
+    superior = np.where(dR > 0, w, np.inf)
+    superior = np.where((dR == 0) & (R0 > teto), -np.inf, superior).min(axis=-1)
+    inferior = np.where(dR < 0, w, -np.inf).max(axis=-1)
+
+    viavel = np.maximum(inferior, 0.0) <= superior
+    return np.where(viavel, superior, np.nan)
+
+
+def carga_maxima_grade(entrada, raios, angulos, curva=None, pressao_admissivel=None):
+    """
+    entrada:            EntradaGuindaste (lança, geometria, pesos, vento, solo)
+    raios, angulos:     eixos da grade [m], [graus]
+    curva:              CurvaCarga opcional para limitar pela tabela
+    pressao_admissivel: [Pa]; padrão solo["soil_adm"] se existir
+    """
+    raios = np.asarray(raios, dtype=float)
+    angulos = np.asarray(angulos, dtype=float)
+
+    p = parametros_entrada(entrada)
+    p["raio"] = raios[:, None]
+    p["angulo_giro_deg"] = angulos[None, :]
+
+    # raio > lança: a geometria da ponta vira NaN, mascarada em ``fora``
+    with np.errstate(invalid="ignore"):
+        p["carga"] = 0.0
+        R0 = calc_reactions_lote(**p)[..., 2:]
+        p["carga"] = 1.0
+        dR = calc_reactions_lote(**p)[..., 2:] - R0
+
+    limites = {"estabilidade": _limite_superior(-R0, -dR, 0.0)}
+
+    if pressao_admissivel is None and "soil_adm" in entrada.solo:
+        pressao_admissivel = float(entrada.solo["soil_adm"])
+    if pressao_admissivel is not None:
+        capacidade_sapata = pressao_admissivel * float(entrada.solo["soil_area_i"])
+        limites["solo"] = _limite_superior(R0, dR, capacidade_sapata)
+    else:
+        limites["solo"] = np.full(R0.shape[:-1], np.inf)
+
+    if curva is not None:
+        cap = curva.capacidade(raios, p["lanca"])
+        limites["tabela"] = np.broadcast_to(
+            np.nan_to_num(cap, nan=0.0)[:, None], R0.shape[:-1]
+        )
+    else:
+        limites["tabela"] = np.full(R0.shape[:-1], np.inf)
+
+    pilha = np.stack([limites[c] for c in CRITERIOS], axis=-1)
+    carga_max = pilha.min(axis=-1)  # NaN onde algum critério é inviável
+    criterio = np.where(
+        np.isnan(carga_max), INVIAVEL, CRITERIOS[pilha.argmin(axis=-1)]
+    )
+
+    fora = (raios > p["lanca"])[:, None] | np.isnan(R0).any(axis=-1)
+    carga_max = np.where(fora, np.nan, carga_max)
+    criterio = np.where(fora, "", criterio)
+
+    return ResultadoCargaMaxima(
+        raios=raios,
+        angulos=angulos,
+        carga_max=carga_max,
+        criterio=criterio,
+        limites=limites,
+    )
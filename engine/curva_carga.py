@@ -0,0 +1,89 @@
+# engine/curva_carga.py
+"""
+Tabela de carga do guindaste com interpolação da capacidade.
+
+A tabela (colunas Raio, Lanca, Carga) é interpolada linearmente no plano
+(raio, altura da ponta da lança), o mesmo usado pelo mapa operacional.
+A malha regular interpolada (MalhaCarga) é a mesma no mapa do Dash e nas
+imagens das tabelas de carga.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.interpolate import LinearNDInterpolator
+from scipy.spatial import Delaunay
+
+
+@dataclass
+class MalhaCarga:
+    x: np.ndarray  # (n,) raio [m]
+    y: np.ndarray  # (n,) altura [m]
+    carga: np.ndarray  # (n, n) capacidade [ton], NaN fora da tabela
+    lanca: np.ndarray  # (n, n) comprimento de lança [m], NaN fora da tabela
+
+    def salvar(self, caminho):
+        np.savez_compressed(
+            caminho, x=self.x, y=self.y, carga=self.carga, lanca=self.lanca
+        )
+
+    @classmethod
+    def carregar(cls, caminho):
+        with np.load(caminho) as dados:
+            return cls(**{k: dados[k] for k in ("x", "y", "carga", "lanca")})
+
+
+class CurvaCarga:
+
+    def __init__(self, df):
+        """
+        df: DataFrame contendo colunas obrigatórias:
+            - Raio
+            - Lanca
+            - Carga
+        """
+        self.df = df
+        self.raio = df.Raio.to_numpy(dtype=float)
+        self.lanca = df.Lanca.to_numpy(dtype=float)
+        self.carga = df.Carga.to_numpy(dtype=float)
+
+        # Altura da ponta da lança
+        self.altura = np.sin(np.arccos(self.raio / self.lanca)) * self.lanca
+        self.pts = np.column_stack((self.raio, self.altura))
+
+        # A mesma triangulação serve para a máscara e para o interpolador
+        self.tri = Delaunay(self.pts)
+        self.interp = LinearNDInterpolator(self.tri, self.carga)
+
+    @property
+    def lancas(self):
+        """Comprimentos de lança disponíveis na tabela, em ordem crescente."""
+        return np.unique(self.lanca)
+
+    def malha(self, n=120):
+        """Capacidade e lança em uma malha n x n dentro da envoltória da tabela."""
+        x = np.linspace(np.min(self.raio) * 1.02, np.max(self.raio) * 0.98, n)
+        y = np.linspace(np.min(self.altura) * 1.02, np.max(self.altura) * 0.98, n)
+        X, Y = np.meshgrid(x, y)
+        dentro = self.dentro(X, Y)
+        return MalhaCarga(
+            x=x,
+            y=y,
+            carga=np.where(dentro, self.interp(X, Y), np.nan),
+            lanca=np.where(dentro, np.sqrt(X**2 + Y**2), np.nan),
+        )
+
+    def dentro(self, raio, altura):
+        """True onde (raio, altura) está dentro da envoltória da tabela."""
+        pts = np.stack(np.broadcast_arrays(raio, altura), axis=-1)
+        return self.tri.find_simplex(pts) >= 0
+
+    def capacidade(self, raio, lanca):
+        """
+        Capacidade [ton] para raio e comprimento de lança (com broadcasting).
+        Fora da tabela ou com raio > lança retorna NaN.
+        """
+        raio = np.asarray(raio, dtype=float)
+        lanca = np.asarray(lanca, dtype=float)
+        altura = np.sqrt(np.maximum(lanca**2 - raio**2, 0.0))
+        cap = self.interp(raio, altura)
+        return np.where(raio <= lanca, cap, np.nan)
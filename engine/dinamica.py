@@ -0,0 +1,216 @@
+# engine/dinamica.py
+"""
+Simulação dinâmica do içamento no tempo (muitos cenários de uma vez).
+
+Modelo por cenário:
+
+- carga como pêndulo (pequenos ângulos) pendurado na ponta da lança, com
+  cabo de comprimento l e amortecimento ζ:
+      ü = -(g_ef / l) u - a_ponta + F_vento / m - 2 ζ ω_n u̇
+- giro com perfil trapezoidal (aceleração, velocidade constante, frenagem)
+- içamento: aceleração vertical a_h durante um intervalo (g_ef = g + a_h)
+- vento na carga: força média + rajada 1-cosseno em uma direção fixa
+
+A ponta recebe do cabo a força vertical m g_ef e a horizontal m g_ef u / l;
+elas entram em vetor_cargas como carga e vento na ponta, então a matriz A
+(geometria fixa) é fatorada uma vez e cada passo custa um produto matricial
+para todos os cenários. A integração é Euler semi-implícito com passo fixo.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import (
+    GRAVIDADE,
+    PATOLAS,
+    matriz_sistema,
+    parametros_entrada,
+    pseudo_inversa,
+    vetor_cargas,
+)
+
+# Parâmetros de um cenário e valores padrão
+CENARIO_PADRAO = {
+    "giro_inicial": 0.0,  # graus
+    "giro_final": 90.0,  # graus
+    "velocidade_giro": 1.5,  # graus/s
+    "aceleracao_giro": 1.0,  # graus/s²
+    "comprimento_cabo": 10.0,  # m
+    "amortecimento": 0.01,  # fração do crítico
+    "aceleracao_icamento": 0.0,  # m/s²
+    "duracao_icamento": 0.0,  # s
+    "forca_vento": 0.0,  # N, média na carga
+    "rajada": 0.0,  # N, pico da rajada
+    "inicio_rajada": 0.0,  # s
+    "duracao_rajada": 4.0,  # s
+    "direcao_vento": 0.0,  # graus, para onde o vento sopra
+}
+
+# Divisores no perfil de giro, na frequência do pêndulo e na rajada
+POSITIVOS = ("velocidade_giro", "aceleracao_giro", "comprimento_cabo", "duracao_rajada")
+
+
+@dataclass
+class ResultadoDinamico:
+    cenarios: pd.DataFrame  # parâmetros usados
+    picos: pd.DataFrame  # maior reação por patola [N]
+    minimos: pd.DataFrame  # menor reação por patola [N]
+    tempo_descolamento: pd.Series  # 1º instante com reação <= 0 [s]; NaN se nunca
+    tempos: np.ndarray | None = None  # (n_salvos,) s
+    historico: np.ndarray | None = None  # (n_salvos, n_cenarios, 4) N
+
+
+def montar_cenarios(cenarios=None, **parametros):
+    """DataFrame de cenários completado com CENARIO_PADRAO."""
+    df = pd.DataFrame(cenarios if cenarios is not None else [{}])
+    for nome, valor in parametros.items():
+        df[nome] = valor
+    desconhecidos = set(df.columns) - set(CENARIO_PADRAO)
+    if desconhecidos:
+        raise ValueError(f"Parâmetros sem suporte: {sorted(desconhecidos)}")
+    for nome, valor in CENARIO_PADRAO.items():
+        if nome not in df:
+            df[nome] = valor
+    df = df[list(CENARIO_PADRAO)].astype(float).reset_index(drop=True)
+    for nome in POSITIVOS:
+        if not (df[nome] > 0).all():
+            raise ValueError(f"{nome} deve ser > 0")
+    return df
+
+
+def perfil_giro(t, giro_inicial, giro_final, velocidade, aceleracao):
+    """
+    Perfil trapezoidal (ou triangular, se não atinge a velocidade):
+    retorna (θ, ω, α) em rad, rad/s e rad/s², com broadcasting.
+    """
+    delta = np.radians(np.asarray(giro_final) - np.asarray(giro_inicial))
+    sentido = np.sign(delta)
+    D = np.abs(delta)
+    v = np.radians(velocidade)
+    a = np.radians(aceleracao)
+
+    triangular = D < v * v / a
+    v_pico = np.where(triangular, np.sqrt(D * a), v)
+    ta = v_pico / a
+    tc = np.where(triangular, 0.0, (D - v * ta) / np.where(v > 0, v, 1.0))
+    T = 2 * ta + tc
+
+    # tempos em cada fase, sem ramificação
+    t1 = np.minimum(t, ta)
+    t2 = np.clip(t - ta, 0.0, tc)
+    t3 = np.clip(t - ta - tc, 0.0, ta)
+
+    s = 0.5 * a * t1 * t1 + v_pico * (t2 + t3) - 0.5 * a * t3 * t3
+    w = a * (t1 - t3)
+    al = a * ((t < ta) * 1.0 - ((t >= ta + tc) & (t < T)))
+
+    return np.radians(giro_inicial) + sentido * s, sentido * w, sentido * al
+
+
+def passos_dinamica(entrada, cenarios, duracao=30.0, dt=0.01):
+    """
+    Gerador das reações no tempo: produz (t, R) a cada passo, com R de
+    shape (n_cenarios, 4) [N]. Nada é acumulado aqui; quem consome decide
+    o que guardar.
+    """
+    c = {k: cenarios[k].to_numpy(dtype=float) for k in CENARIO_PADRAO}
+    p = parametros_entrada(entrada)
+
+    P = pseudo_inversa(matriz_sistema(p["patolas"] - p["centro_massa"]))[2:]
+    raio, lanca = p["raio"], p["lanca"]
+    m = p["carga"] * 1000.0  # kg
+    l = c["comprimento_cabo"]
+    omega_n = np.sqrt(GRAVIDADE / l)
+
+    dir_vento = np.radians(c["direcao_vento"])
+    dir_vento = np.stack([np.cos(dir_vento), np.sin(dir_vento)], axis=-1)
+
+    def forca_vento(t):
+        fase = (t - c["inicio_rajada"]) / c["duracao_rajada"]
+        janela = (fase >= 0) & (fase <= 1)
+        rajada = np.where(janela, 0.5 * (1 - np.cos(2 * np.pi * fase)), 0.0)
+        return (c["forca_vento"] + c["rajada"] * rajada)[:, None] * dir_vento
+
+    # início em equilíbrio estático com o vento atuante em t = 0
+    u = forca_vento(0.0) * l[:, None] / (m * GRAVIDADE)
+    du = np.zeros_like(u)
+
+    n_passos = int(round(duracao / dt))
+    for k in range(n_passos + 1):
+        t = k * dt
+
+        theta, w, al = perfil_giro(
+            t,
+            c["giro_inicial"],
+            c["giro_final"],
+            c["velocidade_giro"],
+            c["aceleracao_giro"],
+        )
+        cos, sin = np.cos(theta), np.sin(theta)
+        a_ponta = raio * np.stack(
+            [-w * w * cos - al * sin, -w * w * sin + al * cos], axis=-1
+        )
+
+        a_h = np.where(t < c["duracao_icamento"], c["aceleracao_icamento"], 0.0)
+        g_ef = GRAVIDADE + a_h
+
+        # forças do cabo na ponta
+        f_h = m * (g_ef / l)[:, None] * u
+        B = vetor_cargas(
+            raio,
+            lanca,
+            np.degrees(theta),
+            p["carga"] * g_ef / GRAVIDADE,
+            p["contrapeso"],
+            p["peso_guindaste"],
+            p["vento_i"] + f_h[:, 0],
+            p["vento_j"] + f_h[:, 1],
+        )
+        yield t, B @ P.T
+
+        # Euler semi-implícito
+        ddu = (
+            -(g_ef / l)[:, None] * u
+            - a_ponta
+            + forca_vento(t) / m
+            - (2 * c["amortecimento"] * omega_n)[:, None] * du
+        )
+        du = du + dt * ddu
+        u = u + dt * du
+
+
+def simular_dinamica(
+    entrada, cenarios=None, duracao=30.0, dt=0.01, salvar_a_cada=None
+):
+    """
+    entrada:       EntradaGuindaste (geometria, raio, lança, carga, pesos, vento
+                   estático na lança)
+    cenarios:      DataFrame/lista de dicts com parâmetros de CENARIO_PADRAO
+    salvar_a_cada: guarda o histórico a cada N passos (None -> só picos)
+    """
+    cenarios = montar_cenarios(cenarios)
+    n = len(cenarios)
+
+    picos = np.full((n, 4), -np.inf)
+    minimos = np.full((n, 4), np.inf)
+    descolamento = np.full(n, np.nan)
+    tempos, historico = [], []
+
+    for k, (t, R) in enumerate(passos_dinamica(entrada, cenarios, duracao, dt)):
+        np.maximum(picos, R, out=picos)
+        np.minimum(minimos, R, out=minimos)
+        novo = np.isnan(descolamento) & (R.min(axis=1) <= 0)
+        descolamento[novo] = t
+        if salvar_a_cada and k % salvar_a_cada == 0:
+            tempos.append(t)
+            historico.append(R)
+
+    return ResultadoDinamico(
+        cenarios=cenarios,
+        picos=pd.DataFrame(picos, columns=PATOLAS),
+        minimos=pd.DataFrame(minimos, columns=PATOLAS),
+        tempo_descolamento=pd.Series(descolamento),
+        tempos=np.array(tempos) if salvar_a_cada else None,
+        historico=np.array(historico) if salvar_a_cada else None,
+    )
@@ -0,0 +1,124 @@
+# engine/extensao_patolas.py
+"""
+Busca de configurações de extensão das patolas (extensão parcial).
+
+Cada patola pode ficar em estados discretos de extensão (ex.: 0/50/100 %).
+A posição é interpolada entre a posição recolhida e a estendida (tabela de
+patolas). Todas as combinações são montadas como uma pilha de geometrias;
+a pseudo-inversa de cada geometria é calculada uma única vez e aplicada a
+todos os ângulos de giro com um produto matricial.
+"""
+import itertools
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import (
+    PATOLAS,
+    matriz_sistema,
+    parametros_entrada,
+    pseudo_inversa,
+    vetor_cargas,
+)
+
+ESTADOS_PADRAO = (0.0, 0.5, 1.0)
+
+
+@dataclass
+class ResultadoExtensoes:
+    layouts: pd.DataFrame  # P1..P4 (fração), Reacao_min, Pressao_max, Viavel
+    melhor: pd.Series | None  # layout viável com maior Reacao_min
+
+    @property
+    def viaveis(self):
+        return self.layouts[self.layouts["Viavel"]]
+
+
+def posicoes_recolhidas(estendidas, eixo="X", fracao=0.5):
+    """
+    Posição recolhida padrão: a coordenada do eixo da viga (transversal)
+    reduzida a `fracao` da estendida; as demais coordenadas não mudam.
+    """
+    recolhidas = np.array(estendidas, dtype=float, copy=True)
+    recolhidas[..., "XYZ".index(eixo)] *= fracao
+    return recolhidas
+
+
+def combinacoes_extensao(estados=ESTADOS_PADRAO):
+    """
+    Todas as combinações de extensão por patola -> (n_layouts, 4).
+
+    estados: sequência usada para todas as patolas ou
+             {patola: sequência} (ex.: patola obstruída só com 0 e 0.5)
+    """
+    if not isinstance(estados, dict):
+        estados = {p: estados for p in PATOLAS}
+    opcoes = [np.asarray(estados[p], dtype=float) for p in PATOLAS]
+    return np.array(list(itertools.product(*opcoes)), dtype=float)
+
+
+def buscar_extensoes(
+    entrada,
+    estados=ESTADOS_PADRAO,
+    recolhidas=None,
+    angulos=None,
+    pressao_admissivel=None,
+):
+    """
+    entrada:            EntradaGuindaste; patolas = posições 100 % estendidas
+    estados:            frações de extensão (ver combinacoes_extensao)
+    recolhidas:         (4, 3) posições 0 %; padrão posicoes_recolhidas
+    angulos:            envoltória de giro [graus]; padrão 0..359
+    pressao_admissivel: [Pa]; padrão solo["soil_adm"] se existir
+
+    Um layout é viável se todas as reações ficam positivas em todo o giro
+    e, havendo pressão admissível, a maior pressão não a ultrapassa.
+    """
+    p = parametros_entrada(entrada)
+    estendidas = p["patolas"]
+    if recolhidas is None:
+        recolhidas = posicoes_recolhidas(estendidas)
+    recolhidas = np.asarray(recolhidas, dtype=float)
+
+    if angulos is None:
+        angulos = np.arange(0.0, 360.0, 1.0)
+    angulos = np.asarray(angulos, dtype=float)
+
+    if pressao_admissivel is None and "soil_adm" in entrada.solo:
+        pressao_admissivel = float(entrada.solo["soil_adm"])
+    area = float(entrada.solo["soil_area_i"])
+
+    # (n_layouts, 4, 3)
+    extensoes = combinacoes_extensao(estados)
+    patolas = recolhidas + extensoes[..., None] * (estendidas - recolhidas)
+
+    # uma fatoração por geometria, reaproveitada em todos os ângulos
+    P = pseudo_inversa(matriz_sistema(patolas - p["centro_massa"]))
+    B = vetor_cargas(
+        p["raio"],
+        p["lanca"],
+        angulos,
+        p["carga"],
+        p["contrapeso"],
+        p["peso_guindaste"],
+        p["vento_i"],
+        p["vento_j"],
+    )
+    R = np.einsum("lpj,aj->lap", P[:, 2:, :], B)  # (n_layouts, n_angulos, 4)
+
+    reacao_min = R.min(axis=(1, 2))
+    pressao_max = R.max(axis=(1, 2)) / area
+    viavel = reacao_min > 0
+    if pressao_admissivel is not None:
+        viavel &= pressao_max <= pressao_admissivel
+
+    layouts = pd.DataFrame(extensoes, columns=PATOLAS)
+    layouts["Reacao_min"] = reacao_min
+    layouts["Pressao_max"] = pressao_max
+    layouts["Viavel"] = viavel
+
+    viaveis = layouts[viavel]
+    melhor = viaveis.loc[viaveis["Reacao_min"].idxmax()] if len(viaveis) else None
+
+    return ResultadoExtensoes(layouts=layouts, melhor=melhor)
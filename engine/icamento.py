@@ -0,0 +1,62 @@
+# engine/icamento.py
+"""
+Resultado de um içamento: o mesmo cálculo do botão "Calcular Estabilidade".
+
+Usado pela página de patolas e pelos relatórios de plano de içamento, para
+que os números do relatório sejam exatamente os da tela:
+
+- reações P1..P4 (calc_reactions)
+- sensibilidade das reações e carga adicional até perder contato
+- utilização da sapata: maior reação / (pressão admissível × área)
+- utilização da tabela de carga: carga / capacidade no raio e lança
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import PATOLAS, calc_reactions
+from engine.sensibilidade import calc_sensibilidade, carga_ate_descolamento
+
+
+@dataclass
+class ResultadoIcamento:
+    reacoes: dict  # {P1..P4: N}
+    sensibilidade: pd.DataFrame  # PATOLAS x PARAMETROS
+    utilizacao: float | None  # reação máxima / capacidade da sapata
+
+    @property
+    def estavel(self):
+        return min(self.reacoes.values()) >= 0
+
+    def margem(self):
+        """Carga adicional [ton] até cada patola perder contato."""
+        return carga_ate_descolamento(pd.Series(self.reacoes), self.sensibilidade)
+
+
+def calcular_icamento(entrada):
+    X, _, _, _ = calc_reactions(entrada)
+    reacoes = dict(zip(PATOLAS, map(float, np.ravel(X)[2:])))
+
+    # Sensibilidade: what-if linearizado sem novo cálculo
+    _, sens = calc_sensibilidade(entrada)
+
+    utilizacao = None
+    if "soil_adm" in entrada.solo:
+        capacidade = float(entrada.solo["soil_adm"]) * float(
+            entrada.solo["soil_area_i"]
+        )
+        utilizacao = max(reacoes.values()) / capacidade
+
+    return ResultadoIcamento(reacoes, sens, utilizacao)
+
+
+def utilizacao_tabela(entrada, curva):
+    """(capacidade [ton], carga / capacidade); NaN fora da tabela de carga."""
+    capacidade = float(
+        curva.capacidade(float(entrada.lanca["Raio"]), float(entrada.lanca["Lanca"]))
+    )
+    carga = float(entrada.cargas["Carga"].sum())
+    if not np.isfinite(capacidade) or capacidade <= 0:
+        return capacidade, np.nan
+    return capacidade, carga / capacidade
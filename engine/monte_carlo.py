@@ -0,0 +1,199 @@
+# engine/monte_carlo.py
+"""
+Análise de incerteza (Monte Carlo) das reações nas patolas.
+
+As entradas incertas são amostradas de distribuições configuráveis e
+resolvidas em lotes pelo solver vetorizado (calc_reactions_lote). Os lotes
+são distribuídos em um pool de processos; cada lote tem a sua própria
+semente derivada de ``np.random.SeedSequence(semente)``, então o resultado
+não depende do número de processos.
+
+Amostras fisicamente impossíveis (carga ou contrapeso negativos, raio fora
+de [0, lança], rigidez do solo <= 0), comuns nas caudas de uma normal, são
+descartadas e contadas em ``n_rejeitadas``; as estatísticas usam as demais.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import PATOLAS, calc_reactions_lote, parametros_entrada
+
+# Variáveis que podem receber distribuição
+VARIAVEIS = (
+    "carga",  # ton (soma das cargas)
+    "contrapeso",  # ton
+    "raio",  # m
+    "vento_i",  # N
+    "vento_j",  # N
+    "Xcm",  # m
+    "Ycm",  # m
+    "Zcm",  # m
+    "soil_k",  # Pa
+)
+
+
+@dataclass(frozen=True)
+class Distribuicao:
+    """
+    Distribuição de uma variável de entrada.
+
+    tipo:
+        "fixo"        a = valor
+        "normal"      a = média, b = desvio padrão
+        "uniforme"    a = mínimo, b = máximo
+        "triangular"  a = mínimo, b = moda, c = máximo
+        "lognormal"   a = mediana, b = desvio padrão de ln(x)
+    """
+
+    tipo: str
+    a: float = 0.0
+    b: float = 0.0
+    c: float = 0.0
+
+    @classmethod
+    def normal(cls, media, desvio):
+        return cls("normal", media, desvio)
+
+    @classmethod
+    def uniforme(cls, minimo, maximo):
+        return cls("uniforme", minimo, maximo)
+
+    @classmethod
+    def triangular(cls, minimo, moda, maximo):
+        return cls("triangular", minimo, moda, maximo)
+
+    @classmethod
+    def lognormal(cls, mediana, sigma):
+        return cls("lognormal", mediana, sigma)
+
+    def amostrar(self, rng, n):
+        if self.tipo == "fixo":
+            return np.full(n, float(self.a))
+        if self.tipo == "normal":
+            return rng.normal(self.a, self.b, n)
+        if self.tipo == "uniforme":
+            return rng.uniform(self.a, self.b, n)
+        if self.tipo == "triangular":
+            return rng.triangular(self.a, self.b, self.c, n)
+        if self.tipo == "lognormal":
+            return rng.lognormal(np.log(self.a), self.b, n)
+        raise ValueError(f"Distribuição desconhecida: {self.tipo}")
+
+
+@dataclass
+class ResultadoMonteCarlo:
+    n_amostras: int
+    semente: int
+    n_rejeitadas: int  # amostras fora do domínio físico, descartadas
+    percentis: pd.DataFrame  # reações [N], linhas P1..P4, colunas p1, p5, ...
+    prob_descolamento: pd.Series  # P(R < 0) por patola
+    prob_descolamento_qualquer: float  # P(alguma patola com R < 0)
+    recalque_percentis: pd.DataFrame  # recalque R / (k A) [m]
+
+
+def _avaliar_lote(base, distribuicoes, soil_k, area, n, semente):
+    """
+    Amostra e resolve um lote. Roda dentro dos processos do pool.
+    Retorna (reações, recalque, n_rejeitadas) só das amostras válidas.
+    """
+    rng = np.random.default_rng(semente)
+    p = dict(base)
+
+    cm = p["centro_massa"]
+    amostras = {}
+    for nome in VARIAVEIS:
+        if nome in distribuicoes:
+            amostras[nome] = distribuicoes[nome].amostrar(rng, n)
+
+    for nome in ("carga", "contrapeso", "raio", "vento_i", "vento_j"):
+        if nome in amostras:
+            p[nome] = amostras[nome]
+
+    if any(k in amostras for k in ("Xcm", "Ycm", "Zcm")):
+        cm = np.broadcast_to(cm, (n, 3)).copy()
+        for eixo, nome in enumerate(("Xcm", "Ycm", "Zcm")):
+            if nome in amostras:
+                cm[:, eixo] = amostras[nome]
+        p["centro_massa"] = cm
+
+    soil_k = amostras.get("soil_k", np.full(n, soil_k))
+    validas = (
+        (np.broadcast_to(p["carga"], n) >= 0)
+        & (np.broadcast_to(p["contrapeso"], n) >= 0)
+        & (np.broadcast_to(p["raio"], n) >= 0)
+        & (np.broadcast_to(p["raio"], n) <= p["lanca"])
+        & (soil_k > 0)
+    )
+
+    with np.errstate(invalid="ignore"):
+        X = calc_reactions_lote(**p)
+    reacoes = np.broadcast_to(X[..., 2:], (n, 4))[validas]
+
+    recalque = reacoes / (soil_k[validas, None] * area)
+    return reacoes, recalque, int(n - validas.sum())
+
+
+def analise_monte_carlo(
+    entrada,
+    distribuicoes,
+    n_amostras=1_000_000,
+    semente=0,
+    tamanho_lote=100_000,
+    n_processos=None,
+    percentis=(1, 5, 50, 95, 99),
+):
+    """
+    entrada:        EntradaGuindaste com os valores nominais
+    distribuicoes:  {nome em VARIAVEIS: Distribuicao}; o resto fica fixo
+    n_processos:    None -> os.cpu_count(); 1 -> sem pool
+    """
+    desconhecidas = set(distribuicoes) - set(VARIAVEIS)
+    if desconhecidas:
+        raise ValueError(f"Variáveis sem suporte: {sorted(desconhecidas)}")
+
+    base = parametros_entrada(entrada)
+    soil_k = float(entrada.solo["soil_k"])
+    area = float(entrada.solo["soil_area_i"])
+
+    n_lotes = math.ceil(n_amostras / tamanho_lote)
+    tamanhos = [tamanho_lote] * (n_lotes - 1) + [
+        n_amostras - tamanho_lote * (n_lotes - 1)
+    ]
+    sementes = np.random.SeedSequence(semente).spawn(n_lotes)
+    tarefas = [
+        (base, distribuicoes, soil_k, area, n, s) for n, s in zip(tamanhos, sementes)
+    ]
+
+    n_processos = n_processos or os.cpu_count() or 1
+    if n_processos == 1 or n_lotes == 1:
+        resultados = [_avaliar_lote(*t) for t in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_processos, n_lotes)) as pool:
+            resultados = list(pool.map(_avaliar_lote, *zip(*tarefas)))
+
+    reacoes = np.concatenate([r for r, _, _ in resultados])
+    recalque = np.concatenate([d for _, d, _ in resultados])
+    n_rejeitadas = sum(k for _, _, k in resultados)
+    if not len(reacoes):
+        raise ValueError("Todas as amostras caíram fora do domínio físico")
+
+    colunas = [f"p{p:g}" for p in percentis]
+    descolada = reacoes < 0
+
+    return ResultadoMonteCarlo(
+        n_amostras=n_amostras,
+        semente=semente,
+        n_rejeitadas=n_rejeitadas,
+        percentis=pd.DataFrame(
+            np.percentile(reacoes, percentis, axis=0).T, index=PATOLAS, columns=colunas
+        ),
+        prob_descolamento=pd.Series(descolada.mean(axis=0), index=PATOLAS),
+        prob_descolamento_qualquer=float(descolada.any(axis=1).mean()),
+        recalque_percentis=pd.DataFrame(
+            np.percentile(recalque, percentis, axis=0).T, index=PATOLAS, columns=colunas
+        ),
+    )
@@ -0,0 +1,427 @@
+# engine/obstaculos.py
+"""
+Obstáculos do canteiro e verificação de interferência da lança e da carga.
+
+Os obstáculos são caixas alinhadas aos eixos ou malhas triangulares (OBJ),
+no mesmo sistema de coordenadas do guindaste. Todas as primitivas ficam em
+uma hierarquia de volumes envolventes (BVH) montada uma vez; a varredura
+de giro × raio consulta a árvore para todos os segmentos ao mesmo tempo
+(travessia em largura, vetorizada), e só os pares segmento × primitiva que
+sobram chegam ao teste exato.
+
+- caixa:     teste de placas (slab) segmento × caixa, expandida pela folga
+- triângulo: interseção segmento × triângulo (Möller–Trumbore); com folga,
+             também colide o segmento a menos da folga do triângulo
+
+Cada segmento reporta o obstáculo mais próximo do seu início (p0).
+"""
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import ponta_lanca
+
+COLUNAS_CAIXA = ["Nome", "Xmin", "Ymin", "Zmin", "Xmax", "Ymax", "Zmax"]
+ELEMENTOS = np.array(["lanca", "carga"])
+
+_EPS = 1e-12
+
+
+# =====================================================
+# PRIMITIVAS
+# =====================================================
+
+
+def _parametro_caixa(p0, p1, cmin, cmax):
+    """
+    Teste de placas vetorizado: (n, 3) cada -> (n,) parâmetro t em [0, 1]
+    da entrada na caixa, ou inf se o segmento não a atravessa.
+    """
+    d = p1 - p0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv = 1.0 / d
+        t1 = (cmin - p0) * inv
+        t2 = (cmax - p0) * inv
+    # eixo paralelo: dentro da placa -> sem restrição; fora -> sem interseção
+    paralelo = np.abs(d) < _EPS
+    dentro = (p0 >= cmin) & (p0 <= cmax)
+    tmin = np.where(paralelo, np.where(dentro, -np.inf, np.inf), np.minimum(t1, t2))
+    tmax = np.where(paralelo, np.where(dentro, np.inf, -np.inf), np.maximum(t1, t2))
+    entrada = np.maximum(tmin.max(axis=-1), 0.0)
+    saida = np.minimum(tmax.min(axis=-1), 1.0)
+    return np.where(entrada <= saida, entrada, np.inf)
+
+
+def _segmento_caixa(p0, p1, cmin, cmax):
+    """Teste de placas vetorizado: (n, 3) cada -> (n,) bool."""
+    return np.isfinite(_parametro_caixa(p0, p1, cmin, cmax))
+
+
+def _parametro_triangulo(p0, p1, v0, v1, v2):
+    """
+    Möller–Trumbore vetorizado: (n, 3) cada -> (n,) parâmetro t em [0, 1]
+    do ponto de interseção, ou inf se não há interseção.
+    """
+    d = p1 - p0
+    e1 = v1 - v0
+    e2 = v2 - v0
+    h = np.cross(d, e2)
+    a = np.einsum("ij,ij->i", e1, h)
+    ok = np.abs(a) > _EPS
+    f = np.where(ok, 1.0 / np.where(ok, a, 1.0), 0.0)
+    s = p0 - v0
+    u = f * np.einsum("ij,ij->i", s, h)
+    q = np.cross(s, e1)
+    v = f * np.einsum("ij,ij->i", d, q)
+    t = f * np.einsum("ij,ij->i", e2, q)
+    hit = ok & (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0) & (t <= 1)
+    return np.where(hit, t, np.inf)
+
+
+def _segmento_segmento(p0, p1, q0, q1):
+    """
+    Pontos mais próximos entre os segmentos p0-p1 e q0-q1 (Ericson, 5.1.9):
+    (n, 3) cada -> (distância, parâmetro s em p0-p1), ambos (n,).
+    """
+    d1, d2, r = p1 - p0, q1 - q0, p0 - q0
+    a = np.einsum("ij,ij->i", d1, d1)
+    e = np.einsum("ij,ij->i", d2, d2)
+    b = np.einsum("ij,ij->i", d1, d2)
+    c = np.einsum("ij,ij->i", d1, r)
+    f = np.einsum("ij,ij->i", d2, r)
+    a_ok, e_ok = a > _EPS, e > _EPS
+    a_ = np.where(a_ok, a, 1.0)
+    e_ = np.where(e_ok, e, 1.0)
+
+    denom = a * e - b * b
+    geral = denom > _EPS  # não paralelos
+    s = np.where(geral, np.clip((b * f - c * e) / np.where(geral, denom, 1.0), 0, 1), 0)
+    t = (b * s + f) / e_
+    s = np.where(t < 0, np.clip(-c / a_, 0, 1), s)
+    s = np.where(t > 1, np.clip((b - c) / a_, 0, 1), s)
+    t = np.clip(t, 0, 1)
+    # segmentos degenerados (pontos)
+    s = np.where(a_ok, np.where(e_ok, s, np.clip(-c / a_, 0, 1)), 0.0)
+    t = np.where(e_ok, np.where(a_ok, t, np.clip(f / e_, 0, 1)), 0.0)
+
+    dist = np.linalg.norm(p0 + d1 * s[:, None] - q0 - d2 * t[:, None], axis=-1)
+    return dist, s
+
+
+def _ponto_triangulo(p, v0, v1, v2):
+    """Distância do ponto ao triângulo: (n, 3) cada -> (n,)."""
+    e1, e2 = v1 - v0, v2 - v0
+    n = np.cross(e1, e2)
+    nn = np.einsum("ij,ij->i", n, n)
+    w = p - v0
+    # coordenadas baricêntricas da projeção no plano
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = np.einsum("ij,ij->i", np.cross(w, e2), n) / nn
+        v = np.einsum("ij,ij->i", np.cross(e1, w), n) / nn
+        plano = np.abs(np.einsum("ij,ij->i", w, n)) / np.sqrt(nn)
+    dentro = (nn > _EPS) & (u >= 0) & (v >= 0) & (u + v <= 1)
+    arestas = np.min(
+        [_segmento_segmento(p, p, a, b)[0] for a, b in ((v0, v1), (v1, v2), (v2, v0))],
+        axis=0,
+    )
+    return np.where(dentro, plano, arestas)
+
+
+def _aproximacao_triangulo(p0, p1, v0, v1, v2):
+    """
+    Menor distância entre segmento e triângulo (sem interseção) e o
+    parâmetro s do ponto do segmento que a realiza: (n,) cada.
+    """
+    candidatos = [
+        (_ponto_triangulo(p0, v0, v1, v2), np.zeros(len(p0))),
+        (_ponto_triangulo(p1, v0, v1, v2), np.ones(len(p0))),
+    ] + [_segmento_segmento(p0, p1, a, b) for a, b in ((v0, v1), (v1, v2), (v2, v0))]
+    dist = np.array([d for d, _ in candidatos])
+    s = np.array([s for _, s in candidatos])
+    melhor = dist.argmin(axis=0)
+    coluna = np.arange(len(p0))
+    return dist[melhor, coluna], s[melhor, coluna]
+
+
+# =====================================================
+# BVH
+# =====================================================
+
+
+class Obstaculos:
+    """
+    Conjunto de obstáculos indexado por uma BVH.
+
+    caixas:     DataFrame com COLUNAS_CAIXA
+    triangulos: (n, 3, 3) vértices; nomes_triangulos: (n,) obstáculo de cada um
+    """
+
+    FOLHA = 4  # primitivas por folha
+
+    def __init__(self, caixas=None, triangulos=None, nomes_triangulos=None):
+        caixas = pd.DataFrame(caixas, columns=COLUNAS_CAIXA) if caixas is not None else None
+        if caixas is None or caixas.empty:
+            caixas = pd.DataFrame(columns=COLUNAS_CAIXA)
+        self.caixas = caixas.reset_index(drop=True)
+        cmin = self.caixas[["Xmin", "Ymin", "Zmin"]].to_numpy(dtype=float)
+        cmax = self.caixas[["Xmax", "Ymax", "Zmax"]].to_numpy(dtype=float)
+        self.caixa_min = np.minimum(cmin, cmax).reshape(-1, 3)
+        self.caixa_max = np.maximum(cmin, cmax).reshape(-1, 3)
+
+        self.triangulos = (
+            np.asarray(triangulos, dtype=float).reshape(-1, 3, 3)
+            if triangulos is not None
+            else np.zeros((0, 3, 3))
+        )
+        if nomes_triangulos is None:
+            nomes_triangulos = ["malha"] * len(self.triangulos)
+
+        # primitivas: caixas primeiro, depois triângulos
+        self.nomes = np.array(
+            list(self.caixas["Nome"].astype(str)) + list(nomes_triangulos), dtype=object
+        )
+        self.n_caixas = len(self.caixas)
+        self.prim_min = np.vstack([self.caixa_min, self.triangulos.min(axis=1)])
+        self.prim_max = np.vstack([self.caixa_max, self.triangulos.max(axis=1)])
+
+        self._construir()
+
+    def __len__(self):
+        return len(self.nomes)
+
+    # -----------------------------
+    # Leitura
+    # -----------------------------
+    @classmethod
+    def de_arquivo(cls, caminho):
+        """Caixas de CSV/XLSX (COLUNAS_CAIXA) ou malhas de um OBJ."""
+        ext = os.path.splitext(caminho)[1].lower()
+        if ext == ".obj":
+            triangulos, nomes = ler_obj(caminho)
+            return cls(triangulos=triangulos, nomes_triangulos=nomes)
+        if ext in (".xlsx", ".xls"):
+            return cls(caixas=pd.read_excel(caminho))
+        return cls(caixas=pd.read_csv(caminho))
+
+    # -----------------------------
+    # Construção da árvore
+    # -----------------------------
+    def _construir(self):
+        """
+        BVH em arrays: nó k tem caixa (no_min[k], no_max[k]); nós internos
+        têm filhos (esq[k], dir[k]); folhas têm primitivas
+        ordem[inicio[k]:fim[k]] e esq[k] = -1.
+        """
+        n = len(self)
+        centros = (self.prim_min + self.prim_max) / 2
+        self.ordem = np.arange(n)
+
+        no_min, no_max, esq, dir_, inicio, fim = [], [], [], [], [], []
+
+        def novo(a, b):
+            idx = self.ordem[a:b]
+            no_min.append(self.prim_min[idx].min(axis=0))
+            no_max.append(self.prim_max[idx].max(axis=0))
+            esq.append(-1)
+            dir_.append(-1)
+            inicio.append(a)
+            fim.append(b)
+            return len(no_min) - 1
+
+        if n:
+            pilha = [(novo(0, n), 0, n)]
+            while pilha:
+                k, a, b = pilha.pop()
+                if b - a <= self.FOLHA:
+                    continue
+                idx = self.ordem[a:b]
+                c = centros[idx]
+                eixo = np.argmax(c.max(axis=0) - c.min(axis=0))
+                self.ordem[a:b] = idx[np.argsort(c[:, eixo], kind="stable")]
+                m = (a + b) // 2
+                esq[k] = novo(a, m)
+                dir_[k] = novo(m, b)
+                pilha += [(esq[k], a, m), (dir_[k], m, b)]
+
+        self.no_min = np.array(no_min).reshape(-1, 3)
+        self.no_max = np.array(no_max).reshape(-1, 3)
+        self.esq = np.array(esq, dtype=int)
+        self.dir = np.array(dir_, dtype=int)
+        self.inicio = np.array(inicio, dtype=int)
+        self.fim = np.array(fim, dtype=int)
+
+    # -----------------------------
+    # Consultas
+    # -----------------------------
+    def candidatos(self, p0, p1, folga=0.0):
+        """
+        Pares (segmento, primitiva) cujas caixas envolventes (expandidas pela
+        folga) são atravessadas pelo segmento. Travessia em largura com
+        todos os segmentos ao mesmo tempo.
+        """
+        if not len(self):
+            vazio = np.zeros(0, dtype=int)
+            return vazio, vazio
+
+        seg = np.arange(len(p0))
+        no = np.zeros(len(p0), dtype=int)
+        pares_seg, pares_prim = [], []
+
+        while len(seg):
+            ok = _segmento_caixa(
+                p0[seg], p1[seg], self.no_min[no] - folga, self.no_max[no] + folga
+            )
+            seg, no = seg[ok], no[ok]
+
+            folha = self.esq[no] < 0
+            s_folha, n_folha = seg[folha], no[folha]
+            if len(s_folha):
+                tam = self.fim[n_folha] - self.inicio[n_folha]
+                rep = np.repeat(np.arange(len(s_folha)), tam)
+                desloc = np.arange(tam.sum()) - np.repeat(np.cumsum(tam) - tam, tam)
+                pares_seg.append(s_folha[rep])
+                pares_prim.append(self.ordem[self.inicio[n_folha][rep] + desloc])
+
+            seg = np.concatenate([seg[~folha], seg[~folha]])
+            no = np.concatenate([self.esq[no[~folha]], self.dir[no[~folha]]])
+
+        if not pares_seg:
+            vazio = np.zeros(0, dtype=int)
+            return vazio, vazio
+        return np.concatenate(pares_seg), np.concatenate(pares_prim)
+
+    def intersecoes(self, p0, p1, folga=0.0):
+        """
+        Primeiro obstáculo atingido por cada segmento, indo de p0 para p1:
+        (n,) índice da primitiva ou -1. O contato é a entrada na caixa
+        expandida pela folga; em triângulos, a interseção ou, sem ela, o
+        ponto do segmento mais próximo do triângulo (se a menos da folga).
+        """
+        p0 = np.asarray(p0, dtype=float).reshape(-1, 3)
+        p1 = np.asarray(p1, dtype=float).reshape(-1, 3)
+        s, k = self.candidatos(p0, p1, folga)
+
+        contato = np.full(len(s), np.inf)
+        caixa = k < self.n_caixas
+        if caixa.any():
+            kc = k[caixa]
+            contato[caixa] = _parametro_caixa(
+                p0[s[caixa]],
+                p1[s[caixa]],
+                self.caixa_min[kc] - folga,
+                self.caixa_max[kc] + folga,
+            )
+        if (~caixa).any():
+            tri = self.triangulos[k[~caixa] - self.n_caixas]
+            a, b = p0[s[~caixa]], p1[s[~caixa]]
+            t = _parametro_triangulo(a, b, tri[:, 0], tri[:, 1], tri[:, 2])
+            if folga > 0:
+                dist, t_perto = _aproximacao_triangulo(
+                    a, b, tri[:, 0], tri[:, 1], tri[:, 2]
+                )
+                t = np.where(np.isinf(t) & (dist <= folga), t_perto, t)
+            contato[~caixa] = t
+
+        resultado = np.full(len(p0), -1, dtype=int)
+        # contato mais próximo de p0; empate -> menor índice de primitiva
+        colide = np.isfinite(contato)
+        s, k, contato = s[colide], k[colide], contato[colide]
+        ordem = np.lexsort((k, contato, s))
+        s, k = s[ordem], k[ordem]
+        primeiro = np.r_[True, s[1:] != s[:-1]] if len(s) else np.zeros(0, dtype=bool)
+        resultado[s[primeiro]] = k[primeiro]
+        return resultado
+
+
+def ler_obj(caminho):
+    """Triângulos de um arquivo OBJ (faces trianguladas em leque) e nomes."""
+    vertices, triangulos, nomes = [], [], []
+    nome = os.path.splitext(os.path.basename(caminho))[0]
+    with open(caminho, encoding="utf-8") as f:
+        for linha in f:
+            partes = linha.split()
+            if not partes:
+                continue
+            if partes[0] == "v":
+                vertices.append([float(c) for c in partes[1:4]])
+            elif partes[0] in ("o", "g") and len(partes) > 1:
+                nome = partes[1]
+            elif partes[0] == "f":
+                idx = [int(p.split("/")[0]) for p in partes[1:]]
+                idx = [i - 1 if i > 0 else len(vertices) + i for i in idx]
+                for a, b in zip(idx[1:-1], idx[2:]):
+                    triangulos.append([vertices[idx[0]], vertices[a], vertices[b]])
+                    nomes.append(nome)
+    return np.array(triangulos, dtype=float).reshape(-1, 3, 3), nomes
+
+
+# =====================================================
+# VARREDURA DE GIRO × RAIO
+# =====================================================
+
+
+@dataclass
+class ResultadoInterferencia:
+    raios: np.ndarray  # (n_raios,) m
+    giros: np.ndarray  # (n_giros,) graus
+    obstaculo: np.ndarray  # (n_raios, n_giros) índice da primitiva ou -1
+    elemento: np.ndarray  # (n_raios, n_giros) "lanca", "carga" ou ""
+    nomes: np.ndarray  # nome de cada primitiva
+
+    @property
+    def colide(self):
+        return self.obstaculo >= 0
+
+    def nome_obstaculo(self):
+        """(n_raios, n_giros) nome do obstáculo atingido ou ''."""
+        nomes = np.append(self.nomes, "")
+        return nomes[np.where(self.colide, self.obstaculo, -1)]
+
+
+def segmentos_icamento(pivo, lanca, raios, giros, altura_carga=0.0):
+    """
+    Segmentos da lança (pivô -> ponta) e do cabo com a carga (ponta ->
+    altura_carga) para a grade raios × giros: 4 arrays (n_raios, n_giros, 3).
+    """
+    raios = np.asarray(raios, dtype=float)[:, None]
+    giros = np.asarray(giros, dtype=float)[None, :]
+    pivo = np.asarray(pivo, dtype=float)
+    ponta = pivo + ponta_lanca(raios, lanca, giros)
+    base = pivo + np.zeros_like(ponta)
+    gancho = ponta.copy()
+    gancho[..., 2] = np.minimum(altura_carga, ponta[..., 2])
+    return base, ponta, ponta, gancho
+
+
+def verificar_interferencias(
+    obstaculos, pivo, lanca, raios, giros, altura_carga=0.0, folga=0.0
+):
+    """
+    obstaculos:   Obstaculos
+    pivo:         (3,) pé da lança (o mesmo ponto usado em plot_lanca_3d)
+    lanca:        comprimento [m]
+    raios, giros: eixos da varredura [m], [graus]
+    altura_carga: cota mais baixa da carga pendurada [m]
+    folga:        distância mínima exigida dos obstáculos [m]
+    """
+    raios = np.asarray(raios, dtype=float)
+    giros = np.asarray(giros, dtype=float)
+    b0, b1, c0, c1 = segmentos_icamento(pivo, lanca, raios, giros, altura_carga)
+    forma = b0.shape[:-1]
+
+    hit_lanca = obstaculos.intersecoes(b0.reshape(-1, 3), b1.reshape(-1, 3), folga)
+    hit_carga = obstaculos.intersecoes(c0.reshape(-1, 3), c1.reshape(-1, 3), folga)
+    obstaculo = np.where(hit_lanca >= 0, hit_lanca, hit_carga).reshape(forma)
+    elemento = np.where(
+        hit_lanca >= 0, ELEMENTOS[0], np.where(hit_carga >= 0, ELEMENTOS[1], "")
+    ).reshape(forma)
+
+    return ResultadoInterferencia(
+        raios=raios,
+        giros=giros,
+        obstaculo=obstaculo,
+        elemento=elemento,
+        nomes=obstaculos.nomes,
+    )
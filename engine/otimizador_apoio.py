@@ -0,0 +1,159 @@
+# engine/otimizador_apoio.py
+"""
+Otimização de contrapeso e área das sapatas sobre a envoltória de giro.
+
+Para um arranjo de patolas, lança e carga fixos, procura a combinação
+(contrapeso, área da sapata) de menor custo que mantém todas as reações
+positivas e a pressão em todas as sapatas abaixo da admissível em qualquer
+ângulo de giro.
+
+A área não entra nas reações (só divide a pressão), então cada contrapeso
+é resolvido uma única vez para todos os ângulos e as áreas são filtradas
+depois:
+
+- contrapeso instável (alguma reação <= 0)   -> todas as áreas descartadas
+- área < max(R) / pressão admissível          -> descartada sem avaliação
+
+Os contrapesos são avaliados em blocos, em paralelo (threads: o produto
+matricial do NumPy libera o GIL), do mais barato para o mais caro; blocos
+cujo custo mínimo possível já supera a melhor solução encontrada não chegam
+a ser resolvidos.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+
+N_SAPATAS = 4
+
+
+@dataclass
+class ResultadoOtimizacao:
+    melhor: pd.Series | None  # Contrapeso, Area, Custo, Reacao_min, Pressao_max
+    candidatos: pd.DataFrame  # uma linha por (contrapeso, área) com Status
+    pressao_admissivel: float  # Pa
+
+    @property
+    def viaveis(self):
+        return self.candidatos[self.candidatos["Status"] == "ok"]
+
+
+def _extremos_reacoes(base, contrapesos, angulos):
+    """Menor e maior reação vertical [N] de cada contrapeso no giro."""
+    p = dict(base)
+    p["contrapeso"] = contrapesos[:, None]
+    p["angulo_giro_deg"] = angulos[None, :]
+    R = calc_reactions_lote(**p)[..., 2:]
+    return R.min(axis=(-2, -1)), R.max(axis=(-2, -1))
+
+
+def otimizar_apoio(
+    entrada,
+    contrapesos,
+    areas,
+    angulos=None,
+    pressao_admissivel=None,
+    custo_contrapeso=1.0,
+    custo_area=1.0,
+    tamanho_bloco=64,
+    n_threads=None,
+):
+    """
+    entrada:            EntradaGuindaste (arranjo, lança, cargas, vento)
+    contrapesos:        opções de contrapeso [ton]
+    areas:              opções de área por sapata [m²]
+    angulos:            envoltória de giro [graus]; padrão 0..359
+    pressao_admissivel: [Pa]; padrão solo["soil_adm"]
+    custo_*:            custo = custo_contrapeso × ton + custo_area × 4 × área
+    n_threads:          None -> os.cpu_count(); 1 -> uma thread
+    """
+    if pressao_admissivel is None:
+        if "soil_adm" not in entrada.solo:
+            raise ValueError("Pressão admissível não informada")
+        pressao_admissivel = float(entrada.solo["soil_adm"])
+
+    contrapesos = np.unique(np.asarray(contrapesos, dtype=float))
+    areas = np.unique(np.asarray(areas, dtype=float))
+    if angulos is None:
+        angulos = np.arange(0.0, 360.0, 1.0)
+    angulos = np.asarray(angulos, dtype=float)
+
+    base = parametros_entrada(entrada)
+    n_threads = n_threads or os.cpu_count() or 1
+
+    # contrapesos em ordem crescente de custo (custo_contrapeso >= 0)
+    ordem = np.argsort(custo_contrapeso * contrapesos, kind="stable")
+    contrapesos = contrapesos[ordem]
+    custo_minimo_area = custo_area * N_SAPATAS * areas[0]
+
+    n_cp = len(contrapesos)
+    reacao_min = np.full(n_cp, np.nan)
+    reacao_max = np.full(n_cp, np.nan)
+    melhor_custo = np.inf
+
+    blocos = [
+        slice(i, min(i + tamanho_bloco, n_cp)) for i in range(0, n_cp, tamanho_bloco)
+    ]
+    por_onda = max(1, min(n_threads, len(blocos)))
+
+    with ThreadPoolExecutor(max_workers=por_onda) as pool:
+        for k in range(0, len(blocos), por_onda):
+            onda = blocos[k : k + por_onda]
+
+            # poda: o bloco mais barato da onda já não melhora a solução
+            custo_onda = custo_contrapeso * contrapesos[onda[0].start]
+            if custo_onda + custo_minimo_area >= melhor_custo:
+                break
+
+            resultados = pool.map(
+                lambda s: _extremos_reacoes(base, contrapesos[s], angulos), onda
+            )
+            for s, (rmin, rmax) in zip(onda, resultados):
+                reacao_min[s] = rmin
+                reacao_max[s] = rmax
+
+            estavel = reacao_min > 0
+            area_min = reacao_max / pressao_admissivel
+            idx = np.searchsorted(areas, area_min[estavel], side="left")
+            tem_area = idx < len(areas)
+            if tem_area.any():
+                custos = (
+                    custo_contrapeso * contrapesos[estavel][tem_area]
+                    + custo_area * N_SAPATAS * areas[idx[tem_area]]
+                )
+                melhor_custo = min(melhor_custo, custos.min())
+
+    # Tabela de todos os candidatos
+    CP, AR = np.meshgrid(contrapesos, areas, indexing="ij")
+    RMIN = np.broadcast_to(reacao_min[:, None], CP.shape)
+    RMAX = np.broadcast_to(reacao_max[:, None], CP.shape)
+    pressao = RMAX / AR
+
+    status = np.full(CP.shape, "ok", dtype=object)
+    status[pressao > pressao_admissivel] = "solo"
+    status[RMIN <= 0] = "instavel"
+    status[np.isnan(RMIN)] = "podado"
+
+    candidatos = pd.DataFrame(
+        {
+            "Contrapeso": CP.ravel(),
+            "Area": AR.ravel(),
+            "Custo": (custo_contrapeso * CP + custo_area * N_SAPATAS * AR).ravel(),
+            "Reacao_min": RMIN.ravel(),
+            "Pressao_max": pressao.ravel(),
+            "Status": status.ravel(),
+        }
+    ).sort_values(["Custo", "Contrapeso"], ignore_index=True)
+
+    viaveis = candidatos[candidatos["Status"] == "ok"]
+    melhor = viaveis.iloc[0] if len(viaveis) else None
+
+    return ResultadoOtimizacao(
+        melhor=melhor,
+        candidatos=candidatos,
+        pressao_admissivel=pressao_admissivel,
+    )
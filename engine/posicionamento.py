@@ -0,0 +1,179 @@
+# engine/posicionamento.py
+"""
+Posicionamento do guindaste em uma grade de posições candidatas do canteiro.
+
+Para cada posição (centro de giro) e cada ponto de içamento:
+
+- raio e ângulo de giro a partir das coordenadas do canteiro
+- lança necessária: comprimento da tabela com menor utilização entre os que
+  alcançam o raio e a altura do gancho
+- utilização da tabela de carga (carga / capacidade)
+- reações nas patolas (solver em lote com a geometria fixa)
+
+Tudo em arrays (posições × pontos); posições podem ser divididas em lotes
+e distribuídas em um pool de processos.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+
+
+@dataclass
+class ResultadoPosicionamento:
+    x: np.ndarray  # (nx,) m
+    y: np.ndarray  # (ny,) m
+    utilizacao: np.ndarray  # (ny, nx) maior utilização entre os pontos
+    viavel: np.ndarray  # (ny, nx) todos os pontos atendidos
+    ponto_critico: np.ndarray  # (ny, nx) índice do ponto que governa
+    raio: np.ndarray  # (ny, nx, n_pontos) m
+    lanca: np.ndarray  # (ny, nx, n_pontos) m, NaN se nenhuma lança atende
+    utilizacao_tabela: np.ndarray  # (ny, nx, n_pontos)
+    reacao_min: np.ndarray  # (ny, nx) N, no pior ponto
+
+    def melhor_posicao(self):
+        """(x, y, utilização) da posição viável de menor utilização."""
+        if not self.viavel.any():
+            return None
+        u = np.where(self.viavel, self.utilizacao, np.inf)
+        j, i = np.unravel_index(np.argmin(u), u.shape)
+        return float(self.x[i]), float(self.y[j]), float(u[j, i])
+
+
+def _avaliar_posicoes(base, curva, pontos, centros, rumo_deg, capacidade_sapata):
+    """
+    centros: (n, 2) -> raio, lanca, utilizacao_tabela (n, m),
+    reacao_min e utilizacao_solo (n, m)
+    """
+    dx = pontos[:, 0] - centros[:, 0, None]
+    dy = pontos[:, 1] - centros[:, 1, None]
+    raio = np.hypot(dx, dy)
+    giro = np.degrees(np.arctan2(dy, dx)) - rumo_deg
+
+    # lanças candidatas no último eixo: (n, m, n_lancas)
+    lancas = curva.lancas
+    alcance = np.hypot(raio, pontos[:, 3])
+    alcanca = (lancas >= alcance[..., None]) & (raio[..., None] <= curva.raio.max())
+
+    # interpolação 2D só nas combinações que alcançam o ponto
+    cap = np.full(alcanca.shape, np.nan)
+    R_b, L_b = np.broadcast_arrays(raio[..., None], lancas)
+    cap[alcanca] = curva.capacidade(R_b[alcanca], L_b[alcanca])
+    ok = alcanca & (cap > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        util = np.where(ok, pontos[:, 2, None] / cap, np.inf)
+
+    melhor = util.argmin(axis=-1)
+    util_tabela = np.take_along_axis(util, melhor[..., None], axis=-1)[..., 0]
+    lanca = np.where(np.isfinite(util_tabela), lancas[melhor], np.nan)
+
+    # reações só onde existe lança; demais casos ficam NaN
+    p = dict(base)
+    p["raio"] = np.where(np.isfinite(lanca), raio, 0.0)
+    p["lanca"] = np.where(np.isfinite(lanca), lanca, 1.0)
+    p["angulo_giro_deg"] = giro
+    p["carga"] = pontos[:, 2]
+    R = calc_reactions_lote(**p)[..., 2:]
+    reacao_min = np.where(np.isfinite(lanca), R.min(axis=-1), np.nan)
+    util_solo = R.max(axis=-1) / capacidade_sapata
+
+    return raio, lanca, util_tabela, reacao_min, util_solo
+
+
+def avaliar_posicoes(
+    entrada,
+    curva,
+    pontos,
+    x,
+    y,
+    rumo_deg=0.0,
+    pressao_admissivel=None,
+    tamanho_lote=2_000,
+    n_processos=1,
+):
+    """
+    entrada:  EntradaGuindaste (patolas, centro de massa, pesos, vento, solo);
+              lança, raio, giro e cargas são substituídos pelos de cada caso
+    curva:    CurvaCarga do guindaste
+    pontos:   DataFrame com X, Y [m], Carga [ton] e opcionalmente Altura [m]
+              (altura mínima da ponta da lança acima do centro de giro)
+    x, y:     eixos da grade de posições do centro de giro [m]
+    rumo_deg: orientação do chassi no canteiro [graus]
+    n_processos: None -> os.cpu_count(); 1 -> sem pool
+    """
+    base = parametros_entrada(entrada)
+
+    if pressao_admissivel is None and "soil_adm" in entrada.solo:
+        pressao_admissivel = float(entrada.solo["soil_adm"])
+    capacidade_sapata = (
+        pressao_admissivel * float(entrada.solo["soil_area_i"])
+        if pressao_admissivel is not None
+        else np.inf
+    )
+
+    pontos = pd.DataFrame(pontos)
+    altura = pontos["Altura"] if "Altura" in pontos else 0.0
+    arr_pontos = np.column_stack(
+        [
+            pontos["X"].to_numpy(dtype=float),
+            pontos["Y"].to_numpy(dtype=float),
+            pontos["Carga"].to_numpy(dtype=float),
+            np.broadcast_to(np.asarray(altura, dtype=float), len(pontos)),
+        ]
+    )
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    X, Y = np.meshgrid(x, y)
+    centros = np.column_stack([X.ravel(), Y.ravel()])
+
+    n = len(centros)
+    n_lotes = math.ceil(n / tamanho_lote)
+    tarefas = [
+        (
+            base,
+            curva,
+            arr_pontos,
+            centros[i * tamanho_lote : (i + 1) * tamanho_lote],
+            rumo_deg,
+            capacidade_sapata,
+        )
+        for i in range(n_lotes)
+    ]
+
+    n_processos = n_processos or os.cpu_count() or 1
+    if n_processos == 1 or n_lotes == 1:
+        resultados = [_avaliar_posicoes(*t) for t in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_processos, n_lotes)) as pool:
+            resultados = list(pool.map(_avaliar_posicoes, *zip(*tarefas)))
+
+    raio, lanca, util_tabela, reacao_min, util_solo = (
+        np.concatenate(partes) for partes in zip(*resultados)
+    )
+
+    # utilização por ponto: maior entre tabela e solo; tombamento -> inf
+    util = np.maximum(util_tabela, util_solo)
+    util = np.where(reacao_min > 0, util, np.inf)
+    critico = util.argmax(axis=-1)
+    util_pos = util.max(axis=-1)
+    reacao_pior = np.where(np.isnan(reacao_min), -np.inf, reacao_min).min(axis=-1)
+
+    forma = X.shape
+    m = len(pontos)
+    return ResultadoPosicionamento(
+        x=x,
+        y=y,
+        utilizacao=util_pos.reshape(forma),
+        viavel=(util_pos <= 1.0).reshape(forma),
+        ponto_critico=critico.reshape(forma),
+        raio=raio.reshape(forma + (m,)),
+        lanca=lanca.reshape(forma + (m,)),
+        utilizacao_tabela=util_tabela.reshape(forma + (m,)),
+        reacao_min=reacao_pior.reshape(forma),
+    )
@@ -0,0 +1,141 @@
+# engine/pressao_solo.py
+"""
+Pressão no solo sob as sapatas (patolas) a partir das reações.
+
+- Pressão de contato: sapata rígida com carga centrada -> q = R / área.
+  Reação negativa (perda de contato) não gera pressão.
+- Campo de tensões: acréscimo de tensão vertical em uma profundidade z sob
+  sapatas retangulares com carga uniforme (solução de Boussinesq integrada
+  no retângulo, fator de Newmark), somado para as quatro sapatas.
+
+Tudo vetorizado sobre a envoltória de giro: os fatores de influência só
+dependem da geometria e são calculados uma vez; cada ângulo custa um
+produto pelas pressões das sapatas.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import PATOLAS, calc_reactions_lote, parametros_entrada
+
+
+@dataclass
+class EnvoltoriaPressao:
+    angulos: np.ndarray  # (n,) graus
+    reacoes: np.ndarray  # (n, 4) N
+    pressoes: np.ndarray  # (n, 4) Pa
+    area: float  # m²
+    pressao_admissivel: float | None  # Pa
+
+    def resumo(self):
+        """Pico de pressão por sapata, ângulo do pico e utilização."""
+        idx = self.pressoes.argmax(axis=0)
+        pico = self.pressoes.max(axis=0)
+        df = pd.DataFrame(
+            {
+                "Pressao_max": pico,
+                "Giro_pico": self.angulos[idx],
+                "Reacao_min": self.reacoes.min(axis=0),
+            },
+            index=PATOLAS,
+        )
+        if self.pressao_admissivel:
+            df["Utilizacao"] = pico / self.pressao_admissivel
+        return df
+
+
+def pressao_contato(reacoes, area):
+    """q = R / A, sem tração (R < 0 -> 0)."""
+    return np.maximum(np.asarray(reacoes, dtype=float), 0.0) / area
+
+
+def envoltoria_pressao(entrada, angulos=None, pressao_admissivel=None):
+    """Reações e pressões de contato para todos os ângulos de giro."""
+    if angulos is None:
+        angulos = np.arange(0.0, 360.0, 1.0)
+    angulos = np.asarray(angulos, dtype=float)
+
+    p = parametros_entrada(entrada)
+    p["angulo_giro_deg"] = angulos
+    reacoes = calc_reactions_lote(**p)[:, 2:]
+
+    area = float(entrada.solo["soil_area_i"])
+    if pressao_admissivel is None and "soil_adm" in entrada.solo:
+        pressao_admissivel = float(entrada.solo["soil_adm"])
+
+    return EnvoltoriaPressao(
+        angulos=angulos,
+        reacoes=reacoes,
+        pressoes=pressao_contato(reacoes, area),
+        area=area,
+        pressao_admissivel=pressao_admissivel,
+    )
+
+
+def _fator_canto(a, b, z):
+    """
+    Fator de influência de Newmark sob o canto de um retângulo a × b
+    carregado, na profundidade z. Versão com sinal para superposição.
+    """
+    m = np.abs(a) / z
+    n = np.abs(b) / z
+    m2, n2 = m * m, n * n
+    raiz = np.sqrt(m2 + n2 + 1.0)
+    mn = m * n
+    termo1 = (
+        2 * mn * raiz / (m2 + n2 + m2 * n2 + 1.0) * (m2 + n2 + 2.0) / (m2 + n2 + 1.0)
+    )
+    termo2 = np.arctan2(2 * mn * raiz, m2 + n2 + 1.0 - m2 * n2)
+    return np.sign(a) * np.sign(b) * (termo1 + termo2) / (4 * np.pi)
+
+
+def fatores_influencia(centros_xy, lado_x, lado_y, x, y, profundidade):
+    """
+    Fator de influência de cada sapata em cada ponto da malha.
+
+    centros_xy: (4, 2); x: (nx,), y: (ny,) -> (4, ny, nx)
+    Em profundidade 0 o fator é 1 dentro da sapata e 0 fora.
+    """
+    centros_xy = np.asarray(centros_xy, dtype=float)
+    X, Y = np.meshgrid(x, y)
+    x1 = centros_xy[:, 0, None, None] - lado_x / 2 - X
+    x2 = centros_xy[:, 0, None, None] + lado_x / 2 - X
+    y1 = centros_xy[:, 1, None, None] - lado_y / 2 - Y
+    y2 = centros_xy[:, 1, None, None] + lado_y / 2 - Y
+
+    if profundidade <= 0:
+        return ((x1 <= 0) & (x2 >= 0) & (y1 <= 0) & (y2 >= 0)).astype(float)
+
+    z = float(profundidade)
+    return (
+        _fator_canto(x2, y2, z)
+        - _fator_canto(x1, y2, z)
+        - _fator_canto(x2, y1, z)
+        + _fator_canto(x1, y1, z)
+    )
+
+
+def campo_pressao(
+    entrada, envoltoria, profundidade=0.0, lado_x=None, lado_y=None, n_malha=80
+):
+    """
+    Campo de tensão vertical [Pa] na profundidade dada.
+
+    Retorna (x, y, campo) com campo de shape (n_angulos, ny, nx); o máximo
+    sobre o primeiro eixo é a envoltória do giro.
+    Sapatas quadradas de lado sqrt(área) se lado_x/lado_y não forem dados.
+    """
+    lado_x = lado_x or np.sqrt(envoltoria.area)
+    lado_y = lado_y or lado_x
+
+    centros = entrada.patolas[["X", "Y"]].to_numpy(dtype=float)[:4]
+    folga = max(lado_x, lado_y) + 2 * profundidade
+    x = np.linspace(centros[:, 0].min() - folga, centros[:, 0].max() + folga, n_malha)
+    y = np.linspace(centros[:, 1].min() - folga, centros[:, 1].max() + folga, n_malha)
+
+    # pressão uniforme real sob a sapata retangular
+    q = envoltoria.reacoes.clip(min=0.0) / (lado_x * lado_y)
+    I = fatores_influencia(centros, lado_x, lado_y, x, y, profundidade)
+    campo = np.einsum("am,myx->ayx", q, I)
+    return x, y, campo
@@ -0,0 +1,142 @@
+# engine/sensibilidade.py
+"""
+Sensibilidade analítica (Jacobiano) das reações nas patolas.
+
+A matriz A de calc_reactions só depende da geometria das patolas e do
+centro de massa. Carga, raio, giro, contrapeso e vento entram apenas em B,
+então dX/dp = A⁺ dB/dp: as derivadas saem da mesma pseudo-inversa usada
+na solução, sem nova resolução do sistema.
+"""
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import (
+    GRAVIDADE,
+    PATOLAS,
+    matriz_sistema,
+    parametros_entrada,
+    resolver_sistema,
+    vetor_cargas,
+)
+from monitoring.tracing import rastreado
+
+# Parâmetros e unidades das derivadas (reação em N)
+PARAMETROS = {
+    "carga": "N/ton",
+    "raio": "N/m",
+    "angulo_giro_deg": "N/grau",
+    "contrapeso": "N/ton",
+    "vento_i": "N/N",
+    "vento_j": "N/N",
+}
+
+
+def derivadas_vetor_cargas(raio, lanca, angulo_giro_deg, carga, vento_i, vento_j):
+    """dB/dp para cada parâmetro de PARAMETROS: {nome: (..., 7)}"""
+    theta = np.radians(angulo_giro_deg)
+    cos, sin = np.cos(theta), np.sin(theta)
+    r5_i, r5_j = raio * cos, raio * sin
+    r5_k = np.sqrt(np.asarray(lanca, dtype=float) ** 2 - np.asarray(raio) ** 2)
+
+    g = GRAVIDADE * 1000
+    wl_k = np.asarray(carga, dtype=float) * g
+    wv_i = np.asarray(vento_i, dtype=float)
+    wv_j = np.asarray(vento_j, dtype=float)
+    zero = np.zeros(np.broadcast(r5_i, r5_k, wl_k, wv_i, wv_j).shape)
+    um = zero + 1.0
+
+    def vetor(*linhas):
+        return np.stack(np.broadcast_arrays(*linhas), axis=-1)
+
+    def derivada_r5(d_i, d_j, d_k):
+        return vetor(
+            d_k * wv_j + d_j * wl_k,
+            -(d_k * wv_i + d_i * wl_k),
+            d_j * wv_i - d_i * wv_j,
+            zero,
+            zero,
+            zero,
+            zero,
+        )
+
+    grau = np.pi / 180
+    return {
+        "carga": vetor(r5_j * g, -r5_i * g, zero, zero, zero, um * g, zero),
+        "raio": derivada_r5(cos, sin, -raio / r5_k),
+        "angulo_giro_deg": derivada_r5(-r5_j * grau, r5_i * grau, zero),
+        "contrapeso": vetor(zero, zero, zero, zero, zero, um * g, zero),
+        "vento_i": vetor(zero, -r5_k, r5_j, um, zero, zero, zero),
+        "vento_j": vetor(r5_k, zero, -r5_i, zero, um, zero, zero),
+    }
+
+
+def jacobiano_lote(
+    patolas,
+    centro_massa,
+    raio,
+    lanca,
+    angulo_giro_deg,
+    carga,
+    contrapeso,
+    peso_guindaste,
+    vento_i=0.0,
+    vento_j=0.0,
+):
+    """
+    Mesmos argumentos de calc_reactions_lote.
+
+    Retorna (X, J): X com shape (..., 6) e J com shape (..., 6, n_parametros),
+    colunas na ordem de PARAMETROS.
+    """
+    patolas = np.asarray(patolas, dtype=float)
+    centro_massa = np.asarray(centro_massa, dtype=float)
+    A = matriz_sistema(patolas - centro_massa[..., None, :])
+
+    B = vetor_cargas(
+        raio, lanca, angulo_giro_deg, carga, contrapeso, peso_guindaste, vento_i, vento_j
+    )
+    dB = derivadas_vetor_cargas(raio, lanca, angulo_giro_deg, carga, vento_i, vento_j)
+
+    # resolve X e todas as derivadas com uma única fatoração
+    colunas = np.broadcast_arrays(B, *(dB[nome] for nome in PARAMETROS))
+    if A.ndim > 2:
+        A = A[..., None, :, :]
+    solucao = resolver_sistema(A, np.stack(colunas, axis=-2))
+
+    X = solucao[..., 0, :]
+    J = np.swapaxes(solucao[..., 1:, :], -1, -2)
+    return X, J
+
+
+@rastreado()
+def calc_sensibilidade(entrada):
+    """
+    Derivadas das reações verticais P1..P4 em relação a PARAMETROS.
+    Retorna (reacoes: pd.Series [N], sensibilidade: pd.DataFrame).
+    """
+    X, J = jacobiano_lote(**parametros_entrada(entrada))
+    reacoes = pd.Series(X[2:], index=PATOLAS)
+    sens = pd.DataFrame(J[2:], index=PATOLAS, columns=list(PARAMETROS))
+    return reacoes, sens
+
+
+def variacao_linear(reacoes, sensibilidade, **deltas):
+    """
+    Reações estimadas para pequenas variações, sem resolver o sistema:
+    R + J Δp. Exato para carga, contrapeso e vento (B é linear neles).
+    """
+    delta = pd.Series(deltas, dtype=float).reindex(sensibilidade.columns, fill_value=0)
+    return reacoes + sensibilidade @ delta
+
+
+def carga_ate_descolamento(reacoes, sensibilidade):
+    """
+    Carga adicional [ton] até cada patola perder contato (R = 0).
+    As reações são lineares na carga, então o valor é exato.
+    Patolas que só ganham reação com a carga retornam inf.
+    """
+    dR = sensibilidade["carga"]
+    margem = pd.Series(np.inf, index=reacoes.index)
+    perde = dR < 0
+    margem[perde] = -reacoes[perde] / dR[perde]
+    return margem
@@ -0,0 +1,153 @@
+# engine/tandem.py
+"""
+Içamento em tandem (dois guindastes) com divisão de carga acoplada.
+
+A peça é suspensa por dois pontos de içamento, cada um com o cabo vertical
+sob o gancho de um guindaste. Com cabos verticais o equilíbrio da peça
+define a divisão de carga pela projeção do centro de gravidade na linha
+entre os pontos de içamento:
+
+    t  = ((CG - A) · (B - A)) / |B - A|²
+    F1 = W (1 - t),   F2 = W t
+
+A posição de cada gancho define raio e giro de cada guindaste; em cada
+amostra do caminho calcula-se utilização da tabela e reações nas patolas
+dos dois guindastes (solver em lote).
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import PATOLAS, calc_reactions_lote, parametros_entrada
+
+GUINDASTES = ("G1", "G2")
+
+
+@dataclass(frozen=True)
+class GuindasteTandem:
+    entrada: object  # EntradaGuindaste; lança fixa, raio/giro/carga do caminho
+    curva: object = None  # CurvaCarga opcional
+    posicao: tuple = (0.0, 0.0)  # centro de giro no canteiro [m]
+    rumo_deg: float = 0.0  # orientação do chassi no canteiro [graus]
+    acessorios: float = 0.0  # gancho, moitão e lingas [ton]
+
+
+@dataclass(frozen=True)
+class CargaTandem:
+    peso: float  # ton
+    # pontos de içamento no referencial da peça, relativos ao CG: [[x, y], [x, y]]
+    pontos: tuple = field(default=((-1.0, 0.0), (1.0, 0.0)))
+
+
+@dataclass
+class ResultadoTandem:
+    amostras: pd.DataFrame  # colunas (guindaste, grandeza) + caminho
+    viavel: bool
+
+    def alertas(self):
+        """Amostras em que algum guindaste excede a tabela ou descola patola."""
+        cols = [
+            (g, c) for g in GUINDASTES for c in ("Excede_tabela", "Perde_contato")
+        ]
+        return self.amostras[self.amostras[cols].any(axis=1)]
+
+
+def caminho_linear(inicio, fim, n=200):
+    """Caminho do CG da peça: {X, Y, Rumo} -> DataFrame com n amostras."""
+    t = np.linspace(0.0, 1.0, n)
+    return pd.DataFrame(
+        {
+            c: float(inicio[c]) + t * (float(fim[c]) - float(inicio[c]))
+            for c in ("X", "Y", "Rumo")
+        }
+    )
+
+
+def divisao_carga(cg, ponto_a, ponto_b, peso):
+    """
+    Parcelas (F1, F2) [ton] para cabos verticais: arrays (..., 2) -> (...,).
+    CG fora do segmento A-B daria parcela negativa a um guindaste: ValueError.
+    """
+    ab = ponto_b - ponto_a
+    t = np.einsum("...i,...i->...", cg - ponto_a, ab) / np.einsum(
+        "...i,...i->...", ab, ab
+    )
+    if np.any((t < -1e-9) | (t > 1.0 + 1e-9)):  # tolerância de arredondamento
+        raise ValueError(
+            "CG fora do segmento entre os pontos de içamento: "
+            "um guindaste ficaria com carga negativa."
+        )
+    return peso * (1.0 - t), peso * t
+
+
+def calc_tandem(guindastes, carga, caminho):
+    """
+    guindastes: dois GuindasteTandem
+    carga:      CargaTandem
+    caminho:    DataFrame com X, Y [m] do CG da peça e Rumo [graus] da peça
+
+    Sinaliza em cada amostra utilização da tabela > 1 (Excede_tabela) e
+    reação negativa em alguma patola (Perde_contato).
+    """
+    caminho = pd.DataFrame(caminho).reset_index(drop=True)
+    cg = caminho[["X", "Y"]].to_numpy(dtype=float)
+    psi = np.radians(caminho["Rumo"].to_numpy(dtype=float))
+
+    # pontos de içamento no canteiro
+    cos, sin = np.cos(psi), np.sin(psi)
+    rot = np.stack(
+        [np.stack([cos, -sin], -1), np.stack([sin, cos], -1)], axis=-2
+    )  # (n, 2, 2)
+    locais = np.asarray(carga.pontos, dtype=float)
+    ganchos = cg[:, None, :] + np.einsum("nij,pj->npi", rot, locais)  # (n, 2, 2)
+
+    parcelas = divisao_carga(cg, ganchos[:, 0], ganchos[:, 1], carga.peso)
+
+    blocos = {("Caminho", c): caminho[c] for c in caminho.columns}
+    viavel = True
+    for k, (nome, g) in enumerate(zip(GUINDASTES, guindastes)):
+        dx = ganchos[:, k, 0] - g.posicao[0]
+        dy = ganchos[:, k, 1] - g.posicao[1]
+        raio = np.hypot(dx, dy)
+        giro = np.degrees(np.arctan2(dy, dx)) - g.rumo_deg
+        peso_gancho = parcelas[k] + g.acessorios
+
+        p = parametros_entrada(g.entrada)
+        lanca = p["lanca"]
+        alcanca = raio <= lanca
+        p["raio"] = np.where(alcanca, raio, 0.0)
+        p["angulo_giro_deg"] = giro
+        p["carga"] = peso_gancho
+        R = calc_reactions_lote(**p)[:, 2:]
+        R = np.where(alcanca[:, None], R, np.nan)
+
+        if g.curva is not None:
+            cap = g.curva.capacidade(raio, lanca)
+        else:
+            cap = np.full(len(raio), np.inf)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            util = np.where(cap > 0, peso_gancho / cap, np.inf)
+
+        # raio além da lança conta como excesso de tabela, não de patola
+        excede = ~(util <= 1.0) | ~alcanca
+        perde = alcanca & ~(R.min(axis=1) > 0)
+        viavel &= not (perde.any() or excede.any())
+
+        blocos.update(
+            {
+                (nome, "Raio"): raio,
+                (nome, "Giro"): giro,
+                (nome, "Carga"): peso_gancho,
+                (nome, "Parcela"): parcelas[k] / carga.peso,
+                (nome, "Capacidade"): cap,
+                (nome, "Utilizacao"): util,
+                **{(nome, pat): R[:, j] for j, pat in enumerate(PATOLAS)},
+                (nome, "Reacao_min"): R.min(axis=1),
+                (nome, "Excede_tabela"): excede,
+                (nome, "Perde_contato"): perde,
+            }
+        )
+
+    amostras = pd.DataFrame(blocos)
+    return ResultadoTandem(amostras=amostras, viavel=bool(viavel))
@@ -0,0 +1,137 @@
+# engine/trajetoria.py
+"""
+Verificação de um içamento ao longo da trajetória, do ponto de pega ao de
+assentamento.
+
+A trajetória é amostrada em giro, raio (levantamento da lança), comprimento
+de lança e altura do gancho. Todas as amostras são verificadas de uma vez:
+utilização da tabela de carga (CurvaCarga, o mesmo interpolador do mapa
+operacional), reações nas patolas (solver em lote) e folga entre o gancho e
+a ponta da lança (R5 de calc_reactions).
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import (
+    PATOLAS,
+    calc_reactions_lote,
+    parametros_entrada,
+    ponta_lanca,
+)
+
+# Grandezas de um estado do içamento
+MOVIMENTOS = (
+    "giro",  # graus
+    "raio",  # m
+    "lanca",  # m
+    "altura",  # m, altura do gancho
+)
+
+
+@dataclass
+class ResultadoTrajetoria:
+    amostras: pd.DataFrame  # uma linha por amostra
+    critico: pd.Series  # amostra que governa (maior utilização)
+
+    @property
+    def viavel(self):
+        return bool(self.amostras["Viavel"].all())
+
+
+def _delta_giro(inicio, fim, sentido):
+    """Variação de giro [graus] conforme o sentido ('curto', 'anti', 'horario')."""
+    d = (fim - inicio) % 360.0
+    if sentido == "anti":
+        return d
+    if sentido == "horario":
+        return d - 360.0 if d else 0.0
+    if sentido == "curto":
+        return d - 360.0 if d > 180.0 else d
+    raise ValueError(f"Sentido de giro inválido: {sentido}")
+
+
+def amostrar_trajetoria(inicio, fim, n=1000, ordem=None, sentido="curto"):
+    """
+    inicio, fim: {movimento: valor} para cada item de MOVIMENTOS
+    n:           amostras (por fase, quando há ordem)
+    ordem:       None -> todos os movimentos simultâneos e lineares;
+                 sequência de movimentos -> um de cada vez, nessa ordem
+                 (os que não aparecem ficam no valor inicial até o fim)
+
+    Retorna DataFrame com a coluna s (0..1 ao longo do caminho) e os
+    movimentos.
+    """
+    a = {m: float(inicio[m]) for m in MOVIMENTOS}
+    d = {m: float(fim[m]) - a[m] for m in MOVIMENTOS}
+    d["giro"] = _delta_giro(a["giro"], float(fim["giro"]), sentido)
+
+    t = np.linspace(0.0, 1.0, n)
+    if ordem is None:
+        valores = {m: a[m] + t * d[m] for m in MOVIMENTOS}
+    else:
+        fases = list(ordem) + [m for m in MOVIMENTOS if m not in ordem]
+        valores = {m: [] for m in MOVIMENTOS}
+        atual = dict(a)
+        for fase in fases:
+            for m in MOVIMENTOS:
+                if m == fase:
+                    valores[m].append(atual[m] + t * d[m])
+                else:
+                    valores[m].append(np.full(n, atual[m]))
+            atual[fase] += d[fase]
+        valores = {m: np.concatenate(v) for m, v in valores.items()}
+
+    df = pd.DataFrame(valores)
+    df.insert(0, "s", np.linspace(0.0, 1.0, len(df)))
+    return df
+
+
+def verificar_trajetoria(
+    entrada, curva, inicio, fim, n=1000, ordem=None, sentido="curto"
+):
+    """
+    entrada: EntradaGuindaste (patolas, pesos, cargas, vento); lança, raio e
+             giro vêm da trajetória
+    curva:   CurvaCarga do guindaste (ex.: OperationalMapComponent.curva)
+
+    Uma amostra é viável com utilização da tabela <= 1, todas as reações
+    positivas e gancho abaixo da ponta da lança.
+    """
+    amostras = amostrar_trajetoria(inicio, fim, n=n, ordem=ordem, sentido=sentido)
+    raio = amostras["raio"].to_numpy()
+    lanca = amostras["lanca"].to_numpy()
+    giro = amostras["giro"].to_numpy()
+
+    p = parametros_entrada(entrada)
+    p["raio"] = raio
+    p["lanca"] = lanca
+    p["angulo_giro_deg"] = giro
+    R = calc_reactions_lote(**p)[:, 2:]
+
+    cap = curva.capacidade(raio, lanca)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        util = np.where(cap > 0, p["carga"] / cap, np.inf)
+
+    ponta = ponta_lanca(raio, lanca, giro)
+    amostras["Ponta_X"] = ponta[:, 0]
+    amostras["Ponta_Y"] = ponta[:, 1]
+    amostras["Ponta_Z"] = ponta[:, 2]
+    amostras["Capacidade"] = cap
+    amostras["Utilizacao"] = util
+    for k, nome in enumerate(PATOLAS):
+        amostras[nome] = R[:, k]
+    amostras["Reacao_min"] = R.min(axis=1)
+    amostras["Folga_gancho"] = ponta[:, 2] - amostras["altura"]
+    amostras["Viavel"] = (
+        (amostras["Utilizacao"] <= 1.0)
+        & (amostras["Reacao_min"] > 0)
+        & (amostras["Folga_gancho"] >= 0)
+    )
+
+    # governa: maior utilização; empate (ex.: inf) desfeito pela menor reação
+    ordem_criticidade = np.lexsort((amostras["Reacao_min"], -amostras["Utilizacao"]))
+    critico = amostras.iloc[ordem_criticidade[0]]
+
+    return ResultadoTrajetoria(amostras=amostras, critico=critico)
@@ -0,0 +1,139 @@
+# engine/varredura.py
+"""
+Varredura de dois parâmetros de entrada em uma grade.
+
+Qualquer par dos parâmetros de calc_reactions_lote (carga, raio, lança,
+giro, contrapeso, vento...) vira os eixos de uma grade; a grade inteira é
+resolvida em uma única chamada em lote. Como patolas e centro de massa não
+variam, a pseudo-inversa é calculada uma vez e cada ponto custa um produto
+matriz-vetor, então uma grade 200 × 200 sai em poucos milissegundos.
+
+Por ponto:
+- reações P1..P4 e a mínima (perda de contato se < 0)
+- utilização da sapata: maior reação / (pressão admissível × área)
+- utilização da tabela de carga: carga / capacidade no raio e lança
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+
+# parâmetro -> rótulo do eixo
+PARAMETROS_VARREDURA = {
+    "carga": "Carga [ton]",
+    "raio": "Raio [m]",
+    "lanca": "Lança [m]",
+    "angulo_giro_deg": "Giro [°]",
+    "contrapeso": "Contrapeso [ton]",
+    "peso_guindaste": "Peso do guindaste [ton]",
+    "vento_i": "Vento i (X) [N]",
+    "vento_j": "Vento j (Y) [N]",
+}
+
+
+@dataclass
+class ResultadoVarredura:
+    parametro_x: str
+    parametro_y: str
+    x: np.ndarray  # (nx,)
+    y: np.ndarray  # (ny,)
+    reacoes: np.ndarray  # (ny, nx, 4) N, NaN fora do domínio (raio > lança)
+    utilizacao_sapata: np.ndarray  # (ny, nx), NaN sem pressão admissível
+    utilizacao_tabela: np.ndarray  # (ny, nx), NaN sem tabela ou fora dela
+
+    @property
+    def reacao_min(self):
+        return self.reacoes.min(axis=-1)
+
+    @property
+    def utilizacao(self):
+        """Utilização que governa (sapata ou tabela) em cada ponto."""
+        return np.fmax(self.utilizacao_sapata, self.utilizacao_tabela)
+
+    def resumo(self):
+        """Só o que os mapas usam, em float32: ~1/4 da memória para guardar."""
+        return ResumoVarredura(
+            parametro_x=self.parametro_x,
+            parametro_y=self.parametro_y,
+            x=self.x,
+            y=self.y,
+            reacao_min=self.reacao_min.astype(np.float32),
+            utilizacao_sapata=self.utilizacao_sapata.astype(np.float32),
+            utilizacao_tabela=self.utilizacao_tabela.astype(np.float32),
+        )
+
+
+@dataclass
+class ResumoVarredura:
+    parametro_x: str
+    parametro_y: str
+    x: np.ndarray  # (nx,)
+    y: np.ndarray  # (ny,)
+    reacao_min: np.ndarray  # (ny, nx) N, float32
+    utilizacao_sapata: np.ndarray  # (ny, nx), float32
+    utilizacao_tabela: np.ndarray  # (ny, nx), float32
+
+    utilizacao = ResultadoVarredura.utilizacao
+
+
+def varrer(
+    entrada,
+    parametro_x,
+    valores_x,
+    parametro_y,
+    valores_y,
+    curva=None,
+    pressao_admissivel=None,
+):
+    """
+    entrada:                 EntradaGuindaste com os demais parâmetros fixos
+    parametro_x/_y:          chaves de PARAMETROS_VARREDURA (diferentes)
+    valores_x/_y:            eixos da grade
+    curva:                   CurvaCarga opcional para a utilização da tabela
+    pressao_admissivel:      [Pa]; padrão solo["soil_adm"] se existir
+    """
+    for parametro in (parametro_x, parametro_y):
+        if parametro not in PARAMETROS_VARREDURA:
+            raise ValueError(f"Parâmetro de varredura inválido: {parametro}")
+    if parametro_x == parametro_y:
+        raise ValueError("Os dois eixos da varredura devem ser diferentes.")
+
+    x = np.asarray(valores_x, dtype=float)
+    y = np.asarray(valores_y, dtype=float)
+
+    p = parametros_entrada(entrada)
+    p[parametro_x] = x[None, :]
+    p[parametro_y] = y[:, None]
+
+    fora = np.broadcast_to(p["raio"] > p["lanca"], (y.size, x.size))
+    with np.errstate(invalid="ignore"):
+        reacoes = calc_reactions_lote(**p)[..., 2:]
+    reacoes = np.where(fora[..., None], np.nan, reacoes)
+
+    if pressao_admissivel is None and "soil_adm" in entrada.solo:
+        pressao_admissivel = float(entrada.solo["soil_adm"])
+    if pressao_admissivel:
+        capacidade = pressao_admissivel * float(entrada.solo["soil_area_i"])
+        utilizacao_sapata = reacoes.max(axis=-1) / capacidade
+    else:
+        utilizacao_sapata = np.full(fora.shape, np.nan)
+
+    utilizacao_tabela = np.full(fora.shape, np.nan)
+    if curva is not None:
+        raio, lanca, carga = (
+            np.broadcast_to(p[k], fora.shape) for k in ("raio", "lanca", "carga")
+        )
+        cap = curva.capacidade(raio, lanca)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            utilizacao_tabela = np.where(cap > 0, carga / cap, np.nan)
+
+    return ResultadoVarredura(
+        parametro_x=parametro_x,
+        parametro_y=parametro_y,
+        x=x,
+        y=y,
+        reacoes=reacoes,
+        utilizacao_sapata=utilizacao_sapata,
+        utilizacao_tabela=utilizacao_tabela,
+    )
@@ -0,0 +1,164 @@
+# engine/vento.py
+"""
+Forças de vento na lança e na carga a partir da velocidade de projeto.
+
+- perfil de velocidade com a altura (lei de potência):
+      V(z) = V_ref (z / z_ref) ^ alfa,   q(z) = ½ ρ V(z)²
+- lança dividida em segmentos retos do pé (centro de massa) à ponta; em cada
+  segmento F = q(z) Cd A sen φ, com φ o ângulo entre o vento e o eixo da
+  lança (só a componente transversal do vento carrega o segmento)
+- carga: F = q(z_carga) Cd A, transmitida à ponta pelo cabo
+
+Todas as forças têm a direção do vento, então a resultante fica sobre o
+eixo da lança, na fração s_c = Σ F_i s_i / Σ F_i de R5 (carga em s = 1).
+Ela entra no solver em lote como vento_i / vento_j com fator_vento = s_c,
+vetorizado em direções de vento × ângulos de giro.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import PATOLAS, calc_reactions_lote, parametros_entrada
+
+DENSIDADE_AR = 1.25  # kg/m³
+
+
+@dataclass(frozen=True)
+class PerfilVento:
+    velocidade: float  # m/s na altura de referência
+    altura_referencia: float = 10.0  # m
+    expoente: float = 0.14  # terreno aberto
+
+    def velocidade_em(self, z):
+        z = np.maximum(np.asarray(z, dtype=float), 1e-3)
+        return self.velocidade * (z / self.altura_referencia) ** self.expoente
+
+    def pressao(self, z):
+        """Pressão dinâmica q(z) [Pa]."""
+        return 0.5 * DENSIDADE_AR * self.velocidade_em(z) ** 2
+
+
+@dataclass
+class ForcaVento:
+    fx: np.ndarray  # (n_direcoes, n_giros) N
+    fy: np.ndarray  # (n_direcoes, n_giros) N
+    fator: np.ndarray  # (n_direcoes, n_giros) ponto de aplicação / R5
+    forca_lanca: np.ndarray  # (n_direcoes, n_giros) N
+    forca_carga: np.ndarray  # (n_direcoes, n_giros) N
+
+
+@dataclass
+class ResultadoVento:
+    direcoes: np.ndarray  # (n_direcoes,) graus
+    giros: np.ndarray  # (n_giros,) graus
+    forcas: ForcaVento
+    reacoes: np.ndarray  # (n_direcoes, n_giros, 4) N
+    pior: pd.Series  # Direcao, Giro, Patola, Reacao_min, Forca_vento
+
+    @property
+    def reacao_min(self):
+        return self.reacoes.min(axis=-1)
+
+
+def forcas_vento(
+    entrada,
+    perfil,
+    direcoes,
+    giros,
+    areas_lanca,
+    cd_lanca=1.2,
+    area_carga=None,
+    cd_carga=2.4,
+    altura_carga=None,
+):
+    """
+    entrada:      EntradaGuindaste (centro de massa, lança, raio, cargas)
+    perfil:       PerfilVento
+    direcoes:     direção para onde o vento sopra [graus], no referencial
+                  do guindaste
+    giros:        ângulos de giro [graus]
+    areas_lanca:  área projetada [m²] de cada segmento, do pé à ponta
+                  (segmentos de mesmo comprimento)
+    area_carga:   área projetada da carga [m²]; padrão 0,0005 m²/kg
+    altura_carga: cota do centro da carga [m]; padrão altura da ponta
+    """
+    p = parametros_entrada(entrada)
+    raio, lanca = p["raio"], p["lanca"]
+    z_pe = float(p["centro_massa"][2])
+    h = np.sqrt(lanca**2 - raio**2)
+
+    direcoes = np.radians(np.asarray(direcoes, dtype=float))[:, None]
+    giros = np.radians(np.asarray(giros, dtype=float))[None, :]
+
+    # lança: segmentos com centro em s_i
+    areas_lanca = np.asarray(areas_lanca, dtype=float)
+    n = len(areas_lanca)
+    s = (np.arange(n) + 0.5) / n
+    q = perfil.pressao(z_pe + s * h)  # (n,)
+    cos_phi = (raio / lanca) * np.cos(giros - direcoes)
+    sen_phi = np.sqrt(np.maximum(1.0 - cos_phi**2, 0.0))
+    f_seg = (q * cd_lanca * areas_lanca) * sen_phi[..., None]  # (nd, ng, n)
+    forca_lanca = f_seg.sum(axis=-1)
+    momento_lanca = (f_seg * s).sum(axis=-1)
+
+    # carga
+    if area_carga is None:
+        area_carga = 0.0005 * p["carga"] * 1000.0
+    if altura_carga is None:
+        altura_carga = z_pe + h
+    forca_carga = np.broadcast_to(
+        perfil.pressao(altura_carga) * cd_carga * area_carga, forca_lanca.shape
+    )
+
+    total = forca_lanca + forca_carga
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fator = np.where(total > 0, (momento_lanca + forca_carga) / total, 1.0)
+
+    return ForcaVento(
+        fx=total * np.cos(direcoes),
+        fy=total * np.sin(direcoes),
+        fator=fator,
+        forca_lanca=forca_lanca,
+        forca_carga=np.array(forca_carga),
+    )
+
+
+def pior_direcao_vento(
+    entrada, perfil, areas_lanca, direcoes=None, giros=None, **kwargs
+):
+    """
+    Reações em todas as combinações direção do vento × giro em uma única
+    solução em lote; retorna a combinação com a menor reação.
+    kwargs: repassados para forcas_vento (cd_lanca, area_carga, ...).
+    """
+    if direcoes is None:
+        direcoes = np.arange(0.0, 360.0, 5.0)
+    if giros is None:
+        giros = np.arange(0.0, 360.0, 5.0)
+    direcoes = np.asarray(direcoes, dtype=float)
+    giros = np.asarray(giros, dtype=float)
+
+    f = forcas_vento(entrada, perfil, direcoes, giros, areas_lanca, **kwargs)
+
+    p = parametros_entrada(entrada)
+    p["angulo_giro_deg"] = giros[None, :]
+    p["vento_i"] = f.fx
+    p["vento_j"] = f.fy
+    p["fator_vento"] = f.fator
+    reacoes = calc_reactions_lote(**p)[..., 2:]
+
+    d, g, k = np.unravel_index(np.argmin(reacoes), reacoes.shape)
+    pior = pd.Series(
+        {
+            "Direcao": direcoes[d],
+            "Giro": giros[g],
+            "Patola": PATOLAS[k],
+            "Reacao_min": reacoes[d, g, k],
+            "Forca_vento": np.hypot(f.fx[d, g], f.fy[d, g]),
+        }
+    )
+
+    return ResultadoVento(
+        direcoes=direcoes, giros=giros, forcas=f, reacoes=reacoes, pior=pior
+    )
@@ -29,7 +29,7 @@ class EntradaGuindaste:
 
     # Ações externas
     vento: pd.Series  # Vi, Vj
-    solo: pd.Series  # soil_k, soil_area_i
+    solo: pd.Series  # soil_k, soil_area_i, soil_adm (opcional)
 
     # -----------------------------
     # Validação do modelo
@@ -71,6 +71,8 @@ class EntradaGuindaste:
                 return False
             if self.solo["soil_area_i"] <= 0:
                 return False
+            if "soil_adm" in self.solo and not self.solo["soil_adm"] > 0:
+                return False
 
             # ===== Ângulo =====
             if not (0 <= self.angulo_giro_deg <= 360):
@@ -80,3 +82,28 @@ class EntradaGuindaste:
 
         except (KeyError, TypeError, ValueError):
             return False
+
+
+def construir_entrada(
+    pat, cm, lanca, carga, vento, solo, angulo, pesos
+) -> EntradaGuindaste:
+
+    df_pat = pd.DataFrame(pat).apply(pd.to_numeric, errors="coerce")
+    df_cm = pd.DataFrame(cm).iloc[0]
+    df_lanca = pd.DataFrame(lanca).iloc[0]
+    df_pesos = pd.DataFrame(pesos).iloc[0]
+    df_carga = pd.DataFrame(carga)
+    df_vento = pd.DataFrame(vento).iloc[0]
+    df_solo = pd.DataFrame(solo).iloc[0]
+
+    return EntradaGuindaste(
+        patolas=df_pat,
+        centro_massa=df_cm,
+        lanca=df_lanca,
+        angulo_giro_deg=float(angulo),
+        peso_guindaste=float(df_pesos["Peso_Guindaste"]),
+        contrapeso=float(df_pesos["Contrapeso"]),
+        cargas=df_carga,
+        vento=df_vento,
+        solo=df_solo,
+    )
@@ -0,0 +1,320 @@
+# monitoring/metrics.py
+"""
+Instrumentação dos callbacks do Dash.
+
+Envolve cada registro feito via ``app.callback`` com medição de:
+- latência (histograma em segundos)
+- número de chamadas, erros e chamadas em andamento
+- tamanho das requisições e respostas (bytes)
+- pico de memória via tracemalloc (opcional)
+
+As métricas ficam expostas em texto Prometheus na rota ``/metrics`` do
+``app.server``. Cada worker do gunicorn mantém o seu próprio registro.
+
+Variáveis de ambiente:
+- CRANE_METRICS_TRACEMALLOC=1 -> ativa a medição de pico de memória
+- CRANE_SLOW_CALLBACK_MS=500  -> registra no log callbacks mais lentos que isso
+
+O pico do tracemalloc é global ao processo: com a medição ativa, os
+callbacks do processo rodam um de cada vez (``_lock_memoria``) para que
+o pico de um não inclua as alocações de outro. É um modo de diagnóstico;
+a latência medida nele não vale para produção.
+"""
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+from functools import wraps
+
+import flask
+from dash.dependencies import Output
+from dash.exceptions import PreventUpdate
+
+from monitoring.tracing import span
+
+logger = logging.getLogger(__name__)
+
+BUCKETS_DURACAO = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_BYTES = (1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+
+ROTA_CALLBACK = "_dash-update-component"
+
+# reset_peak/get_traced_memory valem para o processo inteiro
+_lock_memoria = threading.RLock()
+
+
+class Histograma:
+    """Histograma cumulativo no formato Prometheus."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.contagens = [0] * len(self.buckets)
+        self.soma = 0.0
+        self.n = 0
+
+    def observar(self, valor):
+        self.soma += valor
+        self.n += 1
+        for i, limite in enumerate(self.buckets):
+            if valor <= limite:
+                self.contagens[i] += 1
+
+
+class _MetricasCallback:
+    """Contadores de um único callback."""
+
+    def __init__(self):
+        self.chamadas = 0
+        self.erros = 0
+        self.em_andamento = 0
+        self.duracao = Histograma(BUCKETS_DURACAO)
+        self.bytes_requisicao = Histograma(BUCKETS_BYTES)
+        self.bytes_resposta = Histograma(BUCKETS_BYTES)
+        self.memoria_pico = Histograma(BUCKETS_BYTES)
+
+
+class MetricasCallbacks:
+    """
+    Registro das métricas de todos os callbacks instrumentados.
+    Thread-safe: o servidor de desenvolvimento e o gunicorn com threads
+    atendem callbacks em paralelo.
+    """
+
+    def __init__(self, tracemalloc_ativo=False, limite_lento_s=None):
+        self.tracemalloc_ativo = tracemalloc_ativo
+        self.limite_lento_s = limite_lento_s
+        self._lock = threading.Lock()
+        self._callbacks = {}
+
+    @classmethod
+    def do_ambiente(cls):
+        """Cria o registro a partir das variáveis de ambiente CRANE_*."""
+        lento_ms = os.environ.get("CRANE_SLOW_CALLBACK_MS")
+        return cls(
+            tracemalloc_ativo=os.environ.get("CRANE_METRICS_TRACEMALLOC") == "1",
+            limite_lento_s=float(lento_ms) / 1000 if lento_ms else None,
+        )
+
+    def _obter(self, chave):
+        if chave not in self._callbacks:
+            self._callbacks[chave] = _MetricasCallback()
+        return self._callbacks[chave]
+
+    # ---------------------------------------------------------
+    # Registro
+    # ---------------------------------------------------------
+    def inicio(self, chave):
+        with self._lock:
+            self._obter(chave).em_andamento += 1
+
+    def fim(self, chave, duracao, erro=False, bytes_requisicao=None, memoria=None):
+        with self._lock:
+            m = self._obter(chave)
+            m.em_andamento -= 1
+            m.chamadas += 1
+            m.erros += int(erro)
+            m.duracao.observar(duracao)
+            if bytes_requisicao is not None:
+                m.bytes_requisicao.observar(bytes_requisicao)
+            if memoria is not None:
+                m.memoria_pico.observar(memoria)
+
+        if self.limite_lento_s is not None and duracao >= self.limite_lento_s:
+            logger.warning(
+                "Callback lento: %s -> %s levou %.1f ms",
+                chave[0],
+                chave[1],
+                duracao * 1000,
+            )
+
+    def resposta(self, chave, n_bytes):
+        with self._lock:
+            self._obter(chave).bytes_resposta.observar(n_bytes)
+
+    # ---------------------------------------------------------
+    # Exportação
+    # ---------------------------------------------------------
+    def resumo(self):
+        """Retorna {(callback, output): {"chamadas", "erros", "media_s"}}."""
+        with self._lock:
+            return {
+                chave: {
+                    "chamadas": m.chamadas,
+                    "erros": m.erros,
+                    "media_s": m.duracao.soma / m.duracao.n if m.duracao.n else 0.0,
+                }
+                for chave, m in self._callbacks.items()
+            }
+
+    def exportar_prometheus(self):
+        """Texto no formato de exposição Prometheus (versão 0.0.4)."""
+        linhas = []
+
+        def cabecalho(nome, tipo, ajuda):
+            linhas.append(f"# HELP {nome} {ajuda}")
+            linhas.append(f"# TYPE {nome} {tipo}")
+
+        def histograma(nome, ajuda, atributo):
+            cabecalho(nome, "histogram", ajuda)
+            for rotulos, m in itens:
+                h = getattr(m, atributo)
+                if h.n == 0:
+                    continue
+                for limite, contagem in zip(h.buckets, h.contagens):
+                    linhas.append(
+                        f'{nome}_bucket{{{rotulos},le="{limite:g}"}} {contagem}'
+                    )
+                linhas.append(f'{nome}_bucket{{{rotulos},le="+Inf"}} {h.n}')
+                linhas.append(f"{nome}_sum{{{rotulos}}} {h.soma:.9g}")
+                linhas.append(f"{nome}_count{{{rotulos}}} {h.n}")
+
+        with self._lock:
+            itens = [
+                (
+                    f'callback="{_escapar(cb)}",output="{_escapar(out)}"',
+                    m,
+                )
+                for (cb, out), m in sorted(self._callbacks.items())
+            ]
+
+            cabecalho(
+                "dash_callback_calls_total", "counter", "Chamadas de callback."
+            )
+            for rotulos, m in itens:
+                linhas.append(f"dash_callback_calls_total{{{rotulos}}} {m.chamadas}")
+
+            cabecalho(
+                "dash_callback_errors_total", "counter", "Callbacks com exceção."
+            )
+            for rotulos, m in itens:
+                linhas.append(f"dash_callback_errors_total{{{rotulos}}} {m.erros}")
+
+            cabecalho(
+                "dash_callback_inflight", "gauge", "Callbacks em execução agora."
+            )
+            for rotulos, m in itens:
+                linhas.append(f"dash_callback_inflight{{{rotulos}}} {m.em_andamento}")
+
+            histograma(
+                "dash_callback_duration_seconds",
+                "Latência do callback em segundos.",
+                "duracao",
+            )
+            histograma(
+                "dash_callback_request_bytes",
+                "Tamanho do corpo da requisição do callback.",
+                "bytes_requisicao",
+            )
+            histograma(
+                "dash_callback_response_bytes",
+                "Tamanho da resposta do callback.",
+                "bytes_resposta",
+            )
+            if self.tracemalloc_ativo:
+                histograma(
+                    "dash_callback_memory_peak_bytes",
+                    "Pico de memória alocada durante o callback (tracemalloc).",
+                    "memoria_pico",
+                )
+
+        return "\n".join(linhas) + "\n"
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _primeiro_output(args, kwargs):
+    """Procura o primeiro Output nos argumentos de app.callback."""
+    pilha = list(args) + list(kwargs.values())
+    while pilha:
+        item = pilha.pop(0)
+        if isinstance(item, Output):
+            return f"{item.component_id}.{item.component_property}"
+        if isinstance(item, (list, tuple)):
+            pilha = list(item) + pilha
+    return ""
+
+
+def _envolver(func, chave, metricas):
+
+    @wraps(func)
+    def instrumentado(*args, **kwargs):
+        bytes_requisicao = None
+        if flask.has_request_context():
+            bytes_requisicao = flask.request.content_length
+            flask.g.metricas_callback = chave
+
+        medir_memoria = metricas.tracemalloc_ativo and tracemalloc.is_tracing()
+        with _lock_memoria if medir_memoria else nullcontext():
+            if medir_memoria:
+                tracemalloc.reset_peak()
+
+            metricas.inicio(chave)
+            erro = False
+            t0 = time.perf_counter()
+            try:
+                with span(f"callback:{chave[0]}", output=chave[1]):
+                    return func(*args, **kwargs)
+            except PreventUpdate:
+                raise
+            except Exception:
+                erro = True
+                raise
+            finally:
+                duracao = time.perf_counter() - t0
+                memoria = tracemalloc.get_traced_memory()[1] if medir_memoria else None
+                metricas.fim(chave, duracao, erro, bytes_requisicao, memoria)
+
+    return instrumentado
+
+
+def instrumentar_app(app, metricas=None, rota="/metrics"):
+    """
+    Substitui ``app.callback`` por uma versão instrumentada e registra a rota
+    de métricas no servidor Flask. Deve ser chamado antes de qualquer
+    callback ser registrado (ou seja, em app.py).
+    """
+    if metricas is None:
+        metricas = MetricasCallbacks.do_ambiente()
+
+    if metricas.tracemalloc_ativo and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    callback_original = app.callback
+
+    def callback(*args, **kwargs):
+        decorador = callback_original(*args, **kwargs)
+        output = _primeiro_output(args, kwargs)
+
+        def registrar(func):
+            chave = (func.__name__, output)
+            decorador(_envolver(func, chave, metricas))
+            return func
+
+        return registrar
+
+    app.callback = callback
+
+    server = app.server
+
+    @server.after_request
+    def _medir_resposta(response):
+        chave = flask.g.pop("metricas_callback", None)
+        if chave is not None and flask.request.path.endswith(ROTA_CALLBACK):
+            n_bytes = response.calculate_content_length()
+            if n_bytes is not None:
+                metricas.resposta(chave, n_bytes)
+        return response
+
+    @server.route(rota)
+    def _metrics():
+        return flask.Response(
+            metricas.exportar_prometheus(),
+            mimetype="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    app.metricas = metricas
+    return metricas
@@ -0,0 +1,156 @@
+# monitoring/tracing.py
+"""
+Spans de tempo aninhados para o pipeline entrada -> validação -> solução -> gráfico.
+
+Uso:
+    from monitoring.tracing import span
+
+    with span("calc_reactions"):
+        X, *_ = calc_reactions(entrada)
+
+    @rastreado()            # solvers do engine: um span por chamada
+    def calc_reactions(entrada): ...
+
+Desativado (padrão), ``span`` devolve sempre o mesmo contexto nulo e o custo
+é uma checagem de flag. Ativado, cada span vira um evento "X" do formato
+Chrome Trace Event, que pode ser aberto no chrome://tracing ou no Perfetto.
+O aninhamento é inferido pelo próprio visualizador (mesmo pid/tid, intervalos
+contidos).
+
+Variáveis de ambiente:
+- CRANE_TRACE_FILE=trace.json -> ativa na importação e, ao sair, cada processo
+  (workers do servidor, pools) grava o seu arquivo, trace.<pid>.json
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+MAX_EVENTOS = 200_000
+
+_ativo = False
+_eventos = deque(maxlen=MAX_EVENTOS)
+
+
+class _SpanNulo:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_SPAN_NULO = _SpanNulo()
+
+
+class _Span:
+    __slots__ = ("nome", "args", "t0")
+
+    def __init__(self, nome, args):
+        self.nome = nome
+        self.args = args
+
+    def __enter__(self):
+        self.t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, tipo_exc, *exc):
+        t1 = time.perf_counter_ns()
+        evento = {
+            "name": self.nome,
+            "cat": "crane",
+            "ph": "X",
+            "ts": self.t0 / 1000,
+            "dur": (t1 - self.t0) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if self.args or tipo_exc is not None:
+            args = dict(self.args)
+            if tipo_exc is not None:
+                args["erro"] = tipo_exc.__name__
+            evento["args"] = args
+        _eventos.append(evento)
+        return False
+
+
+def span(nome, **args):
+    """Contexto de tempo; ``args`` aparecem no painel de detalhes do visualizador."""
+    if not _ativo:
+        return _SPAN_NULO
+    return _Span(nome, args)
+
+
+def rastreado(nome=None):
+    """Decorador equivalente a envolver a função inteira em ``span``."""
+
+    def decorador(func):
+        nome_span = nome or func.__qualname__
+
+        @wraps(func)
+        def envolvida(*args, **kwargs):
+            if not _ativo:
+                return func(*args, **kwargs)
+            with _Span(nome_span, {}):
+                return func(*args, **kwargs)
+
+        return envolvida
+
+    return decorador
+
+
+def ativar(max_eventos=MAX_EVENTOS):
+    global _ativo, _eventos
+    if _eventos.maxlen != max_eventos:
+        _eventos = deque(_eventos, maxlen=max_eventos)
+    _ativo = True
+
+
+def desativar():
+    global _ativo
+    _ativo = False
+
+
+def esta_ativo():
+    return _ativo
+
+
+def limpar():
+    _eventos.clear()
+
+
+def eventos():
+    """Cópia dos eventos coletados até agora."""
+    return list(_eventos)
+
+
+def exportar_trace(caminho):
+    """Grava os eventos no formato JSON do Chrome Trace Event."""
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(
+            {"traceEvents": eventos(), "displayTimeUnit": "ms"},
+            f,
+        )
+    return caminho
+
+
+def arquivo_do_processo(caminho):
+    """trace.json -> trace.<pid>.json: processos não sobrescrevem uns aos outros."""
+    raiz, extensao = os.path.splitext(caminho)
+    return f"{raiz}.{os.getpid()}{extensao}"
+
+
+def _exportar_ao_sair(caminho):
+    # pid lido na saída: workers criados por fork herdam este registro
+    exportar_trace(arquivo_do_processo(caminho))
+
+
+_arquivo_ambiente = os.environ.get("CRANE_TRACE_FILE")
+if _arquivo_ambiente:
+    ativar()
+    atexit.register(_exportar_ao_sair, _arquivo_ambiente)
@@ -1,4 +1,6 @@
 # calc_patolas.py
+import threading
+
 import numpy as np
 import pandas as pd
 
@@ -9,9 +11,18 @@ from scipy.spatial import ConvexHull
 
 from app import app
 from components.tabela_component import TabelaDadosComponent
-from models.inputs_guindaste import EntradaGuindaste
+from models.inputs_guindaste import EntradaGuindaste, construir_entrada
 #from shapely.geometry import Polygon, Point, LineString
-from engine.calc_reactions import calc_reactions
+from engine.calc_reactions import calc_reactions, ponta_lanca
+from engine.carga_maxima import INVIAVEL, carga_maxima_grade
+from engine.icamento import ResultadoIcamento, calcular_icamento
+from engine.obstaculos import Obstaculos, verificar_interferencias
+from engine.pressao_solo import campo_pressao, envoltoria_pressao
+from engine.varredura import PARAMETROS_VARREDURA, varrer
+from monitoring.tracing import span
+from storage.catalogo import catalogo_padrao
+from storage.resultados import banco_padrao, entrada_canonica, hash_entrada
+from storage.sessao import armazem_do_ambiente, armazem_sessao, diretorio_sessao
 
 # =====================================================
 # FUNÇÕES AUXILIARES
@@ -225,29 +236,209 @@ def plot_lanca_3d(cm, lanca, angulo_deg):
     return fig
 
 
-def construir_entrada(
-    pat, cm, lanca, carga, vento, solo, angulo, pesos
-) -> EntradaGuindaste:
-
-    df_pat = pd.DataFrame(pat).apply(pd.to_numeric, errors="coerce")
-    df_cm = pd.DataFrame(cm).iloc[0]
-    df_lanca = pd.DataFrame(lanca).iloc[0]
-    df_pesos = pd.DataFrame(pesos).iloc[0]
-    df_carga = pd.DataFrame(carga)
-    df_vento = pd.DataFrame(vento).iloc[0]
-    df_solo = pd.DataFrame(solo).iloc[0]
-
-    return EntradaGuindaste(
-        patolas=df_pat,
-        centro_massa=df_cm,
-        lanca=df_lanca,
-        angulo_giro_deg=float(angulo),
-        peso_guindaste=float(df_pesos["Peso_Guindaste"]),
-        contrapeso=float(df_pesos["Contrapeso"]),
-        cargas=df_carga,
-        vento=df_vento,
-        solo=df_solo,
+def plot_obstaculos_3d(fig, obstaculos, pontas=None, interferencia=None, atingidos=()):
+    """
+    Acrescenta ao modelo 3D as caixas de obstáculo (vermelhas se atingidas
+    na posição atual) e as posições da ponta da lança na varredura de giro,
+    coloridas por interferência.
+    """
+    # faces das caixas: vértices (i, j, k) dos 12 triângulos
+    i = [0, 0, 4, 4, 0, 0, 2, 2, 0, 0, 1, 1]
+    j = [1, 2, 5, 6, 1, 5, 3, 7, 3, 7, 2, 6]
+    k = [2, 3, 6, 7, 5, 4, 7, 6, 7, 4, 6, 5]
+
+    for n, caixa in obstaculos.caixas.iterrows():
+        x0, y0, z0 = obstaculos.caixa_min[n]
+        x1, y1, z1 = obstaculos.caixa_max[n]
+        fig.add_trace(
+            go.Mesh3d(
+                x=[x0, x1, x1, x0, x0, x1, x1, x0],
+                y=[y0, y0, y1, y1, y0, y0, y1, y1],
+                z=[z0, z0, z0, z0, z1, z1, z1, z1],
+                i=i,
+                j=j,
+                k=k,
+                color="red" if n in atingidos else "gray",
+                opacity=0.5,
+                name=str(caixa["Nome"]),
+                hovertext=str(caixa["Nome"]),
+                hoverinfo="text",
+            )
+        )
+
+    if interferencia is not None:
+        colide = interferencia.colide[0]
+        fig.add_trace(
+            go.Scatter3d(
+                x=pontas[:, 0],
+                y=pontas[:, 1],
+                z=pontas[:, 2],
+                mode="markers",
+                marker=dict(size=3, color=np.where(colide, "red", "green")),
+                text=interferencia.nome_obstaculo()[0],
+                hovertemplate="%{text}<extra>Varredura de giro</extra>",
+                name="Varredura de giro",
+            )
+        )
+
+    return fig
+
+
+def plot_carga_maxima(resultado):
+    """Heatmap da carga máxima admissível por raio × giro; inviáveis em cinza."""
+
+    inviavel = resultado.criterio == INVIAVEL
+    fig = go.Figure(
+        go.Heatmap(
+            x=resultado.angulos,
+            y=resultado.raios,
+            z=np.where(inviavel, 0.0, np.nan),
+            colorscale=[[0, "lightgray"], [1, "lightgray"]],
+            showscale=False,
+            hovertemplate=(
+                "<b>Giro:</b> %{x:.0f}°<br>"
+                "<b>Raio:</b> %{y:.1f} m<br>"
+                "<b>Inviável:</b> nenhuma carga admissível"
+                "<extra></extra>"
+            ),
+        )
     )
+    fig.add_trace(
+        go.Heatmap(
+            x=resultado.angulos,
+            y=resultado.raios,
+            z=resultado.carga_max,
+            customdata=resultado.criterio,
+            colorscale="Viridis",
+            colorbar=dict(title="Carga máx [ton]"),
+            hovertemplate=(
+                "<b>Giro:</b> %{x:.0f}°<br>"
+                "<b>Raio:</b> %{y:.1f} m<br>"
+                "<b>Carga máx:</b> %{z:.2f} ton<br>"
+                "<b>Governa:</b> %{customdata}"
+                "<extra></extra>"
+            ),
+        )
+    )
+
+    titulo = "Carga Máxima Admissível – Raio × Giro"
+    if inviavel.any():
+        titulo += f" ({int(inviavel.sum())} pontos inviáveis em cinza)"
+    fig.update_layout(
+        title=titulo,
+        xaxis_title="Giro [°]",
+        yaxis_title="Raio [m]",
+        template="plotly_white",
+    )
+
+    return fig
+
+
+def plot_pressao_solo(patolas_df, x, y, campo, lado):
+    """Heatmap da envoltória (máximo no giro) da tensão no solo [kPa]."""
+
+    fig = go.Figure(
+        go.Heatmap(
+            x=x,
+            y=y,
+            z=campo.max(axis=0) / 1e3,
+            colorscale="YlOrRd",
+            colorbar=dict(title="σz [kPa]"),
+            hovertemplate="X %{x:.2f} m<br>Y %{y:.2f} m<br>σz %{z:.1f} kPa<extra></extra>",
+        )
+    )
+
+    # Contorno das sapatas
+    for _, row in patolas_df.iterrows():
+        fig.add_shape(
+            type="rect",
+            x0=row["X"] - lado / 2,
+            x1=row["X"] + lado / 2,
+            y0=row["Y"] - lado / 2,
+            y1=row["Y"] + lado / 2,
+            line=dict(color="black", width=1),
+        )
+
+    fig.update_layout(
+        title="Pressão no Solo – Envoltória do Giro",
+        xaxis_title="X [m]",
+        yaxis_title="Y [m]",
+        template="plotly_white",
+        yaxis=dict(scaleanchor="x", scaleratio=1),
+    )
+
+    return fig
+
+
+def plot_varredura(resultado):
+    """Heatmaps da reação mínima e da utilização na grade da varredura."""
+    rotulo_x = PARAMETROS_VARREDURA[resultado.parametro_x]
+    rotulo_y = PARAMETROS_VARREDURA[resultado.parametro_y]
+    eixos = dict(x=resultado.x, y=resultado.y)
+    layout = dict(xaxis_title=rotulo_x, yaxis_title=rotulo_y, template="plotly_white")
+    hover_xy = f"<b>{rotulo_x}:</b> %{{x:.4g}}<br><b>{rotulo_y}:</b> %{{y:.4g}}<br>"
+
+    # Reação mínima, com a fronteira de perda de contato (R = 0). Os
+    # contornos só precisam dos valores perto da fronteira: recortados, vão
+    # com poucos dígitos e a figura fica bem menor
+    reacao = np.round(resultado.reacao_min / 1e3, 1)
+    fig_reacao = go.Figure(
+        [
+            go.Heatmap(
+                **eixos,
+                z=reacao,
+                colorscale="RdBu",
+                zmid=0,
+                colorbar=dict(title="R mín [kN]"),
+                hovertemplate=hover_xy + "<b>R mín:</b> %{z:.1f} kN<extra></extra>",
+            ),
+            go.Contour(
+                **eixos,
+                z=np.clip(reacao, -1, 1),
+                contours=dict(coloring="none", start=0, end=0, size=1),
+                line=dict(color="black", width=2),
+                showscale=False,
+                hoverinfo="skip",
+                name="Perda de contato",
+            ),
+        ]
+    )
+    fig_reacao.update_layout(title="Reação Mínima nas Patolas", **layout)
+
+    # Utilização que governa (sapata ou tabela), com a fronteira em 100%
+    utilizacao = np.round(resultado.utilizacao, 3)
+    detalhe = np.round(
+        np.stack([resultado.utilizacao_sapata, resultado.utilizacao_tabela], -1), 2
+    )
+    fig_utilizacao = go.Figure(
+        [
+            go.Heatmap(
+                **eixos,
+                z=utilizacao,
+                customdata=detalhe,
+                colorscale="YlOrRd",
+                zmin=0,
+                colorbar=dict(title="Utilização", tickformat=".0%"),
+                hovertemplate=(
+                    hover_xy + "<b>Utilização:</b> %{z:.1%}<br>"
+                    "Sapata: %{customdata[0]:.0%}<br>"
+                    "Tabela: %{customdata[1]:.0%}<extra></extra>"
+                ),
+            ),
+            go.Contour(
+                **eixos,
+                z=np.clip(utilizacao, 0.9, 1.1),
+                contours=dict(coloring="none", start=1, end=1, size=1),
+                line=dict(color="black", width=2),
+                showscale=False,
+                hoverinfo="skip",
+                name="Utilização 100%",
+            ),
+        ]
+    )
+    fig_utilizacao.update_layout(title="Utilização (Sapata ou Tabela)", **layout)
+
+    return fig_reacao, fig_utilizacao
 
 
 def calcular_estabilidade(entrada: EntradaGuindaste) -> str:
@@ -272,6 +463,49 @@ def calcular_estabilidade(entrada: EntradaGuindaste) -> str:
         return "Sistema instável (exemplo)"
 
 
+ROTULOS_SENSIBILIDADE = {
+    "carga": "Carga [N/ton]",
+    "raio": "Raio [N/m]",
+    "angulo_giro_deg": "Giro [N/°]",
+    "contrapeso": "Contrapeso [N/ton]",
+    "vento_i": "Vi [N/N]",
+    "vento_j": "Vj [N/N]",
+}
+
+
+# Faixa sugerida ao escolher o parâmetro de um eixo da varredura
+FAIXAS_VARREDURA = {
+    "carga": (1.0, 30.0),
+    "raio": (2.0, 30.0),
+    "lanca": (12.0, 60.0),
+    "angulo_giro_deg": (0.0, 360.0),
+    "contrapeso": (0.0, 30.0),
+    "peso_guindaste": (20.0, 80.0),
+    "vento_i": (-5000.0, 5000.0),
+    "vento_j": (-5000.0, 5000.0),
+}
+PONTOS_VARREDURA_MAX = 400
+
+# Varreduras guardadas (ResumoVarredura, float32): até ~2 MB cada em 400 × 400,
+# por isso em um armazém próprio com poucos itens, fora do de sessão
+_armazem_varreduras = None
+_armazem_varreduras_lock = threading.Lock()
+
+
+def armazem_varreduras():
+    """Armazém das varreduras do processo (CRANE_SWEEP_TTL_S/_MAX_ITENS/_DIR)."""
+    global _armazem_varreduras
+    with _armazem_varreduras_lock:
+        if _armazem_varreduras is None:
+            _armazem_varreduras = armazem_do_ambiente(
+                "CRANE_SWEEP",
+                ttl_s=3600.0,
+                max_itens=32,
+                diretorio=diretorio_sessao("varreduras"),
+            )
+        return _armazem_varreduras
+
+
 # =====================================================
 # TABELAS
 # =====================================================
@@ -349,12 +583,38 @@ tabela_solo = TabelaDadosComponent(
         {"name": "Solo", "id": "solo"},
         {"name": "Rigidez [Pa]", "id": "soil_k", "type": "numeric"},
         {"name": "Área [m²]", "id": "soil_area_i", "type": "numeric"},
+        {"name": "Pressão adm. [Pa]", "id": "soil_adm", "type": "numeric"},
     ],
-    [{"solo": "Comum", "soil_k": 100.e6, "soil_area_i": 2.2}],
+    [{"solo": "Comum", "soil_k": 100.e6, "soil_area_i": 2.2, "soil_adm": 250.e3}],
     allow_add_rows=False,
     row_deletable=False,
 )
 
+tabela_obstaculos = TabelaDadosComponent(
+    app,
+    "obstaculos",
+    [
+        {"name": "Nome", "id": "Nome"},
+        {"name": "Xmin [m]", "id": "Xmin", "type": "numeric"},
+        {"name": "Ymin [m]", "id": "Ymin", "type": "numeric"},
+        {"name": "Zmin [m]", "id": "Zmin", "type": "numeric"},
+        {"name": "Xmax [m]", "id": "Xmax", "type": "numeric"},
+        {"name": "Ymax [m]", "id": "Ymax", "type": "numeric"},
+        {"name": "Zmax [m]", "id": "Zmax", "type": "numeric"},
+    ],
+    [
+        {
+            "Nome": "Estrutura 1",
+            "Xmin": 8.0,
+            "Ymin": 4.0,
+            "Zmin": 0.0,
+            "Xmax": 12.0,
+            "Ymax": 8.0,
+            "Zmax": 10.0,
+        }
+    ],
+)
+
 tabela_pesos = TabelaDadosComponent(
     app,
     "pesos",
@@ -385,9 +645,13 @@ tabela_pesos = TabelaDadosComponent(
     Input("pesos-data-table", "data"),
 )
 def validar_entrada(pat, cm, lanca, carga, vento, solo, angulo, pesos):
-    entrada = construir_entrada(pat, cm, lanca, carga, vento, solo, angulo, pesos)
+    with span("construir_entrada"):
+        entrada = construir_entrada(pat, cm, lanca, carga, vento, solo, angulo, pesos)
 
-    if entrada.is_valid():
+    with span("is_valid"):
+        valido = entrada.is_valid()
+
+    if valido:
         return False, dbc.Alert("Dados válidos ✔", color="success")
     return True, dbc.Alert(
         "Preencha corretamente todos os dados antes de calcular.",
@@ -412,24 +676,52 @@ def validar_entrada(pat, cm, lanca, carga, vento, solo, angulo, pesos):
     State("solo-data-table", "data"),
     State("pesos-data-table", "data"),
     State("angulo-giro", "value"),
+    State("calculo-guindaste", "value"),
+    State("calculo-projeto", "value"),
     prevent_initial_call=True,
 )
-def executar_calculo(_, pat, cm, lanca, carga, vento, solo, pesos, angulo):
+def executar_calculo(
+    _, pat, cm, lanca, carga, vento, solo, pesos, angulo, guindaste=None, projeto=None
+):
 
-    entrada = construir_entrada(pat, cm, lanca, carga, vento, solo, angulo, pesos)
+    with span("construir_entrada"):
+        entrada = construir_entrada(pat, cm, lanca, carga, vento, solo, angulo, pesos)
 
-    if not entrada.is_valid():
+    with span("is_valid"):
+        valido = entrada.is_valid()
+
+    if not valido:
         return None, dbc.Alert("Erro de validação.", color="danger")
 
-    X, _, _, _ = calc_reactions(entrada)
+    # Casos já calculados (em qualquer sessão) vêm do banco local
+    banco = banco_padrao()
+    chave = hash_entrada(entrada)
+    with span("banco.obter"):
+        salvo = banco.obter(chave)
 
-    # 🔴 ajuste aqui conforme sua ordem real das incógnitas
-    reacoes = {
-        "P1": float(X[2]),
-        "P2": float(X[3]),
-        "P3": float(X[4]),
-        "P4": float(X[5]),
-    }
+    if salvo is not None:
+        resultado = ResultadoIcamento(
+            salvo["reacoes"], pd.DataFrame(salvo["sensibilidade"]), None
+        )
+    else:
+        # Mesmo cálculo dos relatórios de plano de içamento
+        with span("calcular_icamento"):
+            resultado = calcular_icamento(entrada)
+
+        banco.salvar(
+            chave,
+            {
+                "reacoes": resultado.reacoes,
+                "sensibilidade": resultado.sensibilidade.to_dict(),
+            },
+            entrada=entrada_canonica(entrada),
+            # guindaste do catálogo e projeto: filtros de BancoResultados.buscar
+            guindaste=guindaste or "",
+            projeto=(projeto or "").strip(),
+            utilizacao=resultado.utilizacao,
+        )
+
+    reacoes, sens = resultado.reacoes, resultado.sensibilidade
 
     mensagem = [
         html.B("Cálculo concluído"),
@@ -444,13 +736,255 @@ def executar_calculo(_, pat, cm, lanca, carga, vento, solo, pesos, angulo):
         ),
     ]
 
+    margem = resultado.margem()
+
+    if np.isfinite(margem.min()):
+        mensagem.append(
+            html.P(
+                f"Carga adicional até perda de contato: {margem.min():.2f} ton "
+                f"({margem.idxmin()})"
+            )
+        )
+
+    tabela_sens = sens.rename(columns=ROTULOS_SENSIBILIDADE).round(1)
+    mensagem.append(
+        dbc.Table.from_dataframe(
+            tabela_sens.reset_index(names="dR/d"),
+            size="sm",
+            bordered=True,
+            className="mb-0",
+        )
+    )
+
     status = (
         dbc.Alert(mensagem, color="success")
         if min(reacoes.values()) >= 0
         else dbc.Alert(mensagem + ["⚠ Perda de contato"], color="danger")
     )
 
-    return reacoes, status
+    # No navegador fica só o handle; o resultado completo fica no servidor
+    handle = armazem_sessao().guardar({"reacoes": reacoes, "sensibilidade": sens})
+    return handle, status
+
+
+# =====================================================
+# CALLBACK – CARGA MÁXIMA (RAIO × GIRO)
+# =====================================================
+
+
+@app.callback(
+    Output("grafico-carga-maxima", "figure"),
+    Input("btn-carga-maxima", "n_clicks"),
+    State("patolas-data-table", "data"),
+    State("centro-massa-data-table", "data"),
+    State("lanca-data-table", "data"),
+    State("carga-data-table", "data"),
+    State("vento-data-table", "data"),
+    State("solo-data-table", "data"),
+    State("pesos-data-table", "data"),
+    State("angulo-giro", "value"),
+    State("carga-maxima-guindaste", "value"),
+    prevent_initial_call=True,
+)
+def gerar_carga_maxima(_, pat, cm, lanca, carga, vento, solo, pesos, angulo, guindaste):
+
+    entrada = construir_entrada(pat, cm, lanca, carga, vento, solo, angulo, pesos)
+
+    if not entrada.is_valid():
+        fig = go.Figure()
+        fig.update_layout(title="Dados inválidos", template="plotly_white")
+        return fig
+
+    L = float(entrada.lanca["Lanca"])
+    raios = np.arange(1.0, L, 0.5)
+    angulos = np.arange(0, 361, 5)
+
+    catalogo = catalogo_padrao()
+    curva = catalogo.curva(guindaste) if guindaste and guindaste in catalogo else None
+
+    with span("carga_maxima_grade", pontos=raios.size * angulos.size):
+        resultado = carga_maxima_grade(entrada, raios, angulos, curva=curva)
+
+    return plot_carga_maxima(resultado)
+
+
+# =====================================================
+# CALLBACK – PRESSÃO NO SOLO
+# =====================================================
+
+
+@app.callback(
+    Output("grafico-pressao-solo", "figure"),
+    Output("resumo-pressao-solo", "children"),
+    Input("btn-calcular", "n_clicks"),
+    Input("profundidade-solo", "value"),
+    State("patolas-data-table", "data"),
+    State("centro-massa-data-table", "data"),
+    State("lanca-data-table", "data"),
+    State("carga-data-table", "data"),
+    State("vento-data-table", "data"),
+    State("solo-data-table", "data"),
+    State("pesos-data-table", "data"),
+    State("angulo-giro", "value"),
+    prevent_initial_call=True,
+)
+def atualizar_pressao_solo(
+    _, profundidade, pat, cm, lanca, carga, vento, solo, pesos, angulo
+):
+
+    entrada = construir_entrada(pat, cm, lanca, carga, vento, solo, angulo, pesos)
+
+    if not entrada.is_valid():
+        fig = go.Figure()
+        fig.update_layout(title="Dados inválidos", template="plotly_white")
+        return fig, None
+
+    with span("pressao_solo"):
+        env = envoltoria_pressao(entrada)
+        x, y, campo = campo_pressao(entrada, env, profundidade=profundidade or 0.0)
+
+    lado = float(np.sqrt(env.area))
+    fig = plot_pressao_solo(entrada.patolas, x, y, campo, lado)
+
+    resumo = env.resumo()
+    pico = resumo["Pressao_max"].max()
+    critica = resumo["Pressao_max"].idxmax()
+    texto = (
+        f"Pressão de contato máxima: {pico / 1e3:.1f} kPa ({critica}, giro "
+        f"{resumo.loc[critica, 'Giro_pico']:.0f}°)"
+    )
+
+    if env.pressao_admissivel is None:
+        return fig, dbc.Alert(texto, color="info")
+
+    texto += f" – admissível {env.pressao_admissivel / 1e3:.1f} kPa"
+    cor = "success" if pico <= env.pressao_admissivel else "danger"
+    return fig, dbc.Alert(texto, color=cor)
+
+
+# =====================================================
+# CALLBACK – VARREDURA DE DOIS PARÂMETROS
+# =====================================================
+
+
+for _eixo in ("x", "y"):
+
+    @app.callback(
+        Output(f"varredura-{_eixo}-min", "value"),
+        Output(f"varredura-{_eixo}-max", "value"),
+        Input(f"varredura-{_eixo}-param", "value"),
+        prevent_initial_call=True,
+    )
+    def sugerir_faixa(parametro):
+        return FAIXAS_VARREDURA.get(parametro, (None, None))
+
+
+def _eixo_varredura(minimo, maximo, n):
+    """Valores do eixo; None se a faixa é inválida."""
+    try:
+        minimo, maximo, n = float(minimo), float(maximo), int(n)
+    except (TypeError, ValueError):
+        return None
+    if not (minimo < maximo and 2 <= n <= PONTOS_VARREDURA_MAX):
+        return None
+    return np.linspace(minimo, maximo, n)
+
+
+@app.callback(
+    Output("grafico-varredura-reacao", "figure"),
+    Output("grafico-varredura-utilizacao", "figure"),
+    Output("resumo-varredura", "children"),
+    Input("btn-varredura", "n_clicks"),
+    State("patolas-data-table", "data"),
+    State("centro-massa-data-table", "data"),
+    State("lanca-data-table", "data"),
+    State("carga-data-table", "data"),
+    State("vento-data-table", "data"),
+    State("solo-data-table", "data"),
+    State("pesos-data-table", "data"),
+    State("angulo-giro", "value"),
+    State("varredura-x-param", "value"),
+    State("varredura-x-min", "value"),
+    State("varredura-x-max", "value"),
+    State("varredura-x-n", "value"),
+    State("varredura-y-param", "value"),
+    State("varredura-y-min", "value"),
+    State("varredura-y-max", "value"),
+    State("varredura-y-n", "value"),
+    State("varredura-guindaste", "value"),
+    prevent_initial_call=True,
+)
+def executar_varredura(
+    _,
+    pat,
+    cm,
+    lanca,
+    carga,
+    vento,
+    solo,
+    pesos,
+    angulo,
+    param_x,
+    x_min,
+    x_max,
+    n_x,
+    param_y,
+    y_min,
+    y_max,
+    n_y,
+    guindaste,
+):
+    vazio = go.Figure()
+    vazio.update_layout(template="plotly_white")
+
+    entrada = construir_entrada(pat, cm, lanca, carga, vento, solo, angulo, pesos)
+    if not entrada.is_valid():
+        return vazio, vazio, dbc.Alert("Dados inválidos.", color="danger")
+
+    x = _eixo_varredura(x_min, x_max, n_x)
+    y = _eixo_varredura(y_min, y_max, n_y)
+    if not param_x or not param_y or param_x == param_y or x is None or y is None:
+        return vazio, vazio, dbc.Alert(
+            "Escolha dois parâmetros diferentes, mínimo < máximo e de 2 a "
+            f"{PONTOS_VARREDURA_MAX} pontos por eixo.",
+            color="warning",
+        )
+
+    catalogo = catalogo_padrao()
+    entrada_tabela = catalogo.entrada(guindaste) if guindaste else None
+
+    # Mesma definição (entradas, eixos, tabela) -> mesmo handle no armazém
+    definicao = (
+        f"{entrada_tabela.hash if entrada_tabela else ''}|"
+        f"{param_x}:{x[0]!r}:{x[-1]!r}:{x.size}|{param_y}:{y[0]!r}:{y[-1]!r}:{y.size}"
+    )
+    chave = "varredura" + hash_entrada(entrada, definicao)[:20]
+    armazem = armazem_varreduras()
+    resultado = armazem.obter(chave)
+    em_cache = resultado is not None
+
+    if resultado is None:
+        curva = catalogo.curva(guindaste) if entrada_tabela else None
+        with span("varredura", pontos=x.size * y.size):
+            resultado = varrer(entrada, param_x, x, param_y, y, curva=curva).resumo()
+        armazem.guardar(resultado, handle=chave)
+
+    with span("plot_varredura"):
+        fig_reacao, fig_utilizacao = plot_varredura(resultado)
+
+    reacao_min = resultado.reacao_min
+    validos = ~np.isnan(reacao_min)
+    n_validos = max(int(validos.sum()), 1)
+    perda = int((reacao_min[validos] < 0).sum())
+    acima = int((resultado.utilizacao[validos] > 1).sum())
+    texto = (
+        f"Grade {x.size} × {y.size} ({x.size * y.size} casos"
+        f"{', do cache' if em_cache else ''}): perda de contato em "
+        f"{perda / n_validos:.0%}, utilização acima de 100% em "
+        f"{acima / n_validos:.0%} dos casos válidos."
+    )
+    cor = "success" if perda == 0 and acima == 0 else "warning"
+    return fig_reacao, fig_utilizacao, dbc.Alert(texto, color=cor)
 
 
 # ====================================================
@@ -466,10 +1000,17 @@ def executar_calculo(_, pat, cm, lanca, carga, vento, solo, pesos, angulo):
     Input("lanca-data-table", "data"),
     Input("vento-data-table", "data"),
     Input("angulo-giro", "value"),
-    Input("store-reacoes", "data"),  # <<< NOVO
+    Input("store-reacoes", "data"),  # handle do armazém de sessão
     Input("btn-calcular", "n_clicks"),
+    Input("obstaculos-data-table", "data"),
 )
-def atualizar_graficos(pat, cm, lanca, vento, angulo, reacoes, _):
+def atualizar_graficos(pat, cm, lanca, vento, angulo, handle, _, obstaculos):
+
+    resultado = armazem_sessao().obter(handle) if handle else None
+    reacoes = resultado["reacoes"] if resultado else None
+    # handle sem resultado: expirou ou foi gravado por outro worker com o
+    # backend em memória; o gráfico avisa em vez de omitir as reações
+    expirado = bool(handle) and resultado is None
 
     # ------------------
     # DataFrames
@@ -482,18 +1023,57 @@ def atualizar_graficos(pat, cm, lanca, vento, angulo, reacoes, _):
     # ------------------
     # Gráfico 2D
     # ------------------
-    fig_superior = plot_vista_superior(
-        df_pat, cm_s, lanca_s, angulo, vento_s, reacoes=reacoes
-    )
+    with span("plot_vista_superior"):
+        fig_superior = plot_vista_superior(
+            df_pat, cm_s, lanca_s, angulo, vento_s, reacoes=reacoes
+        )
+    if expirado:
+        fig_superior.add_annotation(
+            text="Resultado expirado, recalcule",
+            xref="paper",
+            yref="paper",
+            x=0.5,
+            y=1.0,
+            yanchor="bottom",
+            showarrow=False,
+            font=dict(color="darkorange", size=14),
+        )
 
     # ------------------
-    # Gráfico 3D (placeholder por enquanto)
+    # Gráfico 3D com obstáculos
     # ------------------
-    fig_3d = go.Figure()
-    fig_3d.update_layout(
-        title="Estrutura 3D (em desenvolvimento)",
-        template="plotly_white",
-    )
+    with span("plot_lanca_3d"):
+        fig_3d = plot_lanca_3d(cm_s, lanca_s, angulo)
+
+        df_obs = pd.DataFrame(obstaculos or [])
+        try:
+            obs = Obstaculos(df_obs.dropna()) if not df_obs.empty else None
+        except (KeyError, ValueError):
+            obs = None
+
+        if obs is not None and len(obs):
+            pivo = cm_s[["Xcm", "Ycm", "Zcm"]].to_numpy(dtype=float)
+            L = float(lanca_s["Lanca"])
+            R = float(lanca_s["Raio"])
+            giros = np.arange(0.0, 360.0, 2.0)
+            interferencia = verificar_interferencias(obs, pivo, L, [R], giros)
+            pontas = pivo + ponta_lanca(R, L, giros)
+
+            atual = verificar_interferencias(obs, pivo, L, [R], [angulo or 0.0])
+            fig_3d = plot_obstaculos_3d(
+                fig_3d,
+                obs,
+                pontas,
+                interferencia,
+                atingidos=set(atual.obstaculo.ravel()),
+            )
+
+            bloqueados = giros[interferencia.colide[0]]
+            if len(bloqueados):
+                fig_3d.update_layout(
+                    title=f"Modelo 3D – interferência em {len(bloqueados)} de "
+                    f"{len(giros)} posições de giro"
+                )
 
     return fig_superior, fig_3d
 
@@ -503,6 +1083,42 @@ def atualizar_graficos(pat, cm, lanca, vento, angulo, reacoes, _):
 # =====================================================
 
 
+def _opcoes_tabela_carga():
+    opcoes = [{"label": rotulo, "value": v} for v, rotulo in catalogo_padrao().opcoes()]
+    return [{"label": "Nenhuma", "value": ""}] + opcoes
+
+
+def _controles_eixo(eixo, titulo, parametro):
+    minimo, maximo = FAIXAS_VARREDURA[parametro]
+    return dbc.InputGroup(
+        [
+            dbc.InputGroupText(titulo),
+            dbc.Select(
+                id=f"varredura-{eixo}-param",
+                options=[
+                    {"label": rotulo, "value": chave}
+                    for chave, rotulo in PARAMETROS_VARREDURA.items()
+                ],
+                value=parametro,
+            ),
+            dbc.InputGroupText("de"),
+            dbc.Input(id=f"varredura-{eixo}-min", type="number", value=minimo),
+            dbc.InputGroupText("a"),
+            dbc.Input(id=f"varredura-{eixo}-max", type="number", value=maximo),
+            dbc.InputGroupText("pontos"),
+            dbc.Input(
+                id=f"varredura-{eixo}-n",
+                type="number",
+                min=2,
+                max=PONTOS_VARREDURA_MAX,
+                step=1,
+                value=200,
+            ),
+        ],
+        className="mb-2",
+    )
+
+
 def layout():
     return dbc.Container(
         [
@@ -535,6 +1151,25 @@ def layout():
                             html.Hr(),
                             tabela_pesos.layout(),
                             html.Hr(),
+                            tabela_obstaculos.layout(),
+                            html.Hr(),
+                            dbc.InputGroup(
+                                [
+                                    dbc.InputGroupText("Guindaste"),
+                                    dbc.Select(
+                                        id="calculo-guindaste",
+                                        options=_opcoes_tabela_carga(),
+                                        value="",
+                                    ),
+                                    dbc.InputGroupText("Projeto"),
+                                    dbc.Input(
+                                        id="calculo-projeto",
+                                        type="text",
+                                        placeholder="identificador",
+                                    ),
+                                ],
+                                className="mb-2",
+                            ),
                             dbc.Button(
                                 "Calcular Estabilidade",
                                 id="btn-calcular",
@@ -554,6 +1189,81 @@ def layout():
                             dcc.Graph(
                                 id="grafico-3d-estrutural", style={"height": "55vh"}
                             ),
+                            html.Hr(),
+                            html.H5("Pressão no Solo"),
+                            dbc.InputGroup(
+                                [
+                                    dbc.InputGroupText("Profundidade [m]"),
+                                    dbc.Input(
+                                        id="profundidade-solo",
+                                        type="number",
+                                        min=0,
+                                        step=0.1,
+                                        value=0.5,
+                                    ),
+                                ],
+                                className="mb-2",
+                                style={"maxWidth": "20rem"},
+                            ),
+                            html.Div(id="resumo-pressao-solo"),
+                            dcc.Graph(
+                                id="grafico-pressao-solo", style={"height": "55vh"}
+                            ),
+                            html.Hr(),
+                            dbc.InputGroup(
+                                [
+                                    dbc.InputGroupText("Tabela de carga"),
+                                    dbc.Select(
+                                        id="carga-maxima-guindaste",
+                                        options=_opcoes_tabela_carga(),
+                                        value="",
+                                    ),
+                                ],
+                                className="mb-2",
+                                style={"maxWidth": "30rem"},
+                            ),
+                            dbc.Button(
+                                "Gerar Curva de Carga Máxima",
+                                id="btn-carga-maxima",
+                                color="primary",
+                            ),
+                            dcc.Graph(
+                                id="grafico-carga-maxima", style={"height": "55vh"}
+                            ),
+                            html.Hr(),
+                            html.H5("Varredura de Dois Parâmetros"),
+                            _controles_eixo("x", "Eixo X", "raio"),
+                            _controles_eixo("y", "Eixo Y", "carga"),
+                            dbc.InputGroup(
+                                [
+                                    dbc.InputGroupText("Tabela de carga"),
+                                    dbc.Select(
+                                        id="varredura-guindaste",
+                                        options=_opcoes_tabela_carga(),
+                                        value="",
+                                    ),
+                                ],
+                                className="mb-2",
+                                style={"maxWidth": "30rem"},
+                            ),
+                            dbc.Button(
+                                "Gerar Varredura",
+                                id="btn-varredura",
+                                color="primary",
+                            ),
+                            html.Div(id="resumo-varredura", className="mt-2"),
+                            dcc.Loading(
+                                [
+                                    dcc.Graph(
+                                        id="grafico-varredura-reacao",
+                                        style={"height": "55vh"},
+                                    ),
+                                    dcc.Graph(
+                                        id="grafico-varredura-utilizacao",
+                                        style={"height": "55vh"},
+                                    ),
+                                ]
+                            ),
                         ],
                         md=7,
                     ),
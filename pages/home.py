@@ -1,198 +1,286 @@
-from dash import html, Output, Input, dcc
+from dash import html, Output, Input, State, dcc, Patch, no_update
 import dash_bootstrap_components as dbc
 
 # Importa a instância global do aplicativo
 from app import app
 
 # Importa o componente da tabela
-from components.tabela_component import TabelaDadosComponent
+from components.tabela_component import TabelaDadosComponent, barra_progresso
 from components.dropdown_component import DropdownButtonComponent
 import os
+import uuid
+from functools import lru_cache
 
 from components.plotly_component import OperationalMapComponent
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 
+from monitoring.tracing import span
+from storage.conjuntos import obter_conjunto
+from storage.importacao import (
+    importar_tabela_carga,
+    progresso_no_armazem,
+    validar_pontos,
+)
+from storage.catalogo import catalogo_padrao
+
 
+# Opções vêm do catálogo de tabelas em data/ (atualizado sem reiniciar)
 dropdown_comp = DropdownButtonComponent(
     app,
     id_base="meu-dropdown",
-    options=["Guindaste 90ton", "Guindaste - sem dados"],
+    options=lambda: catalogo_padrao().opcoes(),
     label="Escolha o Guindaste",
 )
 
+OCULTO = {"display": "none"}
+
+
+@lru_cache(maxsize=8)
+def _mapa_operacional(id_guindaste, hash_tabela, titulo):
+    """Mapa (tabela + malha interpolada) por guindaste; o hash invalida o cache."""
+    catalogo = catalogo_padrao()
+    with span("tabela_catalogo", guindaste=id_guindaste):
+        df = catalogo.tabela(id_guindaste)
+        malha = catalogo.malha(id_guindaste)
+    with span("OperationalMapComponent"):
+        return OperationalMapComponent(df, title=titulo, malha=malha)
+
+
+def mapa_operacional(entrada):
+    return _mapa_operacional(
+        entrada.id, entrada.hash, f"Mapa Operacional {entrada.nome}"
+    )
+
+
+# =====================================================
+# PONTOS DE IÇAMENTO
+# =====================================================
+#
+# Os dois traços de pontos (aprovados e reprovados) têm uma posição por id
+# de linha do conjunto (posição = id; linhas removidas ficam nulas); a linha
+# aparece no traço do seu status e fica nula no outro. Assim a edição de uma
+# linha vira um Patch de uma posição, sem reenviar a figura, e só as linhas
+# alteradas são interpoladas. A versão aplicada fica no navegador
+# (estado-grafico-operacional, gravado na mesma resposta que a figura): se
+# uma resposta foi descartada, a versão não confere e o mapa é redesenhado.
+
+
+def avaliar_pontos(mapa, df):
+    """Posição no mapa, capacidade da tabela e status de cada linha."""
+    x = pd.to_numeric(df["Raio"], errors="coerce").to_numpy(dtype=float)
+    lanca = pd.to_numeric(df["Lanca"], errors="coerce").to_numpy(dtype=float)
+    carga = pd.to_numeric(df["Carga"], errors="coerce").to_numpy(dtype=float)
+    valido = ~np.isnan(x) & ~np.isnan(lanca)
+
+    # evita sqrt negativa
+    y = np.sqrt(np.maximum(lanca**2 - x**2, 0.0))
+
+    carga_grafico = np.full(len(df), np.nan)
+    if valido.any():
+        with span("interpolacao_pontos", n=int(valido.sum())):
+            carga_grafico[valido] = mapa.interp(list(zip(x[valido], y[valido])))
+
+    return pd.DataFrame(
+        {
+            "Ponto": df["Ponto"].to_numpy(),
+            "X": np.where(valido, x, np.nan),
+            "Y": np.where(valido, y, np.nan),
+            "Carga": carga,
+            "Carga_max": carga_grafico,
+            "OK": carga <= carga_grafico,
+        },
+        index=df.index,
+    )
+
+
+def _num(v):
+    return None if v is None or np.isnan(v) else float(v)
+
+
+def _valores_ponto(linha, aprovado):
+    """Valores de uma posição no traço de aprovados (ou reprovados)."""
+    if linha is None or np.isnan(linha.X) or bool(linha.OK) != aprovado:
+        return {"x": None, "y": None, "text": "", "customdata": [None] * 4}
+    return {
+        "x": float(linha.X),
+        "y": float(linha.Y),
+        "text": linha.Ponto,
+        "customdata": [
+            _num(linha.X),
+            _num(linha.Y),
+            _num(linha.Carga),
+            _num(linha.Carga_max),
+        ],
+    }
+
+
+def _traco_pontos(pontos, aprovado):
+    valores = [_valores_ponto(linha, aprovado) for linha in pontos.itertuples()]
+    status = "OK" if aprovado else "NÃO OK"
+    return go.Scatter(
+        x=[v["x"] for v in valores],
+        y=[v["y"] for v in valores],
+        mode="markers+text",
+        text=[v["text"] for v in valores],
+        textfont=dict(
+            color="black",  # ← cor do texto acima do ponto
+            size=12,
+        ),
+        textposition="top center",
+        marker=dict(
+            size=10,
+            color="green" if aprovado else "red",
+            symbol="circle" if aprovado else "x",
+            line=dict(width=1, color="black"),
+        ),
+        name="Aprovados" if aprovado else "Reprovados",
+        customdata=[v["customdata"] for v in valores],
+        hovertemplate=(
+            "<b>Ponto:</b> %{text}<br>"
+            "<b>Raio (x):</b> %{customdata[0]:.2f} m<br>"
+            "<b>Altura (y):</b> %{customdata[1]:.2f} m<br>"
+            "<b>Carga Ponto:</b> %{customdata[2]:.2f}<br>"
+            "<b>Carga Máx:</b> %{customdata[3]:.2f}<br>"
+            f"<b>Status:</b> <span style='color:white'><b>{status}</b></span><br>"
+            "<extra></extra>"
+        ),
+    )
+
+
+def figura_completa(mapa, conjunto):
+    """Mapa + todos os pontos; retorna (figura, número de posições)."""
+    fig = go.Figure(mapa.fig)  # cópia: o mapa fica em cache
+    df = conjunto.dataframe() if conjunto is not None else pd.DataFrame()
+    if df.empty:
+        pontos = pd.DataFrame(columns=["Ponto", "X", "Y", "Carga", "Carga_max", "OK"])
+    else:
+        pontos = avaliar_pontos(mapa, df)
+    n = conjunto.proximo_id if conjunto is not None else 0
+    pontos = pontos.reindex(range(n))  # posição = id; removidas ficam nulas
+
+    with span("tracos_pontos", n=len(pontos)):
+        fig.add_trace(_traco_pontos(pontos, aprovado=True))
+        fig.add_trace(_traco_pontos(pontos, aprovado=False))
+
+    fig.update_layout(
+        legend=dict(
+            orientation="h",  # horizontal
+            yanchor="top",
+            y=-0.2,  # abaixo do eixo X
+            xanchor="center",
+            x=0.5,  # centralizado horizontalmente
+        )
+    )
+    return fig, n
+
+
+def patch_pontos(mapa, alteracoes, n):
+    """
+    Patch só das posições das linhas alteradas/removidas sobre uma figura
+    com ``n`` posições. Retorna (patch, novo n), ou None se as linhas novas
+    não continuam a sequência de ids (aí a figura é redesenhada).
+    """
+    alteradas = alteracoes.get("alteradas") or []
+    novas = sorted(int(r["id"]) for r in alteradas if int(r["id"]) >= n)
+    if novas != list(range(n, n + len(novas))):
+        return None
+
+    patch = Patch()
+    tracos = (len(mapa.fig.data), len(mapa.fig.data) + 1)
+
+    mudancas = []
+    if alteradas:
+        df = pd.DataFrame(alteradas).set_index("id")
+        pontos = avaliar_pontos(mapa, df).sort_index()
+        mudancas += [(int(i), linha) for i, linha in pontos.iterrows()]
+    mudancas += [(int(i), None) for i in alteracoes.get("removidas") or []]
+
+    with span("patch_pontos", n=len(mudancas)):
+        for i, linha in mudancas:
+            if i >= n + len(novas):
+                continue  # removida antes de chegar à figura
+            for traco, aprovado in zip(tracos, (True, False)):
+                valores = _valores_ponto(linha, aprovado)
+                for campo, valor in valores.items():
+                    if i >= n:
+                        patch["data"][traco][campo].append(valor)
+                    else:
+                        patch["data"][traco][campo][i] = valor
+    return patch, n + len(novas)
+
 
 @app.callback(
-    Output("div-grafico-operacional", "children"),
     [
-        Input(dropdown_comp.dropdown_id, "label"),
-        Input("dados-iniciais-data-table", "data"),  # tabela
+        Output("grafico-operacional", "figure"),
+        Output("grafico-operacional", "style"),
+        Output("msg-grafico-operacional", "children"),
+        Output("estado-grafico-operacional", "data"),
     ],
+    [
+        Input(dropdown_comp.valor_id, "data"),  # id do guindaste no catálogo
+        Input("dados-iniciais-alteracoes", "data"),  # só as linhas alteradas
+    ],
+    State("estado-grafico-operacional", "data"),  # versão aplicada no navegador
 )
-def update_graph(selected, table_data):
+def update_graph(selected, alteracoes, aplicado=None):
 
-    # Converte table_data em DataFrame
-    df_table = pd.DataFrame(table_data) if table_data else pd.DataFrame()
+    alteracoes = alteracoes or {}
+    chave = alteracoes.get("conjunto")
+    conjunto = obter_conjunto(chave)
 
     # ---- SELEÇÃO INVÁLIDA ----
-    if selected is None or selected.startswith("Selecionar"):
-        return html.Div("Selecione um guindaste acima.", className="text-muted")
+    if selected is None:
+        msg = html.Div("Selecione um guindaste acima.", className="text-muted")
+        return go.Figure(), OCULTO, msg, None
 
     # ---- SEM DADOS ----
-    if selected == "Guindaste - sem dados":
-        return html.Div(
+    entrada = catalogo_padrao().entrada(selected)
+    if entrada is None:
+        msg = html.Div(
             "Nenhum dado disponível para esse guindaste.", className="text-warning"
         )
+        return go.Figure(), OCULTO, msg, None
+
+    # carrega dados (em cache enquanto a tabela não muda)
+    try:
+        mapa = mapa_operacional(entrada)
+    except Exception as e:
+        msg = html.Div(f"Erro ao carregar dados: {e}", className="text-danger")
+        return go.Figure(), OCULTO, msg, None
+
+    # ========== PROCESSAR TABELA ==========
+    aplicado = aplicado or {}
+    tabela = [entrada.id, entrada.hash]
+    incremental = (
+        conjunto is not None
+        and not alteracoes.get("completo")
+        and aplicado.get("conjunto") == chave
+        and aplicado.get("tabela") == tabela
+        and aplicado.get("versao") == alteracoes.get("versao_anterior")
+    )
 
-    # ---- GUINDASTE 90 TON ----
-    if selected == "Guindaste 90ton":
-
-        # carrega dados
-        try:
-            BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-            DATA_PATH = os.path.join(BASE_DIR, "..", "data", "guindaste_80TON.xlsx")
-            df = pd.read_excel(DATA_PATH)
-
-        except Exception as e:
-            return html.Div(f"Erro ao carregar dados: {e}", className="text-danger")
-
-        # cria figura do mapa
-        mapa = OperationalMapComponent(df, title="Mapa Operacional 90 ton")
-        fig = mapa.fig
-
-        # ========== PROCESSAR TABELA ==========
-        try:
-            if not df_table.empty:
-
-                df_table["Raio_conv"] = pd.to_numeric(
-                    df_table.get("Raio"), errors="coerce"
-                )
-                df_table["Lanca_conv"] = pd.to_numeric(
-                    df_table.get("Lanca"), errors="coerce"
-                )
-                df_table["Carga_conv"] = pd.to_numeric(
-                    df_table.get("Carga"), errors="coerce"
-                )
-
-                df_valid = df_table.dropna(subset=["Raio_conv", "Lanca_conv"]).copy()
-
-                if not df_valid.empty:
-
-                    x = df_valid["Raio_conv"].to_numpy()
-                    z = df_valid["Lanca_conv"].to_numpy()
-
-                    # evita sqrt negativa
-                    y = np.sqrt(np.maximum(z**2 - x**2, 0.0))
-
-                    customdata = np.stack(
-                        [x, y, df_valid["Carga_conv"].to_numpy()], axis=-1
-                    )
-
-                    carga_grafico = mapa.interp(list(zip(x, y)))
-                    carga_ponto = df_valid["Carga_conv"]
-                    ok_mask = carga_ponto <= carga_grafico
-                    nok_mask = ~ok_mask
-
-                    # --- Pontos APROVADOS ---
-                    if ok_mask.any():
-                        fig.add_trace(
-                            go.Scatter(
-                                x=x[ok_mask],
-                                y=y[ok_mask],
-                                mode="markers+text",
-                                text=df_valid["Ponto"].to_numpy()[ok_mask],
-                                textfont=dict(
-                                    color="black",  # ← cor do texto acima do ponto
-                                    size=12,
-                                ),
-                                textposition="top center",
-                                marker=dict(
-                                    size=10,
-                                    color="green",
-                                    symbol="circle",
-                                    line=dict(width=1, color="black"),
-                                ),
-                                name="Aprovados",
-                                customdata=np.stack(
-                                    [
-                                        x[ok_mask],
-                                        y[ok_mask],
-                                        carga_ponto[ok_mask],
-                                        carga_grafico[ok_mask],
-                                    ],
-                                    axis=-1,
-                                ),
-                                hovertemplate=(
-                                    "<b>Ponto:</b> %{text}<br>"
-                                    "<b>Raio (x):</b> %{customdata[0]:.2f} m<br>"
-                                    "<b>Altura (y):</b> %{customdata[1]:.2f} m<br>"
-                                    "<b>Carga Ponto:</b> %{customdata[2]:.2f}<br>"
-                                    "<b>Carga Máx:</b> %{customdata[3]:.2f}<br>"
-                                    "<b>Status:</b> <span style='color:white'><b>OK</b></span><br>"
-                                    "<extra></extra>"
-                                ),
-                            )
-                        )
-
-                    # --- Pontos REPROVADOS ---
-                    if nok_mask.any():
-                        fig.add_trace(
-                            go.Scatter(
-                                x=x[nok_mask],
-                                y=y[nok_mask],
-                                mode="markers+text",
-                                text=df_valid["Ponto"].to_numpy()[nok_mask],
-                                textfont=dict(
-                                    color="black",  # ← cor do texto acima do ponto
-                                    size=12,
-                                ),
-                                textposition="top center",
-                                marker=dict(
-                                    size=10,
-                                    color="red",
-                                    symbol="x",
-                                    line=dict(width=1, color="black"),
-                                ),
-                                name="Reprovados",
-                                customdata=np.stack(
-                                    [
-                                        x[nok_mask],
-                                        y[nok_mask],
-                                        carga_ponto[nok_mask],
-                                        carga_grafico[nok_mask],
-                                    ],
-                                    axis=-1,
-                                ),
-                                hovertemplate=(
-                                    "<b>Ponto:</b> %{text}<br>"
-                                    "<b>Raio (x):</b> %{customdata[0]:.2f} m<br>"
-                                    "<b>Altura (y):</b> %{customdata[1]:.2f} m<br>"
-                                    "<b>Carga Ponto:</b> %{customdata[2]:.2f}<br>"
-                                    "<b>Carga Máx:</b> %{customdata[3]:.2f}<br>"
-                                    "<b>Status:</b> <span style='color:white'><b>NÃO OK</b></span><br>"
-                                    "<extra></extra>"
-                                ),
-                            )
-                        )
-
-                fig.update_layout(
-                    legend=dict(
-                        orientation="h",  # horizontal
-                        yanchor="top",
-                        y=-0.2,  # abaixo do eixo X
-                        xanchor="center",
-                        x=0.5,  # centralizado horizontalmente
-                    )
-                )
-
-        except Exception as e:
-            print("Erro ao processar pontos da tabela:", e)
-
-        return dcc.Graph(figure=fig)
-
-    # ---- fallback ----
-    return html.Div("Seleção inválida.", className="text-danger")
+    try:
+        patch = patch_pontos(mapa, alteracoes, aplicado["n"]) if incremental else None
+        if patch is not None:
+            fig, n = patch
+            estilo = msg = no_update
+        else:
+            fig, n = figura_completa(mapa, conjunto)
+            estilo, msg = {}, None
+    except Exception as e:
+        print("Erro ao processar pontos da tabela:", e)
+        fig, _ = figura_completa(mapa, None)
+        return fig, {}, None, None
+
+    estado = {
+        "conjunto": chave,
+        "tabela": tabela,
+        "versao": conjunto.versao if conjunto is not None else None,
+        "n": n,
+    }
+    return fig, estilo, msg, estado
 
 
 # Instancia o componente da tabela, passando a instância do app e um ID base
@@ -205,10 +293,94 @@ tab1Columns = [
 
 initial_data = [{"Ponto": "Aquecedor Fab.", "Lanca": 32, "Raio": 12.50, "Carga": 8.0}]
 tabela_vendas = TabelaDadosComponent(
-    app, id_base="dados-iniciais", columns=tab1Columns, initial_data=initial_data
+    app,
+    id_base="dados-iniciais",
+    columns=tab1Columns,
+    initial_data=initial_data,
+    modo_servidor=True,
+    importavel=True,
+    validar_importacao=validar_pontos,
 )
 
 
+# =====================================================
+# IMPORTAÇÃO DE TABELAS DE CARGA
+# =====================================================
+
+
+def layout_importar_tabela():
+    return html.Div(
+        [
+            html.H4("Nova tabela de carga", className="mb-3"),
+            dcc.Upload(
+                html.Div(
+                    ["CSV/XLSX com Raio, Lanca, Carga: arraste ou ", html.A("selecione")]
+                ),
+                id="upload-tabela-carga",
+                accept=".csv,.txt,.xlsx,.xlsm",
+                className="p-2 text-center border border-secondary rounded",
+                style={"borderStyle": "dashed"},
+            ),
+            dbc.Progress(
+                id="progresso-tabela-carga",
+                value=0,
+                className="mt-2",
+                style={"display": "none"},
+            ),
+            dcc.Interval(id="intervalo-tabela-carga", interval=500, disabled=True),
+            # identifica o progresso desta aba no armazém de sessão
+            dcc.Store(id="sessao-tabela-carga", data=uuid.uuid4().hex[:20]),
+            html.Div(id="msg-tabela-carga", className="mt-2"),
+        ]
+    )
+
+
+@app.callback(
+    Output("msg-tabela-carga", "children"),
+    Output("upload-tabela-carga", "contents"),
+    Input("upload-tabela-carga", "contents"),
+    State("upload-tabela-carga", "filename"),
+    State("sessao-tabela-carga", "data"),
+    running=[(Output("intervalo-tabela-carga", "disabled"), False, True)],
+    prevent_initial_call=True,
+)
+def importar_tabela(conteudo, nome, sessao):
+    if not conteudo:
+        return no_update, no_update
+    progresso = progresso_no_armazem(f"imp{sessao}")
+    try:
+        with span("importar_tabela_carga", arquivo=nome):
+            catalogo = catalogo_padrao()
+            resultado = importar_tabela_carga(
+                conteudo, nome, catalogo.diretorio, progresso
+            )
+            catalogo.atualizar()  # disponível já nesta sessão
+    except ValueError as e:
+        progresso(0.0, str(e))
+        return html.Div(str(e), className="text-danger"), None
+    arquivo = os.path.basename(resultado.caminho)
+    return (
+        html.Div(
+            f"Tabela salva em data/{arquivo}: {resultado.resumo()}.",
+            className="text-success",
+        ),
+        None,
+    )
+
+
+@app.callback(
+    Output("progresso-tabela-carga", "value"),
+    Output("progresso-tabela-carga", "label"),
+    Output("progresso-tabela-carga", "style"),
+    Input("intervalo-tabela-carga", "n_intervals"),
+    Input("msg-tabela-carga", "children"),
+    State("sessao-tabela-carga", "data"),
+    prevent_initial_call=True,
+)
+def progresso_tabela(_, __, sessao):
+    return barra_progresso(f"imp{sessao}")
+
+
 def layout():
     return dbc.Container(
         [
@@ -225,6 +397,8 @@ def layout():
                                     tabela_vendas.layout(),
                                     html.Br(),
                                     dropdown_comp.layout(),
+                                    html.Hr(),
+                                    layout_importar_tabela(),
                                 ]
                             ),
                             className="shadow h-100",
@@ -239,6 +413,14 @@ def layout():
                                     html.H4("Mapa Operacional"),
                                     html.Hr(),
                                     html.Div(
+                                        [
+                                            html.Div(id="msg-grafico-operacional"),
+                                            dcc.Store(id="estado-grafico-operacional"),
+                                            dcc.Graph(
+                                                id="grafico-operacional",
+                                                style=OCULTO,
+                                            ),
+                                        ],
                                         id="div-grafico-operacional",
                                         style={
                                             "height": "70vh",  # controla altura visível
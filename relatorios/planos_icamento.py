@@ -0,0 +1,440 @@
+# relatorios/planos_icamento.py
+"""
+Planos de içamento em lote: um PDF por caso e um resumo XLSX do lote.
+
+Cada caso é uma EntradaGuindaste (a mesma da página de patolas) com nome e,
+opcionalmente, o id do guindaste no catálogo. Os números vêm das mesmas
+chamadas do engine usadas na tela:
+
+- reações, sensibilidade e utilização da sapata: ``calcular_icamento``
+  (botão "Calcular Estabilidade")
+- envoltória de giro: ``envoltoria_pressao`` (gráfico de pressão no solo)
+- utilização da tabela de carga: ``CurvaCarga.capacidade`` no raio e lança
+
+Os casos são avaliados e desenhados em paralelo (ProcessPoolExecutor). O
+resumo é gravado com openpyxl em modo write-only, linha a linha conforme os
+resultados chegam, então a memória não cresce com o tamanho do lote. PDFs
+cujo arquivo já existe para o mesmo caso (hash das entradas e da tabela)
+não são redesenhados.
+
+Uso:
+    python -m relatorios.planos_icamento lista.xlsx --base caso.json \\
+        --guindaste guindaste_80TON --saida planos/ -j 4
+
+``lista`` é a tabela de pontos da home (Ponto, Lanca, Raio, Carga; colunas
+Giro e Contrapeso opcionais) e ``caso.json`` as tabelas da página de
+patolas (pat, cm, lanca, carga, vento, solo, angulo, pesos).
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
+from openpyxl import Workbook
+from scipy.spatial import ConvexHull
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from engine.calc_reactions import PATOLAS  # noqa: E402
+from engine.icamento import calcular_icamento, utilizacao_tabela  # noqa: E402
+from engine.pressao_solo import envoltoria_pressao  # noqa: E402
+from models.inputs_guindaste import construir_entrada  # noqa: E402
+from relatorios.tabelas_carga import (  # noqa: E402
+    catalogo_do_processo,
+    iniciar_processo,
+)
+from storage.catalogo import DATA_DIR  # noqa: E402
+from storage.resultados import hash_entrada  # noqa: E402
+
+SAIDA_DIR = os.path.join(DATA_DIR, "planos")
+VERSAO_ESTILO = 1  # mude ao alterar o relatório para invalidar os PDFs gerados
+PASSO_GIRO = 1.0  # graus, envoltória
+
+COLUNAS_RESUMO = [
+    "Caso", "Guindaste", "Valido", "Lanca", "Raio", "Giro", "Carga",
+    "Contrapeso", *(f"{p} [kN]" for p in PATOLAS), "Reacao_min [kN]",
+    "Estavel", "Margem [ton]", "Utilizacao_sapata", "Reacao_min_giro [kN]",
+    "Giro_critico", "Utilizacao_sapata_giro", "Capacidade_tabela [ton]",
+    "Utilizacao_tabela", "Arquivo",
+]
+
+
+@dataclass
+class CasoIcamento:
+    nome: str
+    entrada: object  # EntradaGuindaste
+    guindaste: str | None = None  # id no catálogo
+
+
+def casos_da_lista(lista, base, guindaste=None):
+    """
+    Um caso por linha da tabela de pontos da home (Ponto, Lanca, Raio,
+    Carga e, se houver, Giro e Contrapeso) sobre a configuração ``base``.
+    """
+    casos = []
+    for k, linha in enumerate(pd.DataFrame(lista).to_dict("records")):
+        linha = {c: v for c, v in linha.items() if not pd.isna(v)}
+        nome = str(linha.get("Ponto") or f"Caso {k + 1}")
+        lanca = base.lanca.copy()
+        lanca["Lanca"] = linha.get("Lanca", np.nan)
+        lanca["Raio"] = linha.get("Raio", np.nan)
+        entrada = replace(
+            base,
+            lanca=lanca,
+            cargas=pd.DataFrame([{"Desig": nome, "Carga": linha.get("Carga", np.nan)}]),
+            angulo_giro_deg=float(linha.get("Giro", base.angulo_giro_deg)),
+            contrapeso=float(linha.get("Contrapeso", base.contrapeso)),
+        )
+        casos.append(CasoIcamento(nome, entrada, linha.get("Guindaste", guindaste)))
+    return casos
+
+
+def nome_arquivo(caso, versao_tabela=""):
+    """'<nome>_<12 hex>.pdf'; o resumo muda com as entradas, a tabela e o estilo."""
+    chave = hash_entrada(caso.entrada, f"{versao_tabela}:{VERSAO_ESTILO}")
+    nome = re.sub(r"[^\w.-]+", "_", caso.nome).strip("_") or "caso"
+    return f"{nome}_{chave[:12]}.pdf"
+
+
+# =====================================================
+# AVALIAÇÃO
+# =====================================================
+
+
+def avaliar_caso(caso, curva=None):
+    """Resultados de um caso; None nos campos calculados se a entrada é inválida."""
+    e = caso.entrada
+    avaliacao = dict(caso=caso, valido=e.is_valid(), resultado=None, envoltoria=None)
+    avaliacao["capacidade"], avaliacao["utilizacao_tabela"] = np.nan, np.nan
+    if not avaliacao["valido"]:
+        return avaliacao
+
+    avaliacao["resultado"] = calcular_icamento(e)
+    avaliacao["envoltoria"] = envoltoria_pressao(
+        e, np.arange(0.0, 360.0, PASSO_GIRO)
+    )
+    if curva is not None:
+        avaliacao["capacidade"], avaliacao["utilizacao_tabela"] = utilizacao_tabela(
+            e, curva
+        )
+    return avaliacao
+
+
+def linha_resumo(avaliacao, arquivo=""):
+    caso = avaliacao["caso"]
+    e = caso.entrada
+    linha = dict.fromkeys(COLUNAS_RESUMO)
+    linha.update(
+        {
+            "Caso": caso.nome,
+            "Guindaste": caso.guindaste,
+            "Valido": avaliacao["valido"],
+            "Lanca": _float(e.lanca.get("Lanca")),
+            "Raio": _float(e.lanca.get("Raio")),
+            "Giro": e.angulo_giro_deg,
+            "Carga": _float(
+                pd.to_numeric(e.cargas["Carga"], errors="coerce").sum(min_count=1)
+            ),
+            "Contrapeso": e.contrapeso,
+            "Arquivo": arquivo,
+        }
+    )
+    r = avaliacao["resultado"]
+    if r is None:
+        return linha
+
+    for p in PATOLAS:
+        linha[f"{p} [kN]"] = r.reacoes[p] / 1e3
+    linha["Reacao_min [kN]"] = min(r.reacoes.values()) / 1e3
+    linha["Estavel"] = r.estavel
+    margem = r.margem().min()
+    linha["Margem [ton]"] = float(margem) if np.isfinite(margem) else None
+    linha["Utilizacao_sapata"] = r.utilizacao
+
+    env = avaliacao["envoltoria"]
+    k = np.unravel_index(env.reacoes.argmin(), env.reacoes.shape)[0]
+    linha["Reacao_min_giro [kN]"] = float(env.reacoes.min()) / 1e3
+    linha["Giro_critico"] = float(env.angulos[k])
+    if env.pressao_admissivel:
+        linha["Utilizacao_sapata_giro"] = float(
+            env.pressoes.max() / env.pressao_admissivel
+        )
+    linha["Capacidade_tabela [ton]"] = _float(avaliacao["capacidade"])
+    linha["Utilizacao_tabela"] = _float(avaliacao["utilizacao_tabela"])
+    return linha
+
+
+def _float(valor):
+    try:
+        valor = float(valor)
+    except (TypeError, ValueError):
+        return None
+    return valor if np.isfinite(valor) else None
+
+
+# =====================================================
+# DOCUMENTO
+# =====================================================
+
+
+def _tabela(ax, linhas, titulo):
+    ax.axis("off")
+    ax.set_title(titulo, loc="left", fontsize=10, fontweight="bold")
+    tabela = ax.table(cellText=linhas, loc="upper left", cellLoc="left")
+    tabela.auto_set_font_size(False)
+    tabela.set_fontsize(8)
+    tabela.scale(1, 1.25)
+
+
+def _fmt(valor, formato="{:.2f}", padrao="–"):
+    return padrao if valor is None else formato.format(valor)
+
+
+def _vista_superior(ax, entrada, reacoes):
+    """Mesma vista da página de patolas: patolas, polígono de apoio, CM e lança."""
+    pat = entrada.patolas
+    xy = pat[["X", "Y"]].to_numpy(dtype=float)
+    if len(xy) >= 3:
+        hull = xy[ConvexHull(xy).vertices]
+        ax.add_patch(
+            Polygon(hull, closed=True, facecolor=(0, 0, 1, 0.05), edgecolor="blue")
+        )
+    nomes = pat["Patola"] if "Patola" in pat else PATOLAS[: len(pat)]
+    for (x, y), nome in zip(xy, nomes):
+        cor = "red" if reacoes and reacoes.get(nome, 0.0) < 0 else "blue"
+        ax.plot(x, y, "o", color=cor, markersize=8)
+        ax.annotate(nome, (x, y), textcoords="offset points", xytext=(5, 5))
+
+    cm = entrada.centro_massa
+    R = float(entrada.lanca["Raio"])
+    theta = np.deg2rad(entrada.angulo_giro_deg)
+    ax.plot(cm["Xcm"], cm["Ycm"], "x", color="red", markersize=10, label="CM")
+    ax.plot(
+        [cm["Xcm"], cm["Xcm"] + R * np.cos(theta)],
+        [cm["Ycm"], cm["Ycm"] + R * np.sin(theta)],
+        "-o", color="black", linewidth=2, markersize=4, label="Lança (projeção)",
+    )
+    ax.set_aspect("equal", adjustable="datalim")
+    ax.grid(True, alpha=0.5)
+    ax.set_xlabel("X [m]")
+    ax.set_ylabel("Y [m]")
+    ax.set_title("Vista Superior – Patolas e Lança", fontsize=10)
+    ax.legend(loc="best", fontsize=7)
+
+
+def figura_plano(avaliacao):
+    """Figure A4 (sem pyplot) com entradas, reações, envoltória e vista superior."""
+    caso = avaliacao["caso"]
+    e = caso.entrada
+    linha = linha_resumo(avaliacao)
+    r = avaliacao["resultado"]
+
+    fig = Figure(figsize=(8.27, 11.69))
+    FigureCanvasAgg(fig)
+    fig.suptitle(f"Plano de Içamento – {caso.nome}", fontsize=14, fontweight="bold")
+    fig.text(
+        0.5, 0.955, f"Guindaste: {caso.guindaste or '–'}", ha="center", fontsize=9
+    )
+    grade = fig.add_gridspec(
+        3, 2, height_ratios=[0.8, 1.0, 1.5], left=0.08, right=0.96, top=0.92,
+        bottom=0.05, hspace=0.35, wspace=0.25,
+    )
+
+    solo, vi, vj = e.solo, float(e.vento["Vi"]), float(e.vento["Vj"])
+    _tabela(
+        fig.add_subplot(grade[0, 0]),
+        [
+            ["Lança", f"{_fmt(linha['Lanca'], '{:.1f}')} m"],
+            ["Raio", f"{_fmt(linha['Raio'], '{:.1f}')} m"],
+            ["Giro", f"{e.angulo_giro_deg:.0f}°"],
+            ["Carga", f"{_fmt(linha['Carga'])} ton"],
+            ["Peso do guindaste", f"{e.peso_guindaste:.2f} ton"],
+            ["Contrapeso", f"{e.contrapeso:.2f} ton"],
+            ["Vento i / j", f"{vi:.0f} / {vj:.0f} N"],
+            ["Solo", f"{solo.get('solo', '–')}"],
+            ["Área da sapata", f"{float(solo['soil_area_i']):.2f} m²"],
+            ["Pressão adm.", _fmt(_float(solo.get("soil_adm", np.nan)), "{:.0f} Pa")],
+        ],
+        "Entradas",
+    )
+
+    ax_res = fig.add_subplot(grade[0, 1])
+    if r is None:
+        ax_res.axis("off")
+        ax_res.text(0, 0.8, "Entradas inválidas: caso não calculado.", color="red")
+    else:
+        _tabela(
+            ax_res,
+            [[p, f"{linha[f'{p} [kN]']:.2f} kN"] for p in PATOLAS]
+            + [
+                ["Situação", "Estável" if r.estavel else "Perda de contato"],
+                ["Carga até descolamento", _fmt(linha["Margem [ton]"], "{:.2f} ton")],
+                ["Utilização da sapata", _fmt(linha["Utilizacao_sapata"], "{:.0%}")],
+                [
+                    "Capacidade da tabela",
+                    _fmt(linha["Capacidade_tabela [ton]"], "{:.2f} ton"),
+                ],
+                ["Utilização da tabela", _fmt(linha["Utilizacao_tabela"], "{:.0%}")],
+            ],
+            "Resultados",
+        )
+
+    ax_env = fig.add_subplot(grade[1, :])
+    env = avaliacao["envoltoria"]
+    if env is not None:
+        for k, p in enumerate(PATOLAS):
+            ax_env.plot(env.angulos, env.reacoes[:, k] / 1e3, label=p)
+        ax_env.axhline(0.0, color="red", linewidth=1, linestyle="--")
+        if env.pressao_admissivel:
+            ax_env.axhline(
+                env.pressao_admissivel * env.area / 1e3, color="gray",
+                linewidth=1, linestyle=":", label="Capacidade da sapata",
+            )
+        ax_env.axvline(e.angulo_giro_deg, color="black", linewidth=1, alpha=0.6)
+        ax_env.legend(loc="upper right", fontsize=7, ncol=5)
+    ax_env.set_xlim(0, 360)
+    ax_env.set_xlabel("Giro [°]")
+    ax_env.set_ylabel("Reação [kN]")
+    ax_env.set_title("Envoltória de Giro – Reações nas Patolas", fontsize=10)
+    ax_env.grid(True, alpha=0.5)
+
+    _vista_superior(
+        fig.add_subplot(grade[2, :]), e, r.reacoes if r is not None else None
+    )
+    return fig
+
+
+# =====================================================
+# LOTE
+# =====================================================
+
+
+def gerar_plano(caso, diretorio=SAIDA_DIR, catalogo=None):
+    """
+    Avalia e grava o PDF de um caso (pulado se já existe).
+    Retorna (linha do resumo, envoltória ou None).
+    """
+    curva, versao = None, ""
+    if caso.guindaste:
+        if catalogo is None:
+            catalogo = catalogo_do_processo(caso.guindaste)
+        if caso.guindaste in catalogo:
+            curva = catalogo.curva(caso.guindaste)
+            versao = catalogo.entrada(caso.guindaste).hash
+
+    avaliacao = avaliar_caso(caso, curva)
+    caminho = os.path.join(diretorio, nome_arquivo(caso, versao))
+    if not os.path.exists(caminho):
+        os.makedirs(diretorio, exist_ok=True)
+        parcial = f"{caminho}.{os.getpid()}.tmp"
+        with open(parcial, "wb") as f:
+            figura_plano(avaliacao).savefig(f, format="pdf")
+        os.replace(parcial, caminho)
+
+    env = avaliacao["envoltoria"]
+    return linha_resumo(avaliacao, caminho), (
+        None if env is None else (env.angulos, env.reacoes)
+    )
+
+
+def _gerar_no_worker(args):
+    return gerar_plano(*args)
+
+
+def gerar_planos(
+    casos, diretorio=SAIDA_DIR, arquivo_resumo="resumo.xlsx", n_processos=None,
+    catalogo=None,
+):
+    """
+    PDFs de todos os casos em paralelo e o resumo XLSX do lote (abas
+    Resumo e Envoltoria), gravado em streaming. Retorna o resumo como
+    DataFrame.
+    """
+    casos = list(casos)
+    os.makedirs(diretorio, exist_ok=True)
+
+    n_processos = n_processos or min(len(casos), os.cpu_count() or 1)
+    if n_processos <= 1 or len(casos) <= 1:
+        resultados = (gerar_plano(c, diretorio, catalogo) for c in casos)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=n_processos,
+            initializer=iniciar_processo,
+            initargs=(None if catalogo is None else catalogo.configuracao(),),
+        )
+        resultados = pool.map(
+            _gerar_no_worker,
+            [(c, diretorio) for c in casos],
+            chunksize=max(1, len(casos) // (4 * n_processos)),
+        )
+
+    livro = Workbook(write_only=True)
+    aba_resumo = livro.create_sheet("Resumo")
+    aba_resumo.append(COLUNAS_RESUMO)
+    aba_env = livro.create_sheet("Envoltoria")
+    aba_env.append(["Caso", "Giro", *(f"{p} [kN]" for p in PATOLAS)])
+
+    linhas = []
+    try:
+        for linha, env in resultados:
+            aba_resumo.append([linha[c] for c in COLUNAS_RESUMO])
+            if env is not None:
+                angulos, reacoes = env
+                for giro, r in zip(angulos.tolist(), (reacoes / 1e3).tolist()):
+                    aba_env.append([linha["Caso"], giro, *r])
+            linhas.append(linha)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    caminho = os.path.join(diretorio, arquivo_resumo)
+    parcial = f"{caminho}.{os.getpid()}.tmp"
+    livro.save(parcial)
+    os.replace(parcial, caminho)
+    return pd.DataFrame(linhas, columns=COLUNAS_RESUMO)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("lista", help="CSV/XLSX com Ponto, Lanca, Raio, Carga")
+    parser.add_argument("--base", required=True, help="JSON com as tabelas de patolas")
+    parser.add_argument("--guindaste", help="id do guindaste no catálogo")
+    parser.add_argument("--saida", default=SAIDA_DIR, help="diretório de saída")
+    parser.add_argument("-j", dest="processos", type=int, help="processos em paralelo")
+    args = parser.parse_args(argv)
+
+    with open(args.base, encoding="utf-8") as f:
+        base = construir_entrada(**json.load(f))
+    if args.lista.lower().endswith(".csv"):
+        lista = pd.read_csv(args.lista)
+    else:
+        lista = pd.read_excel(args.lista)
+
+    t0 = time.perf_counter()
+    resumo = gerar_planos(
+        casos_da_lista(lista, base, args.guindaste),
+        diretorio=args.saida,
+        n_processos=args.processos,
+    )
+    reprovados = (~resumo["Estavel"].fillna(False).astype(bool)).sum()
+    print(
+        f"{len(resumo)} planos em {args.saida} ({reprovados} inválidos ou "
+        f"instáveis), {time.perf_counter() - t0:.1f} s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+# relatorios/tabelas_carga.py
+"""
+Imagens das tabelas de carga de todos os guindastes do catálogo.
+
+Mesmo gráfico do antigo ``curva_carga_gundaste_vre1.py`` (capacidade em
+cores, linhas de lança tracejadas), mas sem tela: matplotlib com o canvas
+Agg, um processo por guindaste e saída em PNG, SVG ou PDF.
+
+- a malha interpolada vem de ``Catalogo.malha``, a mesma do mapa do Dash
+  (cache em disco por hash da tabela), então não é recalculada aqui
+- cada arquivo leva no nome um resumo do hash da tabela e da versão do
+  estilo: se já existe, o guindaste é pulado; se a tabela mudou, o arquivo
+  antigo daquele guindaste é apagado após gerar o novo
+
+Uso:
+    python -m relatorios.tabelas_carga                    # PNG de todos
+    python -m relatorios.tabelas_carga -f png -f pdf -j 4 --saida livro/
+    python -m relatorios.tabelas_carga -k 80TON           # filtra pelo id
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import MultipleLocator
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from storage.catalogo import DATA_DIR, Catalogo  # noqa: E402
+
+SAIDA_DIR = os.path.join(DATA_DIR, "tabelas_carga")
+FORMATOS = ("png", "svg", "pdf")
+VERSAO_ESTILO = 1  # mude ao alterar o gráfico para invalidar os arquivos gerados
+PONTOS_MALHA = 120
+NIVEIS = 30
+DPI = 200
+
+
+def nome_arquivo(entrada, formato, n=PONTOS_MALHA):
+    """'<id>_<12 hex>.<formato>'; o resumo muda com a tabela, a malha e o estilo."""
+    chave = f"{entrada.hash}:{n}:{VERSAO_ESTILO}".encode()
+    return f"{entrada.id}_{hashlib.sha256(chave).hexdigest()[:12]}.{formato}"
+
+
+def figura_tabela(entrada, malha):
+    """Figure (sem pyplot) da tabela de carga a partir da MalhaCarga."""
+    fig = Figure(figsize=(10, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    X, Y = np.meshgrid(malha.x, malha.y)
+
+    # Capacidade em cores
+    cs_carga = ax.contourf(
+        X, Y, malha.carga, levels=NIVEIS, cmap="jet", extend="both"
+    )
+    fig.colorbar(cs_carga, ax=ax, label="Carga [ton]")
+
+    # Linhas de lança
+    cs_lanca = ax.contour(
+        X, Y, malha.lanca, levels=NIVEIS, colors="red", linewidths=1.0,
+        linestyles=":",
+    )
+    ax.clabel(cs_lanca, inline=True, fontsize=8, fmt="L=%1.0f m", colors="red")
+    ax.plot([], [], color="red", linestyle=":", linewidth=1.0, label="Lança [m]")
+
+    ax.set_xlabel("Raio [m]")
+    ax.set_ylabel("Altura [m]")
+    ax.set_title(
+        "Região Operacional Válida do Guindaste - Carga (Cores) e Lança (Linhas)"
+    )
+    fig.suptitle(entrada.nome, fontsize=16, fontweight="bold")
+    ax.grid(True, linestyle="-", alpha=0.6)
+    ax.xaxis.set_major_locator(MultipleLocator(2))
+    ax.yaxis.set_major_locator(MultipleLocator(2))
+    ax.legend(loc="lower right")
+
+    fig.text(
+        0.01,
+        0.01,
+        f"Capacidade máx. {entrada.capacidade_max:g} t ({entrada.classe}) · "
+        f"lança {entrada.lanca_min:g}–{entrada.lanca_max:g} m · "
+        f"{entrada.arquivo} ({entrada.hash[:12]})",
+        fontsize=7,
+        color="gray",
+    )
+    return fig
+
+
+def _gravar(fig, caminho, formato):
+    # escrita atômica: uma execução paralela nunca vê um arquivo pela metade
+    parcial = f"{caminho}.{os.getpid()}.tmp"
+    with open(parcial, "wb") as f:
+        fig.savefig(f, format=formato, dpi=DPI)
+    os.replace(parcial, caminho)
+
+
+def _apagar_antigos(diretorio, entrada, formato, atual):
+    padrao = re.compile(rf"{re.escape(entrada.id)}_[0-9a-f]{{12}}\.{formato}")
+    for nome in os.listdir(diretorio):
+        if nome != atual and padrao.fullmatch(nome):
+            try:
+                os.remove(os.path.join(diretorio, nome))
+            except FileNotFoundError:
+                pass
+
+
+def renderizar_tabela(catalogo, id_entrada, formatos=("png",), diretorio=SAIDA_DIR):
+    """
+    Gera as imagens de um guindaste nos formatos pedidos; formatos cujo
+    arquivo já existe para esta tabela são pulados. Retorna uma linha por
+    formato: id, formato, arquivo, gerado (False = reaproveitado), segundos.
+    """
+    entrada = catalogo.entrada(id_entrada)
+    os.makedirs(diretorio, exist_ok=True)
+    linhas, fig = [], None
+    for formato in formatos:
+        t0 = time.perf_counter()
+        nome = nome_arquivo(entrada, formato)
+        caminho = os.path.join(diretorio, nome)
+        gerado = not os.path.exists(caminho)
+        if gerado:
+            if fig is None:
+                fig = figura_tabela(entrada, catalogo.malha(id_entrada, PONTOS_MALHA))
+            _gravar(fig, caminho, formato)
+            _apagar_antigos(diretorio, entrada, formato, nome)
+        linhas.append(
+            dict(
+                id=entrada.id,
+                nome=entrada.nome,
+                formato=formato,
+                arquivo=caminho,
+                gerado=gerado,
+                segundos=time.perf_counter() - t0,
+            )
+        )
+    return linhas
+
+
+# Catálogo próprio de cada processo do pool (sem observador), recriado com a
+# configuração do catálogo do processo principal
+_catalogo_worker = None
+_configuracao_worker = None
+
+
+def iniciar_processo(configuracao=None):
+    """Initializer do pool: ``Catalogo.configuracao()`` do catálogo a usar."""
+    global _catalogo_worker, _configuracao_worker
+    _catalogo_worker, _configuracao_worker = None, configuracao
+
+
+def catalogo_do_processo(id_entrada=None):
+    """Catálogo do processo do pool; relido se ``id_entrada`` ainda não consta."""
+    global _catalogo_worker
+    if _catalogo_worker is None or (
+        id_entrada is not None and id_entrada not in _catalogo_worker
+    ):
+        if _configuracao_worker is None:
+            _catalogo_worker = Catalogo.do_ambiente()
+        else:
+            _catalogo_worker = Catalogo(**_configuracao_worker)
+    return _catalogo_worker
+
+
+def _renderizar_no_worker(id_entrada, formatos, diretorio):
+    catalogo = catalogo_do_processo(id_entrada)
+    return renderizar_tabela(catalogo, id_entrada, formatos, diretorio)
+
+
+def renderizar_catalogo(
+    formatos=("png",), diretorio=SAIDA_DIR, n_processos=None, filtro=None,
+    catalogo=None,
+):
+    """
+    Imagens de todo o catálogo em paralelo (um guindaste por tarefa).
+    Guindastes com todos os arquivos em dia não chegam ao pool.
+    Retorna um DataFrame com uma linha por guindaste e formato.
+    """
+    formatos = tuple(formatos)
+    for formato in formatos:
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato inválido: {formato} (use {FORMATOS})")
+    if catalogo is None:
+        catalogo = Catalogo.do_ambiente()
+    entradas = [e for e in catalogo.entradas() if not filtro or filtro in e.id]
+
+    linhas, pendentes = [], []
+    for e in entradas:
+        if all(
+            os.path.exists(os.path.join(diretorio, nome_arquivo(e, f)))
+            for f in formatos
+        ):
+            linhas += renderizar_tabela(catalogo, e.id, formatos, diretorio)
+        else:
+            pendentes.append(e.id)
+
+    n_processos = n_processos or min(len(pendentes), os.cpu_count() or 1)
+    if n_processos <= 1 or len(pendentes) <= 1:
+        for id_entrada in pendentes:
+            linhas += renderizar_tabela(catalogo, id_entrada, formatos, diretorio)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_processos,
+            initializer=iniciar_processo,
+            initargs=(catalogo.configuracao(),),
+        ) as pool:
+            futuros = [
+                pool.submit(_renderizar_no_worker, i, formatos, diretorio)
+                for i in pendentes
+            ]
+            for futuro in futuros:
+                linhas += futuro.result()
+
+    colunas = ["id", "nome", "formato", "arquivo", "gerado", "segundos"]
+    return pd.DataFrame(linhas, columns=colunas)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "-f", "--formato", action="append", choices=FORMATOS,
+        help="formato de saída (repetível; padrão png)",
+    )
+    parser.add_argument("--saida", default=SAIDA_DIR, help="diretório de saída")
+    parser.add_argument("-j", dest="processos", type=int, help="processos em paralelo")
+    parser.add_argument("-k", dest="filtro", help="só ids que contêm o texto")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    indice = renderizar_catalogo(
+        formatos=args.formato or ("png",),
+        diretorio=args.saida,
+        n_processos=args.processos,
+        filtro=args.filtro,
+    )
+    for r in indice.itertuples():
+        status = "gerado" if r.gerado else "em dia"
+        print(f"{r.id:<30} {r.formato:<4} {status:<7} {r.arquivo}")
+    print(
+        f"{int(indice['gerado'].sum())} gerados, {int((~indice['gerado']).sum())} "
+        f"em dia, {time.perf_counter() - t0:.1f} s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
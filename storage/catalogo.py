@@ -0,0 +1,353 @@
+# storage/catalogo.py
+"""
+Catálogo das tabelas de carga encontradas em ``data/``.
+
+- índice de metadados por arquivo (nome, classe de capacidade, faixa de
+  lança, hash do conteúdo), persistido em ``data/catalogo.json``: na partida
+  só arquivos novos ou alterados (mtime/tamanho) são lidos
+- corpo das tabelas carregado só no primeiro uso e mantido em LRU
+- malha interpolada (MalhaCarga) guardada em disco pelo hash da tabela: o
+  mapa do Dash e as imagens das tabelas usam a mesma, calculada uma vez
+- observador: thread que reexamina o diretório periodicamente, então
+  tabelas adicionadas ou alteradas aparecem sem reiniciar os workers
+
+Cada arquivo CSV/XLSX com colunas Raio, Lanca e Carga vira uma entrada; o
+id é o nome do arquivo sem extensão.
+
+Variáveis de ambiente:
+- CRANE_DATA_DIR=data                -> diretório das tabelas
+- CRANE_CATALOG_INDEX=catalogo.json  -> arquivo do índice (padrão no diretório)
+- CRANE_CATALOG_POLL_S=5             -> intervalo do observador (0 desliga)
+- CRANE_CACHE_DIR=data/cache         -> malhas interpoladas
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+import pandas as pd
+
+from engine.curva_carga import CurvaCarga, MalhaCarga
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+
+EXTENSOES = (".xlsx", ".xlsm", ".csv")
+COLUNAS = ("Raio", "Lanca", "Carga")
+CLASSES = (25, 50, 100, 200, 400, 800)  # ton
+
+
+@dataclass(frozen=True)
+class EntradaCatalogo:
+    id: str  # nome do arquivo sem extensão
+    nome: str
+    arquivo: str  # nome do arquivo no diretório
+    hash: str  # sha256 do conteúdo
+    mtime: float
+    tamanho: int  # bytes
+    capacidade_max: float  # ton
+    classe: str
+    lanca_min: float  # m
+    lanca_max: float  # m
+    raio_max: float  # m
+    linhas: int
+
+
+def classe_capacidade(capacidade):
+    for limite in CLASSES:
+        if capacidade <= limite:
+            return f"até {limite} t"
+    return f"acima de {CLASSES[-1]} t"
+
+
+def nome_padrao(id_arquivo):
+    """'guindaste_80TON' -> 'Guindaste 80TON'."""
+    nome = id_arquivo.replace("_", " ").replace("-", " ").strip()
+    return nome[:1].upper() + nome[1:]
+
+
+def ler_tabela(caminho):
+    if caminho.lower().endswith(".csv"):
+        return pd.read_csv(caminho)
+    return pd.read_excel(caminho)
+
+
+def _hash_arquivo(caminho):
+    h = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(2**20), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _metadados(caminho, stat):
+    """Lê a tabela uma vez para montar a entrada; None se não é tabela de carga."""
+    df = ler_tabela(caminho)
+    if not set(COLUNAS) <= set(df.columns):
+        return None
+    df = df[list(COLUNAS)].apply(pd.to_numeric, errors="coerce").dropna()
+    if len(df) < 3:
+        return None
+    arquivo = os.path.basename(caminho)
+    id_arquivo = os.path.splitext(arquivo)[0]
+    capacidade = float(df["Carga"].max())
+    return EntradaCatalogo(
+        id=id_arquivo,
+        nome=nome_padrao(id_arquivo),
+        arquivo=arquivo,
+        hash=_hash_arquivo(caminho),
+        mtime=stat.st_mtime,
+        tamanho=stat.st_size,
+        capacidade_max=capacidade,
+        classe=classe_capacidade(capacidade),
+        lanca_min=float(df["Lanca"].min()),
+        lanca_max=float(df["Lanca"].max()),
+        raio_max=float(df["Raio"].max()),
+        linhas=len(df),
+    )
+
+
+class Catalogo:
+
+    def __init__(
+        self,
+        diretorio=DATA_DIR,
+        arquivo_indice=None,
+        max_tabelas=32,
+        diretorio_cache=None,
+    ):
+        self.diretorio = diretorio
+        self.arquivo_indice = arquivo_indice or os.path.join(
+            diretorio, "catalogo.json"
+        )
+        self.max_tabelas = max_tabelas
+        self.diretorio_cache = diretorio_cache or os.path.join(diretorio, "cache")
+
+        self._lock = threading.RLock()
+        self._entradas = {}  # id -> EntradaCatalogo
+        self._ignorados = {}  # arquivo -> [mtime, tamanho] (não é tabela de carga)
+        self._tabelas = OrderedDict()  # (id, hash) -> DataFrame, LRU
+        self._curvas = OrderedDict()  # (id, hash) -> CurvaCarga, LRU
+        self._observador = None
+
+        self._carregar_indice()
+        self.atualizar()
+
+    @classmethod
+    def do_ambiente(cls):
+        """Cria o catálogo a partir das variáveis de ambiente CRANE_*."""
+        return cls(
+            diretorio=os.environ.get("CRANE_DATA_DIR", DATA_DIR),
+            arquivo_indice=os.environ.get("CRANE_CATALOG_INDEX"),
+            diretorio_cache=os.environ.get("CRANE_CACHE_DIR"),
+        )
+
+    def configuracao(self):
+        """Argumentos para recriar este catálogo em outro processo (picklable)."""
+        return dict(
+            diretorio=self.diretorio,
+            arquivo_indice=self.arquivo_indice,
+            max_tabelas=self.max_tabelas,
+            diretorio_cache=self.diretorio_cache,
+        )
+
+    # -----------------------------
+    # Índice
+    # -----------------------------
+    def _carregar_indice(self):
+        try:
+            with open(self.arquivo_indice, encoding="utf-8") as f:
+                dados = json.load(f)
+            self._entradas = {
+                e["id"]: EntradaCatalogo(**e) for e in dados.get("entradas", [])
+            }
+            self._ignorados = dados.get("ignorados", {})
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            self._entradas, self._ignorados = {}, {}
+
+    def _salvar_indice(self):
+        dados = {
+            "entradas": [asdict(e) for e in self._entradas.values()],
+            "ignorados": self._ignorados,
+        }
+        pasta = os.path.dirname(os.path.abspath(self.arquivo_indice))
+        os.makedirs(pasta, exist_ok=True)
+        parcial = f"{self.arquivo_indice}.{os.getpid()}.tmp"
+        with open(parcial, "w", encoding="utf-8") as f:
+            json.dump(dados, f, ensure_ascii=False, indent=1)
+        os.replace(parcial, self.arquivo_indice)
+
+    def atualizar(self):
+        """
+        Reexamina o diretório (só stat); relê apenas arquivos novos ou
+        alterados. Retorna (ids novos ou alterados, ids removidos).
+        """
+        with self._lock:
+            por_arquivo = {e.arquivo: e for e in self._entradas.values()}
+            vistos, alterados, removidos = set(), [], []
+            for arquivo in sorted(os.listdir(self.diretorio)):
+                if not arquivo.lower().endswith(EXTENSOES):
+                    continue
+                caminho = os.path.join(self.diretorio, arquivo)
+                try:
+                    stat = os.stat(caminho)
+                except FileNotFoundError:
+                    continue
+                vistos.add(arquivo)
+                assinatura = [stat.st_mtime, stat.st_size]
+                atual = por_arquivo.get(arquivo)
+                if atual is not None and [atual.mtime, atual.tamanho] == assinatura:
+                    continue
+                if self._ignorados.get(arquivo) == assinatura:
+                    continue
+                try:
+                    entrada = _metadados(caminho, stat)
+                except Exception:
+                    logger.exception("Falha ao ler a tabela de carga %s", caminho)
+                    entrada = None
+                if entrada is None:
+                    self._ignorados[arquivo] = assinatura
+                    if atual is not None:
+                        del self._entradas[atual.id]
+                        removidos.append(atual.id)
+                    continue
+                self._ignorados.pop(arquivo, None)
+                self._entradas[entrada.id] = entrada
+                alterados.append(entrada.id)
+
+            for e in list(self._entradas.values()):
+                if e.arquivo not in vistos:
+                    del self._entradas[e.id]
+                    removidos.append(e.id)
+            self._ignorados = {
+                a: s for a, s in self._ignorados.items() if a in vistos
+            }
+            if alterados or removidos:
+                self._salvar_indice()
+            return alterados, removidos
+
+    # -----------------------------
+    # Consulta
+    # -----------------------------
+    def __contains__(self, id_entrada):
+        return id_entrada in self._entradas
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def entrada(self, id_entrada):
+        return self._entradas.get(id_entrada)
+
+    def entradas(self):
+        """Entradas em ordem de capacidade e nome."""
+        return sorted(
+            self._entradas.values(), key=lambda e: (e.capacidade_max, e.nome)
+        )
+
+    def opcoes(self):
+        """[(id, rótulo)] para listas de seleção."""
+        return [(e.id, e.nome) for e in self.entradas()]
+
+    def indice(self):
+        """Metadados de todas as entradas como DataFrame."""
+        return pd.DataFrame([asdict(e) for e in self.entradas()])
+
+    def tabela(self, id_entrada):
+        """Tabela (Raio, Lanca, Carga) carregada no primeiro uso; KeyError se ausente."""
+        entrada = self._entradas[id_entrada]
+        chave = (entrada.id, entrada.hash)
+        with self._lock:
+            df = self._tabelas.get(chave)
+            if df is not None:
+                self._tabelas.move_to_end(chave)
+                return df
+        df = ler_tabela(os.path.join(self.diretorio, entrada.arquivo))
+        df = df[list(COLUNAS)].apply(pd.to_numeric, errors="coerce").dropna()
+        df = df.reset_index(drop=True)
+        with self._lock:
+            self._tabelas[chave] = df
+            while len(self._tabelas) > self.max_tabelas:
+                self._tabelas.popitem(last=False)
+        return df
+
+    def curva(self, id_entrada):
+        """CurvaCarga (triangulação e interpolador) da tabela, mantida em LRU."""
+        entrada = self._entradas[id_entrada]
+        chave = (entrada.id, entrada.hash)
+        with self._lock:
+            curva = self._curvas.get(chave)
+            if curva is not None:
+                self._curvas.move_to_end(chave)
+                return curva
+        curva = CurvaCarga(self.tabela(id_entrada))
+        with self._lock:
+            self._curvas[chave] = curva
+            while len(self._curvas) > self.max_tabelas:
+                self._curvas.popitem(last=False)
+        return curva
+
+    def malha(self, id_entrada, n=120):
+        """MalhaCarga n x n da tabela, do disco se já calculada para este hash."""
+        entrada = self._entradas[id_entrada]
+        caminho = os.path.join(
+            self.diretorio_cache, f"malha_{entrada.hash[:20]}_{n}.npz"
+        )
+        try:
+            return MalhaCarga.carregar(caminho)
+        except (FileNotFoundError, OSError, ValueError, KeyError):
+            pass
+        malha = self.curva(id_entrada).malha(n)
+        os.makedirs(self.diretorio_cache, exist_ok=True)
+        parcial = f"{caminho}.{os.getpid()}.tmp.npz"
+        malha.salvar(parcial)
+        os.replace(parcial, caminho)
+        return malha
+
+    # -----------------------------
+    # Observador
+    # -----------------------------
+    def iniciar_observador(self, intervalo_s=5.0):
+        """Thread que chama atualizar() a cada intervalo_s segundos."""
+        if self._observador is not None or intervalo_s <= 0:
+            return
+
+        def observar():
+            while True:
+                time.sleep(intervalo_s)
+                try:
+                    alterados, removidos = self.atualizar()
+                    if alterados or removidos:
+                        logger.info(
+                            "Catálogo atualizado: %s novos/alterados, %s removidos",
+                            alterados,
+                            removidos,
+                        )
+                except Exception:
+                    logger.exception("Falha ao atualizar o catálogo")
+
+        self._observador = threading.Thread(
+            target=observar, name="catalogo-observador", daemon=True
+        )
+        self._observador.start()
+
+
+_catalogo = None
+_catalogo_lock = threading.Lock()
+
+
+def catalogo_padrao():
+    """Instância compartilhada do processo, com observador, criada no primeiro uso."""
+    global _catalogo
+    with _catalogo_lock:
+        if _catalogo is None:
+            _catalogo = Catalogo.do_ambiente()
+            _catalogo.iniciar_observador(
+                float(os.environ.get("CRANE_CATALOG_POLL_S", 5))
+            )
+        return _catalogo
@@ -0,0 +1,253 @@
+# storage/conjuntos.py
+"""
+Conjuntos de dados colunares no servidor para tabelas grandes.
+
+Uma tabela em modo servidor (``TabelaDadosComponent(modo_servidor=True)``)
+guarda as linhas aqui, em um DataFrame com um ``id`` estável por linha, e
+o navegador recebe só a página visível. Paginação, ordenação e filtro
+(sintaxe ``filter_query`` do DataTable) são feitos com pandas no servidor.
+
+Os conjuntos ficam em um armazém próprio (``armazem_conjuntos``), separado
+do armazém de sessão usado por handles e progresso: são poucos, grandes e
+precisam durar enquanto a página está aberta, então não devem ser despejados
+por uma rajada de resultados pequenos. Variáveis de ambiente:
+
+- CRANE_DATASET_TTL_S=28800    -> tempo de vida de cada conjunto
+- CRANE_DATASET_MAX_ITENS=64   -> máximo de conjuntos antes do despejo
+- CRANE_DATASET_DIR=...        -> backend em disco; padrão
+                                  <diretório da sessão>/conjuntos
+"""
+import math
+import re
+import threading
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from storage.sessao import armazem_do_ambiente, diretorio_sessao
+
+# Operadores do filter_query do DataTable: símbolo -> nome
+SIMBOLOS = {">=": "ge", "<=": "le", "!=": "ne", "<": "lt", ">": "gt", "=": "eq"}
+OPERADORES = ("eq", "ne", "lt", "le", "gt", "ge", "contains", "datestartswith")
+
+# '{coluna} operador valor'; o operador é o primeiro termo após a coluna (com
+# prefixo opcional s/i de maiúsculas) e o valor é todo o resto, que pode
+# conter espaços, símbolos ou palavras iguais a operadores
+_PARTE = re.compile(
+    r"^\s*\{(?P<nome>[^}]+)\}\s*"
+    r"(?:[si]?(?P<simbolo>>=|<=|!=|=|<|>)"
+    r"|[si]?(?P<palavra>" + "|".join(OPERADORES) + r")(?=\s|$))"
+    r"\s*(?P<valor>.*?)\s*$",
+    re.S,
+)
+
+
+# =====================================================
+# FILTRO E ORDENAÇÃO
+# =====================================================
+
+
+def separar_filtro(parte):
+    """
+    '{Raio} >= 10' -> ('Raio', 'ge', '10'); (None, None, None) se inválido.
+    O valor fica como texto (sem aspas); aplicar_filtro decide pela coluna.
+    """
+    m = _PARTE.match(parte)
+    if not m:
+        return None, None, None
+    operador = m["palavra"] or SIMBOLOS[m["simbolo"]]
+    valor = m["valor"]
+    if len(valor) >= 2 and valor[0] == valor[-1] and valor[0] in "'\"`":
+        valor = valor[1:-1].replace("\\" + valor[0], valor[0])
+    return m["nome"], operador, valor
+
+
+def _numero(valor):
+    try:
+        return float(valor)
+    except ValueError:
+        return None
+
+
+def aplicar_filtro(df, filtro):
+    """
+    Linhas de df que satisfazem o filter_query (partes unidas por &&).
+    Como no DataTable, contains/datestartswith comparam texto e os demais
+    operadores comparam números só em colunas numéricas.
+    """
+    if not filtro:
+        return df
+    mascara = np.ones(len(df), dtype=bool)
+    for parte in filtro.split(" && "):
+        nome, operador, valor = separar_filtro(parte)
+        if nome not in df:
+            continue
+        serie = df[nome]
+        if operador == "contains":
+            ok = serie.astype("string").str.contains(valor, case=False, regex=False)
+        elif operador == "datestartswith":
+            ok = serie.astype("string").str.startswith(valor)
+        elif pd.api.types.is_numeric_dtype(serie) and _numero(valor) is not None:
+            ok = getattr(serie, operador)(_numero(valor))
+        else:
+            ok = getattr(serie.astype("string"), operador)(valor)
+        mascara &= ok.fillna(False).to_numpy(dtype=bool)
+    return df[mascara]
+
+
+def ordenar(df, ordenacao):
+    """Ordena pelo sort_by do DataTable; sem ordenação mantém a ordem de inserção."""
+    ordenacao = [o for o in (ordenacao or []) if o["column_id"] in df]
+    if not ordenacao:
+        return df
+    return df.sort_values(
+        [o["column_id"] for o in ordenacao],
+        ascending=[o["direction"] == "asc" for o in ordenacao],
+        kind="mergesort",
+        na_position="last",
+    )
+
+
+# =====================================================
+# CONJUNTO
+# =====================================================
+
+
+class ConjuntoDados:
+
+    def __init__(self, colunas, registros=(), numericas=()):
+        self.colunas = list(colunas)
+        numericas = set(numericas)
+        self.numericas = [c for c in self.colunas if c in numericas]
+        self.versao = 0
+        self._proximo_id = 0
+        self.df = self._normalizar(pd.DataFrame(columns=self.colunas))
+        self.df.index = pd.Index([], dtype="int64", name="id")
+        self.adicionar(registros)
+
+    @classmethod
+    def de_colunas_tabela(cls, columns, registros=()):
+        """A partir das colunas no formato do DataTable (type numeric)."""
+        return cls(
+            [c["id"] for c in columns],
+            registros,
+            [c["id"] for c in columns if c.get("type") == "numeric"],
+        )
+
+    def __len__(self):
+        return len(self.df)
+
+    @property
+    def proximo_id(self):
+        """Id da próxima linha; ids vão de 0 a proximo_id - 1, sem reuso."""
+        return self._proximo_id
+
+    def _normalizar(self, df):
+        df = df.reindex(columns=self.colunas)
+        for c in self.colunas:
+            if c in self.numericas:
+                df[c] = pd.to_numeric(df[c], errors="coerce").astype(float)
+            else:
+                df[c] = df[c].astype(object)
+        return df
+
+    # -----------------------------
+    # Escrita
+    # -----------------------------
+    def adicionar(self, registros):
+        """Acrescenta linhas ao fim; retorna os ids criados."""
+        novos = self._normalizar(pd.DataFrame(list(registros)))
+        ids = np.arange(self._proximo_id, self._proximo_id + len(novos))
+        if len(novos) == 0:
+            return []
+        novos.index = pd.Index(ids, name="id")
+        self._proximo_id += len(novos)
+        self.df = pd.concat([self.df, novos]) if len(self.df) else novos
+        self.versao += 1
+        return ids.tolist()
+
+    def atualizar(self, registros):
+        """Aplica linhas editadas (com 'id'); retorna só os ids que mudaram."""
+        novos = pd.DataFrame(list(registros))
+        if novos.empty or "id" not in novos:
+            return []
+        novos = novos.drop_duplicates("id", keep="last")
+        novos = novos[novos["id"].isin(self.df.index)].set_index("id")
+        novos = self._normalizar(novos)
+        atuais = self.df.loc[novos.index]
+        iguais = (atuais == novos) | (atuais.isna() & novos.isna())
+        mudaram = novos.index[~iguais.all(axis=1).to_numpy()]
+        if len(mudaram):
+            self.df.loc[mudaram] = novos.loc[mudaram]
+            self.versao += 1
+        return mudaram.tolist()
+
+    def remover(self, ids):
+        ids = self.df.index.intersection(pd.Index(list(ids)))
+        if len(ids):
+            self.df = self.df.drop(ids)
+            self.versao += 1
+        return ids.tolist()
+
+    # -----------------------------
+    # Leitura
+    # -----------------------------
+    def dataframe(self):
+        return self.df.copy()
+
+    def registros(self, ids=None):
+        """Linhas como dicts (com 'id'), NaN como None, prontas para o DataTable."""
+        df = self.df if ids is None else self.df.loc[self.df.index.intersection(ids)]
+        return _registros(df)
+
+    def pagina(self, pagina=0, tamanho=50, ordenacao=None, filtro=""):
+        """(registros da página, número de páginas) após filtro e ordenação."""
+        df = ordenar(aplicar_filtro(self.df, filtro), ordenacao)
+        n_paginas = max(1, math.ceil(len(df) / tamanho))
+        pagina = min(max(int(pagina or 0), 0), n_paginas - 1)
+        return _registros(df.iloc[pagina * tamanho : (pagina + 1) * tamanho]), n_paginas
+
+
+def _registros(df):
+    df = df.reset_index().astype(object)
+    return df.where(df.notna(), None).to_dict("records")
+
+
+# =====================================================
+# REGISTRO NO ARMAZÉM DE CONJUNTOS
+# =====================================================
+
+
+_armazem = None
+_armazem_lock = threading.Lock()
+
+
+def armazem_conjuntos():
+    """Armazém dos conjuntos do processo, criado no primeiro uso."""
+    global _armazem
+    with _armazem_lock:
+        if _armazem is None:
+            _armazem = armazem_do_ambiente(
+                "CRANE_DATASET",
+                ttl_s=8 * 3600.0,
+                max_itens=64,
+                diretorio=diretorio_sessao("conjuntos"),
+            )
+        return _armazem
+
+
+def novo_conjunto(conjunto):
+    """Guarda um conjunto novo e retorna a chave."""
+    chave = uuid.uuid4().hex[:20]
+    armazem_conjuntos().guardar(conjunto, handle=chave)
+    return chave
+
+
+def obter_conjunto(chave):
+    return armazem_conjuntos().obter(chave) if chave else None
+
+
+def salvar_conjunto(chave, conjunto):
+    """Grava de volta após alterações (renova o TTL; necessário no backend em disco)."""
+    armazem_conjuntos().guardar(conjunto, handle=chave)
@@ -0,0 +1,407 @@
+# storage/importacao.py
+"""
+Importação de listas de içamento e tabelas de carga (CSV/XLSX) em blocos.
+
+O ``contents`` do ``dcc.Upload`` chega inteiro na requisição (base64), mas
+daqui em diante nada é carregado de uma vez:
+
+1. o base64 é decodificado em fatias para um arquivo temporário
+2. o arquivo é lido em blocos de linhas (CSV com ``chunksize``, XLSX com
+   openpyxl em modo read-only)
+3. cada bloco é validado de forma vetorizada e gravado no destino (o
+   ConjuntoDados da tabela, ou o XLSX da tabela de carga em modo
+   write-only) antes de ler o próximo
+
+O andamento é informado por ``progresso(fracao, mensagem)``; com
+``progresso_no_armazem`` ele fica no armazém de sessão, onde um
+``dcc.Interval`` o lê enquanto o callback de importação roda.
+"""
+import base64
+import codecs
+import csv
+import os
+import re
+import tempfile
+import unicodedata
+import zipfile
+from dataclasses import dataclass, field
+from itertools import count, islice
+from xml.etree.ElementTree import ParseError
+
+import numpy as np
+import pandas as pd
+
+from storage.catalogo import EXTENSOES
+from storage.sessao import armazem_sessao
+
+TAMANHO_BLOCO = 5000  # linhas por bloco
+FATIA_BASE64 = 4 * 2**18  # caracteres por fatia (múltiplo de 4)
+MAX_ERROS = 200  # erros guardados para exibição
+
+COLUNAS_TABELA_CARGA = ("Raio", "Lanca", "Carga")
+
+
+@dataclass
+class ResultadoImportacao:
+    linhas: int = 0  # linhas válidas gravadas
+    total_erros: int = 0
+    erros: pd.DataFrame = field(
+        default_factory=lambda: pd.DataFrame(columns=["Linha", "Motivo"])
+    )
+    ids: list = field(default_factory=list)  # ids criados no conjunto
+    caminho: str | None = None  # arquivo gerado (tabela de carga)
+
+    def resumo(self):
+        texto = f"{self.linhas} linhas importadas"
+        if self.total_erros:
+            texto += f", {self.total_erros} rejeitadas"
+            primeiros = self.erros.head(3)
+            texto += " (" + "; ".join(
+                f"linha {l}: {m}" for l, m in zip(primeiros.Linha, primeiros.Motivo)
+            ) + ")"
+        return texto
+
+
+def progresso_no_armazem(handle):
+    """Função de progresso que grava (fração, mensagem) sob o handle."""
+    armazem = armazem_sessao()
+
+    def progresso(fracao, mensagem):
+        armazem.guardar((fracao, mensagem), handle=handle)
+
+    return progresso
+
+
+def ler_progresso(handle):
+    """(fração, mensagem) gravados por progresso_no_armazem, ou None."""
+    return armazem_sessao().obter(handle) if handle else None
+
+
+# =====================================================
+# LEITURA EM BLOCOS
+# =====================================================
+
+
+def decodificar_upload(conteudo, destino, progresso=None):
+    """Decodifica 'data:...;base64,XXXX' em fatias para o arquivo destino."""
+    inicio = conteudo.index(",") + 1 if conteudo.startswith("data:") else 0
+    total = len(conteudo) - inicio
+    for k in range(inicio, len(conteudo), FATIA_BASE64):
+        destino.write(base64.b64decode(conteudo[k : k + FATIA_BASE64]))
+        if progresso:
+            progresso(0.2 * (k - inicio) / max(total, 1), "Recebendo arquivo")
+    destino.flush()
+    destino.seek(0)
+
+
+def _formato(nome):
+    extensao = os.path.splitext(nome or "")[1].lower()
+    if extensao in (".xlsx", ".xlsm"):
+        return "xlsx"
+    if extensao in (".csv", ".txt"):
+        return "csv"
+    raise ValueError(f"Formato não suportado: '{nome}' (use CSV ou XLSX)")
+
+
+def _blocos_csv(arquivo, tamanho_bloco):
+    amostra = arquivo.read(64 * 1024)
+    arquivo.seek(0)
+    try:
+        # final=False: um caractere cortado no fim da amostra não é erro
+        texto = codecs.getincrementaldecoder("utf-8-sig")().decode(
+            amostra, final=False
+        )
+        encoding = "utf-8-sig"
+    except UnicodeDecodeError:
+        texto = amostra.decode("latin-1")
+        encoding = "latin-1"
+    try:
+        separador = csv.Sniffer().sniff(texto, delimiters=",;\t").delimiter
+    except csv.Error:
+        separador = ","
+    # planilhas em português usam ';' e vírgula decimal
+    decimal = "," if separador == ";" else "."
+
+    total = os.fstat(arquivo.fileno()).st_size
+    leitor = pd.read_csv(
+        arquivo,
+        sep=separador,
+        decimal=decimal,
+        encoding=encoding,
+        chunksize=tamanho_bloco,
+        skipinitialspace=True,
+    )
+    with leitor:
+        for bloco in leitor:
+            yield bloco, arquivo.tell() / max(total, 1)
+
+
+def _blocos_xlsx(arquivo, tamanho_bloco):
+    from openpyxl import load_workbook
+
+    livro = load_workbook(arquivo, read_only=True, data_only=True)
+    try:
+        planilha = livro.active
+        total = planilha.max_row or 0
+        linhas = planilha.iter_rows(values_only=True)
+        cabecalho = next(linhas, None)
+        if cabecalho is None:
+            return
+        cabecalho = [str(c) if c is not None else "" for c in cabecalho]
+        lidas = 1
+        while True:
+            bloco = list(islice(linhas, tamanho_bloco))
+            if not bloco:
+                break
+            lidas += len(bloco)
+            yield pd.DataFrame(bloco, columns=cabecalho), (
+                lidas / total if total else 0.0
+            )
+    finally:
+        livro.close()
+
+
+def ler_blocos(arquivo, nome, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gerador de (DataFrame do bloco, fração do arquivo lida). Arquivo
+    corrompido ou ilegível vira ValueError, como os erros de validação.
+    """
+    from openpyxl.utils.exceptions import InvalidFileException
+
+    leitor = _blocos_xlsx if _formato(nome) == "xlsx" else _blocos_csv
+    try:
+        yield from leitor(arquivo, tamanho_bloco)
+    except ValueError as e:
+        raise ValueError(f"Arquivo inválido ({nome}): {e}") from e
+    except (
+        zipfile.BadZipFile,
+        InvalidFileException,
+        ParseError,
+        KeyError,
+        TypeError,
+        EOFError,
+    ) as e:
+        raise ValueError(
+            f"Arquivo inválido ({nome}): não é um {_formato(nome).upper()} legível"
+        ) from e
+
+
+# =====================================================
+# COLUNAS E VALIDAÇÃO
+# =====================================================
+
+
+def _normalizar_nome(nome):
+    """'Carga [ton]' -> 'carga'; 'Área içam.' -> 'area icam'."""
+    nome = unicodedata.normalize("NFKD", str(nome))
+    nome = "".join(c for c in nome if not unicodedata.combining(c))
+    nome = re.sub(r"\[.*?\]|\(.*?\)", "", nome)
+    return re.sub(r"[^a-z0-9]+", " ", nome.lower()).strip()
+
+
+def mapear_colunas(colunas_arquivo, colunas):
+    """
+    {coluna do arquivo: id da coluna} casando pelo id ou pelo nome exibido
+    (sem acento, maiúsculas ou unidade). ``colunas`` no formato do DataTable.
+    """
+    alvos = {}
+    for c in colunas:
+        alvos[_normalizar_nome(c["id"])] = c["id"]
+        alvos[_normalizar_nome(c.get("name", c["id"]))] = c["id"]
+    mapa = {}
+    for nome in colunas_arquivo:
+        alvo = alvos.get(_normalizar_nome(nome))
+        if alvo is not None and alvo not in mapa.values():
+            mapa[nome] = alvo
+    return mapa
+
+
+def _para_numero(serie):
+    """to_numeric aceitando vírgula decimal em textos ('5,5' -> 5.5)."""
+    if serie.dtype == object:
+        serie = serie.astype("string").str.strip().str.replace(",", ".", regex=False)
+    return pd.to_numeric(serie, errors="coerce").astype(float)
+
+
+def _motivos(checagens, n):
+    """Primeiro motivo que falha em cada linha (None se a linha é válida)."""
+    motivos = np.full(n, None, dtype=object)
+    for mascara, motivo in reversed(checagens):
+        motivos[np.asarray(mascara, dtype=bool)] = motivo
+    return motivos
+
+
+def _checagens_geometria(df):
+    raio = pd.to_numeric(df["Raio"], errors="coerce").to_numpy(dtype=float)
+    lanca = pd.to_numeric(df["Lanca"], errors="coerce").to_numpy(dtype=float)
+    return [
+        (~(lanca > 0), "lança inválida"),
+        (~(raio > 0), "raio inválido"),
+        (raio > lanca, "raio maior que a lança"),
+    ]
+
+
+def validar_pontos(df):
+    """Motivo de rejeição por linha de uma lista de içamento."""
+    carga = pd.to_numeric(df["Carga"], errors="coerce").to_numpy(dtype=float)
+    return _motivos(
+        _checagens_geometria(df) + [(~(carga >= 0), "carga inválida")], len(df)
+    )
+
+
+def validar_tabela_carga(df):
+    """Motivo de rejeição por linha de uma tabela de carga (Raio, Lanca, Carga)."""
+    carga = pd.to_numeric(df["Carga"], errors="coerce").to_numpy(dtype=float)
+    return _motivos(
+        _checagens_geometria(df) + [(~(carga > 0), "capacidade inválida")], len(df)
+    )
+
+
+def _validar_bloco(bloco, colunas, validar, primeira_linha):
+    """(linhas válidas com os ids das colunas, DataFrame de erros)."""
+    mapa = mapear_colunas(bloco.columns, colunas)
+    faltando = [c["id"] for c in colunas if c["id"] not in mapa.values()]
+    if faltando:
+        raise ValueError(f"Colunas ausentes no arquivo: {', '.join(faltando)}")
+
+    df = bloco[list(mapa)].rename(columns=mapa).reset_index(drop=True)
+    # linhas totalmente vazias (fim de planilha) são ignoradas
+    df = df[df.notna().any(axis=1)]
+
+    checagens = []
+    for c in colunas:
+        if c.get("type") == "numeric":
+            valores = _para_numero(df[c["id"]])
+            invalido = (valores.isna() & df[c["id"]].notna()).to_numpy()
+            checagens.append((invalido, f"{c.get('name', c['id'])} não numérico"))
+            df[c["id"]] = valores
+    motivos = _motivos(checagens, len(df))
+    if validar is not None and len(df):
+        motivos = np.where(pd.isna(motivos), validar(df), motivos)
+
+    rejeitadas = ~pd.isna(motivos)
+    erros = pd.DataFrame(
+        {
+            # número da linha no arquivo (cabeçalho na linha 1)
+            "Linha": df.index.to_numpy()[rejeitadas] + primeira_linha,
+            "Motivo": motivos[rejeitadas],
+        }
+    )
+    return df[~rejeitadas], erros
+
+
+def _importar(conteudo, nome, colunas, validar, gravar, progresso, tamanho_bloco):
+    resultado = ResultadoImportacao()
+    erros = []
+    with tempfile.TemporaryFile() as arquivo:
+        decodificar_upload(conteudo, arquivo, progresso)
+
+        primeira_linha = 2
+        for bloco, fracao in ler_blocos(arquivo, nome, tamanho_bloco):
+            validas, erros_bloco = _validar_bloco(
+                bloco, colunas, validar, primeira_linha
+            )
+            primeira_linha += len(bloco)
+            gravar(validas)
+            resultado.linhas += len(validas)
+            resultado.total_erros += len(erros_bloco)
+            if len(erros_bloco) and sum(map(len, erros)) < MAX_ERROS:
+                erros.append(erros_bloco)
+            if progresso:
+                progresso(
+                    0.2 + 0.8 * min(fracao, 1.0),
+                    f"{resultado.linhas} linhas importadas",
+                )
+
+    if erros:
+        resultado.erros = pd.concat(erros, ignore_index=True).head(MAX_ERROS)
+    if progresso:
+        progresso(1.0, resultado.resumo())
+    return resultado
+
+
+# =====================================================
+# DESTINOS
+# =====================================================
+
+
+def importar_para_conjunto(
+    conteudo,
+    nome,
+    conjunto,
+    colunas,
+    validar=None,
+    progresso=None,
+    tamanho_bloco=TAMANHO_BLOCO,
+):
+    """
+    Acrescenta as linhas válidas do arquivo ao ConjuntoDados, bloco a bloco.
+
+    colunas: colunas da tabela no formato do DataTable (id, name, type)
+    validar: função vetorizada df -> motivo de rejeição por linha (None = ok)
+    """
+    ids = []
+
+    def gravar(df):
+        ids.extend(conjunto.adicionar(df.to_dict("records")))
+
+    resultado = _importar(
+        conteudo, nome, colunas, validar, gravar, progresso, tamanho_bloco
+    )
+    resultado.ids = ids
+    return resultado
+
+
+def importar_tabela_carga(
+    conteudo, nome, diretorio, progresso=None, tamanho_bloco=TAMANHO_BLOCO
+):
+    """
+    Grava a tabela de carga validada em ``diretorio/<nome>.xlsx`` (openpyxl
+    write-only, bloco a bloco). O arquivo só aparece no diretório completo
+    e nunca substitui outro: se o id (nome sem extensão) já existe no
+    diretório, ganha o sufixo _2, _3...
+    """
+    from openpyxl import Workbook
+
+    base = re.sub(r"[^\w\-]+", "_", os.path.splitext(os.path.basename(nome))[0])
+    colunas = [{"id": c, "type": "numeric"} for c in COLUNAS_TABELA_CARGA]
+
+    livro = Workbook(write_only=True)
+    planilha = livro.create_sheet("Tabela")
+    planilha.append(list(COLUNAS_TABELA_CARGA))
+
+    def gravar(df):
+        for linha in df[list(COLUNAS_TABELA_CARGA)].itertuples(index=False):
+            planilha.append([float(v) for v in linha])
+
+    resultado = _importar(
+        conteudo, nome, colunas, validar_tabela_carga, gravar, progresso, tamanho_bloco
+    )
+    if resultado.linhas < 3:
+        raise ValueError("A tabela de carga precisa de pelo menos 3 linhas válidas")
+
+    os.makedirs(diretorio, exist_ok=True)
+    parcial = os.path.join(diretorio, f".{base}.{os.getpid()}.tmp")
+    livro.save(parcial)
+    try:
+        resultado.caminho = _publicar(parcial, diretorio, base)
+    finally:
+        os.remove(parcial)
+    return resultado
+
+
+def _publicar(parcial, diretorio, base):
+    """Liga o arquivo pronto ao primeiro id livre; os.link falha se já existe."""
+    for k in count(1):
+        id_arquivo = base if k == 1 else f"{base}_{k}"
+        if any(
+            os.path.exists(os.path.join(diretorio, id_arquivo + ext))
+            for ext in EXTENSOES
+        ):
+            continue
+        caminho = os.path.join(diretorio, f"{id_arquivo}.xlsx")
+        try:
+            os.link(parcial, caminho)
+        except FileExistsError:  # outra importação levou o id
+            continue
+        return caminho
@@ -0,0 +1,309 @@
+# storage/resultados.py
+"""
+Banco local (SQLite) de resultados de cálculo, endereçado por conteúdo.
+
+Cada resultado é gravado sob o hash canônico das entradas (geometria,
+cargas, solo, giro e versão da tabela de carga): o mesmo caso, em qualquer
+sessão, cai na mesma chave e é servido do banco sem recalcular.
+
+- leituras: conexão por thread, índices por guindaste, projeto e utilização
+- escritas: fila + thread gravadora em lotes (executemany), sem bloquear o
+  callback; resultados ainda na fila já são visíveis em ``obter``
+- poda: acima de ``limite_bytes`` os menos acessados recentemente são
+  removidos
+
+Variáveis de ambiente:
+- CRANE_RESULTS_DB=banco.sqlite -> arquivo (padrão data/resultados.sqlite)
+- CRANE_RESULTS_MAX_MB=200      -> tamanho máximo antes da poda
+"""
+import hashlib
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CAMINHO_PADRAO = os.path.join(BASE_DIR, "data", "resultados.sqlite")
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS resultados (
+    hash        TEXT PRIMARY KEY,
+    guindaste   TEXT,
+    projeto     TEXT,
+    utilizacao  REAL,
+    criado      REAL,
+    acessado    REAL,
+    tamanho     INTEGER,
+    entrada     TEXT,
+    resultado   TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_resultados_guindaste ON resultados (guindaste);
+CREATE INDEX IF NOT EXISTS idx_resultados_projeto ON resultados (projeto);
+CREATE INDEX IF NOT EXISTS idx_resultados_utilizacao ON resultados (utilizacao);
+CREATE INDEX IF NOT EXISTS idx_resultados_acessado ON resultados (acessado);
+"""
+
+
+# =====================================================
+# HASH CANÔNICO
+# =====================================================
+
+
+def _canonico(valor):
+    """Estrutura JSON estável: floats arredondados, chaves ordenadas."""
+    if isinstance(valor, pd.DataFrame):
+        return [_canonico(linha) for linha in valor.to_dict("records")]
+    if isinstance(valor, pd.Series):
+        return _canonico(valor.to_dict())
+    if isinstance(valor, np.ndarray):
+        return _canonico(valor.tolist())
+    if isinstance(valor, dict):
+        return {str(k): _canonico(v) for k, v in sorted(valor.items(), key=str)}
+    if isinstance(valor, (list, tuple)):
+        return [_canonico(v) for v in valor]
+    if isinstance(valor, (bool, np.bool_)):
+        return bool(valor)
+    if isinstance(valor, (int, float, np.integer, np.floating)):
+        v = float(valor)
+        if not np.isfinite(v):
+            return str(v)
+        # 12 algarismos significativos: 1.0 e 1 (ou 0.1+0.2 e 0.3) dão o mesmo hash
+        return float(f"{v:.12g}")
+    return valor
+
+
+def entrada_canonica(entrada, versao_tabela=""):
+    """Dicionário canônico de uma EntradaGuindaste."""
+    return _canonico(
+        {
+            "patolas": entrada.patolas[["X", "Y", "Z"]],
+            "centro_massa": entrada.centro_massa[["Xcm", "Ycm", "Zcm"]],
+            "lanca": entrada.lanca[["Lanca", "Raio"]],
+            "angulo_giro_deg": entrada.angulo_giro_deg,
+            "peso_guindaste": entrada.peso_guindaste,
+            "contrapeso": entrada.contrapeso,
+            "cargas": entrada.cargas["Carga"].tolist(),
+            "vento": entrada.vento[["Vi", "Vj"]],
+            "solo": entrada.solo.drop(labels=["solo"], errors="ignore"),
+            "versao_tabela": versao_tabela,
+        }
+    )
+
+
+def hash_entrada(entrada, versao_tabela=""):
+    texto = json.dumps(
+        entrada_canonica(entrada, versao_tabela), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+# =====================================================
+# BANCO
+# =====================================================
+
+
+class BancoResultados:
+
+    def __init__(self, caminho=CAMINHO_PADRAO, limite_bytes=200 * 2**20, lote=32):
+        self.caminho = caminho
+        self.limite_bytes = limite_bytes
+        self.lote = lote
+
+        self._local = threading.local()
+        self._pendentes = {}  # hash -> registro ainda não gravado
+        self._lock = threading.Lock()
+        self._fila = queue.Queue()
+
+        pasta = os.path.dirname(os.path.abspath(caminho))
+        os.makedirs(pasta, exist_ok=True)
+        con = self._conexao()
+        con.executescript(ESQUEMA)
+        con.commit()
+
+        self._gravadora = threading.Thread(
+            target=self._gravar, name="banco-resultados", daemon=True
+        )
+        self._gravadora.start()
+
+    @classmethod
+    def do_ambiente(cls):
+        """Cria o banco a partir das variáveis de ambiente CRANE_RESULTS_*."""
+        limite_mb = float(os.environ.get("CRANE_RESULTS_MAX_MB", 200))
+        return cls(
+            caminho=os.environ.get("CRANE_RESULTS_DB", CAMINHO_PADRAO),
+            limite_bytes=int(limite_mb * 2**20),
+        )
+
+    def _conexao(self):
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(self.caminho, timeout=30)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            self._local.con = con
+        return con
+
+    # -----------------------------
+    # Leitura
+    # -----------------------------
+    def obter(self, chave):
+        """Resultado (dict) gravado sob a chave, ou None."""
+        with self._lock:
+            pendente = self._pendentes.get(chave)
+        if pendente is not None:
+            return json.loads(pendente["resultado"])
+
+        linha = (
+            self._conexao()
+            .execute("SELECT resultado FROM resultados WHERE hash = ?", (chave,))
+            .fetchone()
+        )
+        if linha is None:
+            return None
+        self._fila.put(("acesso", chave, time.time()))
+        return json.loads(linha[0])
+
+    def buscar(
+        self,
+        guindaste=None,
+        projeto=None,
+        utilizacao_min=None,
+        utilizacao_max=None,
+        limite=100,
+    ):
+        """Resumo dos resultados filtrados, do mais recente ao mais antigo."""
+        filtros, params = [], []
+        if guindaste is not None:
+            filtros.append("guindaste = ?")
+            params.append(guindaste)
+        if projeto is not None:
+            filtros.append("projeto = ?")
+            params.append(projeto)
+        if utilizacao_min is not None:
+            filtros.append("utilizacao >= ?")
+            params.append(utilizacao_min)
+        if utilizacao_max is not None:
+            filtros.append("utilizacao <= ?")
+            params.append(utilizacao_max)
+
+        where = f"WHERE {' AND '.join(filtros)}" if filtros else ""
+        sql = (
+            "SELECT hash, guindaste, projeto, utilizacao, criado, acessado, tamanho "
+            f"FROM resultados {where} ORDER BY criado DESC LIMIT ?"
+        )
+        return pd.read_sql_query(sql, self._conexao(), params=params + [limite])
+
+    def tamanho_total(self):
+        linha = self._conexao().execute(
+            "SELECT COALESCE(SUM(tamanho), 0) FROM resultados"
+        ).fetchone()
+        return int(linha[0])
+
+    # -----------------------------
+    # Escrita (assíncrona)
+    # -----------------------------
+    def salvar(
+        self, chave, resultado, entrada=None, guindaste="", projeto="", utilizacao=None
+    ):
+        """Enfileira o resultado; retorna imediatamente."""
+        texto = json.dumps(resultado, separators=(",", ":"))
+        agora = time.time()
+        registro = {
+            "hash": chave,
+            "guindaste": guindaste,
+            "projeto": projeto,
+            "utilizacao": utilizacao,
+            "criado": agora,
+            "acessado": agora,
+            "tamanho": len(texto),
+            "entrada": json.dumps(entrada, separators=(",", ":")) if entrada else None,
+            "resultado": texto,
+        }
+        with self._lock:
+            self._pendentes[chave] = registro
+        self._fila.put(("salvar", registro, None))
+
+    def esvaziar(self, timeout=None):
+        """Aguarda a gravação de tudo que está na fila (útil em testes)."""
+        evento = threading.Event()
+        self._fila.put(("sinal", evento, None))
+        evento.wait(timeout)
+
+    def _gravar(self):
+        con = self._conexao()
+        while True:
+            itens = [self._fila.get()]
+            while len(itens) < self.lote:
+                try:
+                    itens.append(self._fila.get_nowait())
+                except queue.Empty:
+                    break
+
+            registros = [r for tipo, r, _ in itens if tipo == "salvar"]
+            acessos = [(t, h) for tipo, h, t in itens if tipo == "acesso"]
+            sinais = [e for tipo, e, _ in itens if tipo == "sinal"]
+
+            try:
+                if registros:
+                    con.executemany(
+                        "INSERT OR REPLACE INTO resultados VALUES "
+                        "(:hash, :guindaste, :projeto, :utilizacao, :criado, "
+                        ":acessado, :tamanho, :entrada, :resultado)",
+                        registros,
+                    )
+                if acessos:
+                    con.executemany(
+                        "UPDATE resultados SET acessado = ? WHERE hash = ?", acessos
+                    )
+                con.commit()
+                if registros:
+                    self._podar(con)
+            except sqlite3.Error:
+                logger.exception("Falha ao gravar resultados em %s", self.caminho)
+            finally:
+                with self._lock:
+                    for r in registros:
+                        if self._pendentes.get(r["hash"]) is r:
+                            del self._pendentes[r["hash"]]
+                for evento in sinais:
+                    evento.set()
+
+    def _podar(self, con):
+        """Remove os menos acessados até caber em limite_bytes."""
+        total = con.execute(
+            "SELECT COALESCE(SUM(tamanho), 0) FROM resultados"
+        ).fetchone()[0]
+        if total <= self.limite_bytes:
+            return
+        excesso = total - self.limite_bytes
+        removidos, liberado = [], 0
+        for chave, tamanho in con.execute(
+            "SELECT hash, tamanho FROM resultados ORDER BY acessado ASC"
+        ):
+            removidos.append((chave,))
+            liberado += tamanho
+            if liberado >= excesso:
+                break
+        con.executemany("DELETE FROM resultados WHERE hash = ?", removidos)
+        con.commit()
+
+
+_banco = None
+_banco_lock = threading.Lock()
+
+
+def banco_padrao():
+    """Instância compartilhada do processo, criada no primeiro uso."""
+    global _banco
+    with _banco_lock:
+        if _banco is None:
+            _banco = BancoResultados.do_ambiente()
+        return _banco
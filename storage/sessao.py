@@ -0,0 +1,193 @@
+# storage/sessao.py
+"""
+Armazenamento de resultados no servidor, referenciados por um handle curto.
+
+Resultados grandes (envoltórias de giro, verificações em lote, malhas de
+pressão) não passam pelo navegador: o callback guarda o valor aqui e
+devolve ao ``dcc.Store`` só o handle. Quem precisa do valor busca pelo
+handle, então o tamanho das requisições não depende do tamanho do
+resultado.
+
+Dois backends, ambos com limite de itens e expiração (TTL):
+- disco:   um arquivo pickle por handle em um diretório, compartilhado
+           entre os workers do servidor (padrão)
+- memória: LRU por processo; só serve com um único worker
+
+Variáveis de ambiente:
+- CRANE_SESSION_DIR=data/cache/sessao -> diretório do backend em disco;
+                                         padrão $CRANE_CACHE_DIR/sessao,
+                                         vazio usa o backend em memória
+- CRANE_SESSION_TTL_S=3600            -> tempo de vida de cada item
+- CRANE_SESSION_MAX_ITENS=512         -> máximo de itens antes do despejo
+"""
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+
+def _handle(dados):
+    """Handle derivado do conteúdo: o mesmo resultado reutiliza a entrada."""
+    return hashlib.sha1(dados).hexdigest()[:20]
+
+
+def handle_valido(handle):
+    """Handles vêm do navegador: só texto alfanumérico é aceito."""
+    return isinstance(handle, str) and handle.isalnum()
+
+
+class ArmazemMemoria:
+
+    def __init__(self, ttl_s=3600.0, max_itens=512):
+        self.ttl_s = ttl_s
+        self.max_itens = max_itens
+        self._itens = OrderedDict()  # handle -> (expira_em, valor)
+        self._lock = threading.Lock()
+
+    def guardar(self, valor, handle=None):
+        """Guarda o valor; sem ``handle``, ele é derivado do conteúdo."""
+        if handle is None:
+            handle = _handle(pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._itens[handle] = (time.monotonic() + self.ttl_s, valor)
+            self._itens.move_to_end(handle)
+            self._despejar()
+        return handle
+
+    def obter(self, handle, padrao=None):
+        if not handle_valido(handle):
+            return padrao
+        with self._lock:
+            item = self._itens.get(handle)
+            if item is None:
+                return padrao
+            expira_em, valor = item
+            if expira_em < time.monotonic():
+                del self._itens[handle]
+                return padrao
+            self._itens.move_to_end(handle)
+            return valor
+
+    def __len__(self):
+        with self._lock:
+            self._despejar()
+            return len(self._itens)
+
+    def _despejar(self):
+        agora = time.monotonic()
+        for handle in [h for h, (exp, _) in self._itens.items() if exp < agora]:
+            del self._itens[handle]
+        while len(self._itens) > self.max_itens:
+            self._itens.popitem(last=False)
+
+
+class ArmazemDisco:
+
+    SUFIXO = ".pkl"
+
+    def __init__(self, diretorio, ttl_s=3600.0, max_itens=512):
+        self.diretorio = diretorio
+        self.ttl_s = ttl_s
+        self.max_itens = max_itens
+        os.makedirs(diretorio, exist_ok=True)
+
+    def _caminho(self, handle):
+        return os.path.join(self.diretorio, handle + self.SUFIXO)
+
+    def guardar(self, valor, handle=None):
+        """Guarda o valor; sem ``handle``, ele é derivado do conteúdo."""
+        dados = pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL)
+        if handle is None:
+            handle = _handle(dados)
+        caminho = self._caminho(handle)
+        # escrita atômica: outro worker nunca lê um arquivo pela metade
+        temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporario, "wb") as f:
+            f.write(dados)
+        os.replace(temporario, caminho)
+        self._despejar()
+        return handle
+
+    def obter(self, handle, padrao=None):
+        if not handle_valido(handle):
+            return padrao
+        caminho = self._caminho(handle)
+        try:
+            if os.path.getmtime(caminho) + self.ttl_s < time.time():
+                os.remove(caminho)
+                return padrao
+            with open(caminho, "rb") as f:
+                valor = pickle.load(f)
+            os.utime(caminho)  # uso recente adia o despejo
+            return valor
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return padrao
+
+    def __len__(self):
+        return len(self._arquivos())
+
+    def _arquivos(self):
+        arquivos = []
+        for nome in os.listdir(self.diretorio):
+            if nome.endswith(self.SUFIXO):
+                caminho = os.path.join(self.diretorio, nome)
+                try:
+                    arquivos.append((os.path.getmtime(caminho), caminho))
+                except FileNotFoundError:
+                    pass
+        return arquivos
+
+    def _despejar(self):
+        arquivos = sorted(self._arquivos())
+        limite = time.time() - self.ttl_s
+        excesso = len(arquivos) - self.max_itens
+        for k, (mtime, caminho) in enumerate(arquivos):
+            if mtime >= limite and k >= excesso:
+                break
+            try:
+                os.remove(caminho)
+            except FileNotFoundError:
+                pass
+
+
+def diretorio_sessao(subdiretorio=""):
+    """
+    Diretório do backend em disco (CRANE_SESSION_DIR, padrão
+    $CRANE_CACHE_DIR/sessao), ou "" se configurado para memória.
+    """
+    cache = os.environ.get("CRANE_CACHE_DIR", os.path.join("data", "cache"))
+    base = os.environ.get("CRANE_SESSION_DIR", os.path.join(cache, "sessao"))
+    return os.path.join(base, subdiretorio) if base and subdiretorio else base
+
+
+def armazem_do_ambiente(
+    prefixo="CRANE_SESSION", ttl_s=3600.0, max_itens=512, diretorio=None
+):
+    """
+    Backend escolhido pelas variáveis de ambiente <prefixo>_DIR, _TTL_S e
+    _MAX_ITENS; ``ttl_s``, ``max_itens`` e ``diretorio`` são os padrões
+    (sem ``diretorio``, o de diretorio_sessao). Diretório vazio -> memória.
+    """
+    ttl_s = float(os.environ.get(f"{prefixo}_TTL_S", ttl_s))
+    max_itens = int(os.environ.get(f"{prefixo}_MAX_ITENS", max_itens))
+    if diretorio is None:
+        diretorio = diretorio_sessao()
+    diretorio = os.environ.get(f"{prefixo}_DIR", diretorio)
+    if diretorio:
+        return ArmazemDisco(diretorio, ttl_s=ttl_s, max_itens=max_itens)
+    return ArmazemMemoria(ttl_s=ttl_s, max_itens=max_itens)
+
+
+_armazem = None
+_armazem_lock = threading.Lock()
+
+
+def armazem_sessao():
+    """Instância compartilhada do processo, criada no primeiro uso."""
+    global _armazem
+    with _armazem_lock:
+        if _armazem is None:
+            _armazem = armazem_do_ambiente()
+        return _armazem
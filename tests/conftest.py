@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def banco_resultados_temporario(tmp_path_factory):
+    """Banco de resultados e índice do catálogo temporários nos testes."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("CRANE_RESULTS_DB", str(tmp_path_factory.mktemp("banco") / "r.sqlite"))
+    # índice do catálogo fora de data/ e sem thread observadora
+    mp.setenv("CRANE_CATALOG_INDEX", str(tmp_path_factory.mktemp("cat") / "c.json"))
+    mp.setenv("CRANE_CATALOG_POLL_S", "0")
+    mp.setenv("CRANE_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+    yield
+    mp.undo()
@@ -0,0 +1,18 @@
+# tests/dados.py
+"""Dados compartilhados pelos testes e pelos benchmarks."""
+
+
+def dados_tabelas_patolas(angulo=30):
+    """Dados das tabelas da página de patolas, como o Dash os envia."""
+    from pages import calc_patolas as pg
+
+    return dict(
+        pat=pg.tabela_patolas.initial_data,
+        cm=pg.tabela_cm.initial_data,
+        lanca=pg.tabela_lanca.initial_data,
+        carga=pg.tabela_carga.initial_data,
+        vento=pg.tabela_vento.initial_data,
+        solo=pg.tabela_solo.initial_data,
+        angulo=angulo,
+        pesos=pg.tabela_pesos.initial_data,
+    )
@@ -163,6 +163,28 @@ def calc_reactions(entrada):
     return X, residuals, rank, s
 
 
+# =====================================================
+# SOLVER EM LOTE
+# =====================================================
+
+
+def test_calc_reactions_lote_igual_ao_lstsq():
+    from dataclasses import replace
+
+    from engine import calc_reactions as engine
+
+    entrada = replace(criar_entrada_dummy(), vento=pd.Series({"Vi": 1500.0, "Vj": -800.0}))
+    angulos = np.arange(0.0, 360.0, 15.0)
+
+    p = engine.parametros_entrada(entrada)
+    p["angulo_giro_deg"] = angulos
+    X_lote = engine.calc_reactions_lote(**p)
+
+    for a, X in zip(angulos, X_lote):
+        X_ref, _, _, _ = engine.calc_reactions(replace(entrada, angulo_giro_deg=a))
+        np.testing.assert_allclose(X, X_ref[:, 0], rtol=1e-9, atol=1e-6)
+
+
 # =====================================================
 # EXECUÇÃO LOCAL (DESENVOLVIMENTO)
 # =====================================================
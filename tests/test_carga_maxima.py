@@ -0,0 +1,64 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.carga_maxima import INVIAVEL, carga_maxima_grade
+from engine.curva_carga import CurvaCarga
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_carga_maxima_leva_reacao_critica_a_zero():
+    entrada = criar_entrada_dummy()
+    raios = np.array([6.0, 10.0, 14.0])
+    angulos = np.array([0.0, 90.0, 200.0])
+
+    res = carga_maxima_grade(entrada, raios, angulos, pressao_admissivel=1e9)
+    assert (res.criterio == "estabilidade").all()
+
+    p = parametros_entrada(entrada)
+    p["raio"] = raios[:, None]
+    p["angulo_giro_deg"] = angulos[None, :]
+    p["carga"] = res.carga_max
+    R = calc_reactions_lote(**p)[..., 2:]
+    np.testing.assert_allclose(R.min(axis=-1), 0.0, atol=1e-3)
+
+
+def test_limites_de_solo_e_tabela():
+    entrada = criar_entrada_dummy()
+    curva = CurvaCarga(
+        pd.DataFrame(
+            {
+                "Raio": [3.0, 3.0, 20.0, 20.0, 10.0],
+                "Lanca": [11.0, 30.0, 21.0, 30.0, 22.0],
+                "Carga": [5.0, 5.0, 5.0, 5.0, 5.0],
+            }
+        )
+    )
+    res = carga_maxima_grade(
+        entrada, [8.0, 30.0], [45.0], curva=curva, pressao_admissivel=100e3
+    )
+
+    assert res.criterio[0, 0] in ("solo", "tabela")
+    assert res.carga_max[0, 0] <= 5.0 + 1e-9
+    assert np.isnan(res.carga_max[1, 0])  # raio maior que a lança
+
+
+def test_ponto_inviavel_fica_nan_e_marcado():
+    entrada = criar_entrada_dummy()
+    # sapata que já não suporta o guindaste sem carga: nenhum W admissível
+    res = carga_maxima_grade(entrada, [8.0, 30.0], [45.0], pressao_admissivel=60e3)
+    assert np.isnan(res.limites["solo"][0, 0])
+    assert np.isnan(res.carga_max).all()
+    assert res.criterio[0, 0] == INVIAVEL
+    assert res.criterio[1, 0] == ""  # raio maior que a lança
+
+
+def test_raio_alem_da_lanca_sem_runtimewarning():
+    entrada = criar_entrada_dummy()
+    lanca = parametros_entrada(entrada)["lanca"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        res = carga_maxima_grade(entrada, [lanca / 2, lanca + 5.0], [0.0, 90.0])
+    assert np.isnan(res.carga_max[1]).all() and (res.criterio[1] == "").all()
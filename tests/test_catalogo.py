@@ -0,0 +1,53 @@
+import os
+import shutil
+
+import pandas as pd
+
+from storage import catalogo as cat
+from storage.catalogo import Catalogo
+
+
+def test_indice_carga_preguicosa_e_atualizacao(tmp_path, monkeypatch):
+    shutil.copy("data/guindaste_80TON.xlsx", tmp_path)
+    (tmp_path / "notas.csv").write_text("a,b\n1,2\n")
+    indice = tmp_path / "indice.json"
+
+    catalogo = Catalogo(str(tmp_path), str(indice))
+    (entrada,) = catalogo.entradas()
+    assert entrada.id == "guindaste_80TON"
+    assert entrada.capacidade_max == 90.0 and entrada.classe == "até 100 t"
+    assert entrada.lanca_min == 11.4
+    assert catalogo.opcoes() == [("guindaste_80TON", "Guindaste 80TON")]
+
+    # segunda instância: nada é relido, só o índice; a tabela só no uso
+    def falhar(*args):
+        raise AssertionError("arquivo relido")
+
+    monkeypatch.setattr(cat, "_metadados", falhar)
+    catalogo = Catalogo(str(tmp_path), str(indice))
+    assert len(catalogo) == 1
+    monkeypatch.setattr(cat, "ler_tabela", falhar)
+    assert catalogo.atualizar() == ([], [])
+    monkeypatch.undo()
+
+    assert len(catalogo.tabela("guindaste_80TON")) == 295
+
+    # tabela nova e alteração
+    tabela = pd.DataFrame(
+        {"Raio": [3, 5, 8, 3], "Lanca": [10, 10, 10, 20], "Carga": [30, 20, 10, 15]}
+    )
+    tabela.to_csv(tmp_path / "guindaste_30t.csv", index=False)
+    assert catalogo.atualizar() == (["guindaste_30t"], [])
+    antigo = catalogo.entrada("guindaste_30t").hash
+
+    tabela.assign(Carga=tabela.Carga * 2).to_csv(
+        tmp_path / "guindaste_30t.csv", index=False
+    )
+    os.utime(tmp_path / "guindaste_30t.csv", (1, 1))
+    assert catalogo.atualizar() == (["guindaste_30t"], [])
+    assert catalogo.entrada("guindaste_30t").hash != antigo
+    assert catalogo.tabela("guindaste_30t")["Carga"].max() == 60
+
+    os.remove(tmp_path / "guindaste_30t.csv")
+    assert catalogo.atualizar() == ([], ["guindaste_30t"])
+    assert "guindaste_30t" not in catalogo
@@ -0,0 +1,127 @@
+import numpy as np
+
+from storage.conjuntos import ConjuntoDados, separar_filtro
+
+COLUNAS = [
+    {"name": "Área içam.", "id": "Ponto"},
+    {"name": "Raio", "id": "Raio", "type": "numeric"},
+    {"name": "Carga [ton]", "id": "Carga", "type": "numeric"},
+]
+
+
+def criar_conjunto(n=1000):
+    registros = [
+        {"Ponto": f"P{i}", "Raio": float(i % 20), "Carga": float(i)} for i in range(n)
+    ]
+    return ConjuntoDados.de_colunas_tabela(COLUNAS, registros)
+
+
+def test_pagina_filtro_e_ordenacao():
+    conjunto = criar_conjunto()
+
+    linhas, n_paginas = conjunto.pagina(2, 50)
+    assert n_paginas == 20
+    assert [r["id"] for r in linhas] == list(range(100, 150))
+
+    linhas, n_paginas = conjunto.pagina(
+        0,
+        10,
+        ordenacao=[{"column_id": "Carga", "direction": "desc"}],
+        filtro='{Raio} >= 15 && {Ponto} contains "9"',
+    )
+    assert all(r["Raio"] >= 15 and "9" in r["Ponto"] for r in linhas)
+    cargas = [r["Carga"] for r in linhas]
+    assert cargas == sorted(cargas, reverse=True)
+
+    # página além do fim volta para a última
+    linhas, n_paginas = conjunto.pagina(999, 300)
+    assert n_paginas == 4 and len(linhas) == 100
+
+
+def test_atualizar_retorna_so_linhas_alteradas():
+    conjunto = criar_conjunto(10)
+    pagina, _ = conjunto.pagina(0, 5)
+    editada = [dict(r) for r in pagina]
+    editada[3]["Carga"] = "12.5"  # texto vindo do navegador
+    editada[4]["Raio"] = None
+
+    versao = conjunto.versao
+    assert conjunto.atualizar(editada) == [3, 4]
+    assert conjunto.versao == versao + 1
+    assert conjunto.df.loc[3, "Carga"] == 12.5
+    assert np.isnan(conjunto.df.loc[4, "Raio"])
+    assert conjunto.registros([4])[0]["Raio"] is None
+
+    assert conjunto.atualizar(editada) == []
+    assert conjunto.remover([1, 99]) == [1]
+    assert conjunto.adicionar([{"Ponto": "novo"}]) == [10]
+    assert len(conjunto) == 10
+
+
+def test_separar_filtro():
+    assert separar_filtro("{Raio} >= 10") == ("Raio", "ge", "10")
+    assert separar_filtro('{Ponto} contains "a b"') == ("Ponto", "contains", "a b")
+    assert separar_filtro("{Ponto} = P1") == ("Ponto", "eq", "P1")
+
+
+def test_separar_filtro_valor_com_operadores():
+    # o operador é o primeiro termo após a coluna; o valor pode conter
+    # palavras ou símbolos de operador
+    assert separar_filtro('{Ponto} contains "Bridge 2"') == (
+        "Ponto", "contains", "Bridge 2",
+    )
+    assert separar_filtro('{Ponto} contains "Turbine 3"')[1:] == (
+        "contains", "Turbine 3",
+    )
+    assert separar_filtro("{Ponto} = Bolt M20") == ("Ponto", "eq", "Bolt M20")
+    assert separar_filtro('{Ponto} contains "Bomba<1"')[2] == "Bomba<1"
+    assert separar_filtro("{Raio} ge 10") == ("Raio", "ge", "10")
+    assert separar_filtro("{Raio} <=5") == ("Raio", "le", "5")
+    assert separar_filtro('{Ponto} icontains "a"') == ("Ponto", "contains", "a")
+    assert separar_filtro("Raio >= 10") == (None, None, None)
+
+
+def test_filtro_texto_com_operadores_na_pagina():
+    conjunto = ConjuntoDados(
+        ["Ponto", "Raio"],
+        [{"Ponto": p, "Raio": 1.0} for p in ("Bridge 2", "Bridge 12", "Bomba<1", "x")],
+        ["Raio"],
+    )
+    registros, _ = conjunto.pagina(filtro='{Ponto} contains "Bridge 2"')
+    assert [r["Ponto"] for r in registros] == ["Bridge 2"]
+    registros, _ = conjunto.pagina(filtro='{Ponto} contains "Bomba<1" && {Raio} < 2')
+    assert [r["Ponto"] for r in registros] == ["Bomba<1"]
+
+
+def test_conjuntos_nao_sao_despejados_pelo_armazem_de_sessao():
+    from storage.conjuntos import armazem_conjuntos, novo_conjunto, obter_conjunto
+    from storage.sessao import armazem_sessao
+
+    chave = novo_conjunto(ConjuntoDados(["Ponto"], [{"Ponto": "A"}]))
+    sessao = armazem_sessao()
+    assert armazem_conjuntos() is not sessao
+    for k in range(sessao.max_itens + 1):
+        sessao.guardar(k)
+    assert len(obter_conjunto(chave)) == 1
+
+
+def test_filtro_numero_em_coluna_de_texto():
+    conjunto = ConjuntoDados(
+        ["Ponto", "Raio"],
+        [{"Ponto": p, "Raio": r} for p, r in (("P9", 9.0), ("P19", 10.0), ("9", 1.0))],
+        ["Raio"],
+    )
+    registros, _ = conjunto.pagina(filtro="{Ponto} contains 9")
+    assert [r["Ponto"] for r in registros] == ["P9", "P19", "9"]
+    registros, _ = conjunto.pagina(filtro="{Ponto} = P9")
+    assert [r["Ponto"] for r in registros] == ["P9"]
+    registros, _ = conjunto.pagina(filtro="{Ponto} = 9")
+    assert [r["Ponto"] for r in registros] == ["9"]
+
+
+def test_filtro_numerico_so_em_coluna_numerica():
+    conjunto = criar_conjunto(30)
+    registros, _ = conjunto.pagina(filtro="{Raio} = 9", tamanho=100)
+    assert [r["Ponto"] for r in registros] == ["P9", "P29"]
+    registros, _ = conjunto.pagina(filtro="{Raio} >= 18.5", tamanho=100)
+    assert [r["Raio"] for r in registros] == [19.0]
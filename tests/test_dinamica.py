@@ -0,0 +1,62 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.dinamica import montar_cenarios, perfil_giro, simular_dinamica
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_perfil_giro_trapezoidal():
+    t = np.linspace(0, 200, 20001)
+    theta, w, _ = perfil_giro(t, 10.0, 100.0, 2.0, 1.0)
+    assert np.isclose(np.degrees(theta[-1]), 100.0)
+    np.testing.assert_allclose(np.gradient(theta, t), w, atol=1e-4)
+    assert np.isclose(np.degrees(w).max(), 2.0)
+
+
+def test_parado_com_vento_igual_estatico():
+    entrada = criar_entrada_dummy()
+    res = simular_dinamica(
+        entrada,
+        [{"giro_inicial": 45.0, "giro_final": 45.0, "forca_vento": 3e3}],
+        duracao=5.0,
+    )
+    p = parametros_entrada(entrada)
+    p["angulo_giro_deg"] = 45.0
+    p["vento_i"] = 3e3
+    R = calc_reactions_lote(**p)[2:]
+    np.testing.assert_allclose(res.picos.iloc[0], R, rtol=1e-9)
+    np.testing.assert_allclose(res.minimos.iloc[0], R, rtol=1e-9)
+    assert res.tempo_descolamento.isna().all()
+
+
+def test_frenagem_amplifica_reacoes_e_descolamento():
+    entrada = criar_entrada_dummy()
+    cenarios = pd.DataFrame(
+        {"velocidade_giro": [0.5, 6.0], "aceleracao_giro": [0.5, 6.0]}
+    )
+    res = simular_dinamica(entrada, cenarios, duracao=40.0, salvar_a_cada=10)
+
+    p = parametros_entrada(entrada)
+    p["angulo_giro_deg"] = np.linspace(0, 90, 181)
+    estatico = calc_reactions_lote(**p)[:, 2:]
+    assert (res.picos.iloc[0] <= estatico.max(axis=0) * 1.01).all()
+    assert (res.picos.iloc[1] > res.picos.iloc[0]).any()
+    assert res.historico.shape == (len(res.tempos), 2, 4)
+
+    pesada = replace(
+        entrada, cargas=pd.DataFrame([{"Desig": "Carga", "Carga": 12.0}])
+    )
+    res = simular_dinamica(pesada, [{"giro_inicial": 0.0, "giro_final": 90.0}])
+    assert res.tempo_descolamento.notna().all()
+
+
+@pytest.mark.parametrize(
+    "nome", ["velocidade_giro", "aceleracao_giro", "comprimento_cabo", "duracao_rajada"]
+)
+def test_parametros_nulos_rejeitados(nome):
+    with pytest.raises(ValueError, match=nome):
+        montar_cenarios([{nome: 0.0}])
@@ -0,0 +1,39 @@
+import numpy as np
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.extensao_patolas import (
+    buscar_extensoes,
+    combinacoes_extensao,
+    posicoes_recolhidas,
+)
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_combinacoes_com_estados_por_patola():
+    ext = combinacoes_extensao({"P1": [0, 1], "P2": [1], "P3": [0, 0.5, 1], "P4": [1]})
+    assert ext.shape == (6, 4)
+    assert set(ext[:, 1]) == {1.0}
+
+
+def test_busca_igual_a_solucao_individual():
+    entrada = criar_entrada_dummy()
+    res = buscar_extensoes(entrada, angulos=np.arange(0, 360, 10))
+    assert len(res.layouts) == 81
+
+    # totalmente estendido coincide com a tabela de patolas
+    p = parametros_entrada(entrada)
+    p["angulo_giro_deg"] = np.arange(0, 360, 10)
+    R = calc_reactions_lote(**p)[..., 2:]
+    cheio = res.layouts[(res.layouts[["P1", "P2", "P3", "P4"]] == 1).all(axis=1)]
+    np.testing.assert_allclose(cheio["Reacao_min"].iloc[0], R.min(), rtol=1e-9)
+
+    # um layout parcial qualquer
+    linha = res.layouts.iloc[17]
+    ext = linha[["P1", "P2", "P3", "P4"]].to_numpy(dtype=float)
+    rec = posicoes_recolhidas(p["patolas"])
+    p["patolas"] = rec + ext[:, None] * (p["patolas"] - rec)
+    R = calc_reactions_lote(**p)[..., 2:]
+    np.testing.assert_allclose(linha["Reacao_min"], R.min(), rtol=1e-9)
+
+    assert res.melhor is not None
+    assert res.melhor["Reacao_min"] == res.viaveis["Reacao_min"].max()
@@ -0,0 +1,126 @@
+from dash import Patch
+from plotly.graph_objects import Figure
+
+from pages.home import tab1Columns, update_graph
+from storage.conjuntos import ConjuntoDados, novo_conjunto, salvar_conjunto
+
+GUINDASTE = "guindaste_80TON"
+
+
+def _alteracoes(conjunto, chave, anterior, alteradas=(), removidas=()):
+    return {
+        "conjunto": chave,
+        "versao": conjunto.versao,
+        "versao_anterior": anterior,
+        "alteradas": conjunto.registros(list(alteradas)),
+        "removidas": list(removidas),
+    }
+
+
+def test_edicao_gera_patch_so_da_linha_alterada():
+    linhas = [
+        {"Ponto": f"P{i}", "Lanca": 30.0, "Raio": 8.0 + i, "Carga": 2.0}
+        for i in range(50)
+    ]
+    conjunto = ConjuntoDados.de_colunas_tabela(tab1Columns, linhas)
+    chave = novo_conjunto(conjunto)
+
+    fig, _, _, estado = update_graph(
+        GUINDASTE, {"conjunto": chave, "completo": True}
+    )
+    assert isinstance(fig, Figure)
+    aprovados, reprovados = fig.data[-2:]
+    assert len(aprovados.x) == len(reprovados.x) == 50
+    assert aprovados.x[10] == 18.0 and reprovados.x[10] is None
+
+    # carga acima da tabela: o ponto 10 passa para os reprovados
+    linha = conjunto.registros([10])[0]
+    linha["Carga"] = 500.0
+    anterior = conjunto.versao
+    ids = conjunto.atualizar([linha])
+    salvar_conjunto(chave, conjunto)  # como o TabelaDadosComponent
+    patch, estilo, _, estado = update_graph(
+        GUINDASTE, _alteracoes(conjunto, chave, anterior, ids), estado
+    )
+    assert isinstance(patch, Patch)
+    operacoes = patch.to_plotly_json()["operations"]
+    assert {tuple(op["location"][:4]) for op in operacoes} >= {
+        ("data", 2, "x", 10),
+        ("data", 3, "x", 10),
+    }
+    assert all(op["location"][3] == 10 for op in operacoes)
+    valores = {tuple(op["location"]): op["params"]["value"] for op in operacoes}
+    assert valores[("data", 2, "x", 10)] is None
+    assert valores[("data", 3, "x", 10)] == 18.0
+
+    # remoção e linha nova
+    anterior = conjunto.versao
+    conjunto.remover([0])
+    novas = conjunto.adicionar([{"Ponto": "N", "Lanca": 30, "Raio": 10, "Carga": 1}])
+    salvar_conjunto(chave, conjunto)
+    alteracoes = _alteracoes(conjunto, chave, anterior, novas, [0])
+    patch, _, _, estado_novo = update_graph(GUINDASTE, alteracoes, estado)
+    tipos = {op["operation"] for op in patch.to_plotly_json()["operations"]}
+    assert tipos == {"Assign", "Append"}
+    assert estado_novo["n"] == 51
+
+    # resposta anterior descartada pelo navegador: o estado aplicado ainda é
+    # o de antes dela, então a edição seguinte vira figura completa
+    anterior = conjunto.versao
+    linha = conjunto.registros([5])[0]
+    linha["Carga"] = 500.0
+    ids = conjunto.atualizar([linha])
+    salvar_conjunto(chave, conjunto)
+    fig, _, _, estado = update_graph(
+        GUINDASTE, _alteracoes(conjunto, chave, anterior, ids), estado
+    )
+    assert isinstance(fig, Figure)
+    assert len(fig.data[-1].x) == 51  # posição = id; a removida fica nula
+    assert fig.data[-1].x[0] is None and fig.data[-2].x[0] is None
+    assert fig.data[-1].x[5] == 13.0
+
+    # versão fora de sequência ou sem estado no navegador: figura completa
+    for aplicado in (estado, None):
+        fig, _, _, _ = update_graph(
+            GUINDASTE, _alteracoes(conjunto, chave, -1), aplicado
+        )
+        assert isinstance(fig, Figure)
+
+
+def test_conjunto_expirado_mantem_pagina_editada_e_avisa():
+    import index
+    from benchmarks.loadtest import ClienteDash
+
+    cliente = ClienteDash(index.app)
+    pagina = [
+        {"id": i, "Ponto": f"P{i}", "Lanca": 30.0, "Raio": 8.0, "Carga": 2.0}
+        for i in range(3)
+    ]
+    editada = [dict(r) for r in pagina]
+    editada[1]["Carga"] = 7.5
+
+    *_, resposta = cliente.chamar(
+        "dados-iniciais-alteracoes.data",
+        {
+            "dados-iniciais-data-table.page_current": 0,
+            "dados-iniciais-data-table.page_size": 50,
+            "dados-iniciais-data-table.data_timestamp": 1,
+            "dados-iniciais-data-table.data": editada,
+            "dados-iniciais-data-table.data_previous": pagina,
+            "dados-iniciais-conjunto.data": "naoexistemais",
+        },
+        ["dados-iniciais-data-table.data_timestamp"],
+    )
+    alteracoes = resposta["dados-iniciais-alteracoes"]["data"]
+    assert alteracoes["expirado"] and alteracoes["completo"]
+    assert alteracoes["total"] == 3
+    dados = resposta["dados-iniciais-data-table"]["data"]
+    assert [r["Carga"] for r in dados] == [2.0, 7.5, 2.0]
+
+    *_, resposta = cliente.chamar(
+        "dados-iniciais-output-feedback.children",
+        {"dados-iniciais-alteracoes.data": alteracoes},
+        ["dados-iniciais-alteracoes.data"],
+    )
+    aviso = resposta["dados-iniciais-output-feedback"]["children"]
+    assert "expiraram" in aviso["props"]["children"]
@@ -0,0 +1,138 @@
+import base64
+import io
+import os
+import shutil
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from engine.curva_carga import CurvaCarga
+from pages.home import tab1Columns
+from storage.conjuntos import ConjuntoDados
+from storage.importacao import (
+    importar_para_conjunto,
+    importar_tabela_carga,
+    validar_pontos,
+)
+
+
+def _upload(dados, tipo="text/csv"):
+    return f"data:{tipo};base64," + base64.b64encode(dados).decode()
+
+
+def _xlsx(linhas):
+    livro = Workbook()
+    planilha = livro.active
+    for linha in linhas:
+        planilha.append(linha)
+    saida = io.BytesIO()
+    livro.save(saida)
+    return saida.getvalue()
+
+
+def test_csv_em_blocos_com_validacao():
+    linhas = ["Área içam.;Lança;Raio;Carga [ton]"]
+    linhas += [f"P{i};30;{5 + i % 10},5;2,0" for i in range(95)]
+    linhas += ["ruim;30;40;1", "texto;30;abc;1", "neg;30;10;-1"]
+    dados = "\n".join(linhas).encode("latin-1")
+
+    conjunto = ConjuntoDados.de_colunas_tabela(tab1Columns)
+    andamento = []
+    resultado = importar_para_conjunto(
+        _upload(dados),
+        "pontos.csv",
+        conjunto,
+        tab1Columns,
+        validar=validar_pontos,
+        progresso=lambda f, m: andamento.append(f),
+        tamanho_bloco=10,
+    )
+
+    assert resultado.linhas == len(conjunto) == 95
+    assert conjunto.df["Raio"].iloc[0] == 5.5
+    assert resultado.total_erros == 3
+    assert resultado.erros["Linha"].tolist() == [97, 98, 99]
+    assert resultado.erros["Motivo"].tolist() == [
+        "raio maior que a lança",
+        "Raio não numérico",
+        "carga inválida",
+    ]
+    assert andamento == sorted(andamento) and andamento[-1] == 1.0
+
+
+def test_csv_utf8_com_caractere_na_borda_da_amostra():
+    cabecalho = "Área içam.;Lança;Raio;Carga [ton]\n".encode()
+    linha = "P{:05d};30;5,5;2,0\n"
+    n = (64 * 1024 - len(cabecalho)) // len(linha) - 1
+    corpo = "".join(linha.format(i) for i in range(n)).encode()
+    # o 1º byte de "ç" é o último da amostra de 64 KB
+    enchimento = "x" * (64 * 1024 - len(cabecalho) - len(corpo) - 1)
+    dados = cabecalho + corpo + f"{enchimento}ç;30;5,5;2,0\n".encode()
+    assert dados[64 * 1024 - 1 : 64 * 1024 + 1] == "ç".encode()
+
+    conjunto = ConjuntoDados.de_colunas_tabela(tab1Columns)
+    importar_para_conjunto(
+        _upload(dados), "pontos.csv", conjunto, tab1Columns, validar=validar_pontos
+    )
+    assert conjunto.df["Ponto"].iloc[-1] == f"{enchimento}ç"
+
+def test_xlsx_e_colunas_ausentes():
+    dados = _xlsx(
+        [["Ponto", "Lanca", "Raio", "Carga"]]
+        + [[f"P{i}", 30.0, 10.0, 1.0] for i in range(25)]
+    )
+    conjunto = ConjuntoDados.de_colunas_tabela(tab1Columns)
+    resultado = importar_para_conjunto(
+        _upload(dados), "pontos.xlsx", conjunto, tab1Columns, tamanho_bloco=7
+    )
+    assert resultado.linhas == 25 and resultado.ids == list(range(25))
+
+    with pytest.raises(ValueError, match="Lanca"):
+        importar_para_conjunto(
+            _upload(b"Ponto,Raio,Carga\nA,1,1\n"), "x.csv", conjunto, tab1Columns
+        )
+
+
+def test_tabela_de_carga_gravada_em_xlsx(tmp_path):
+    df = pd.read_excel("data/guindaste_80TON.xlsx")
+    dados = df.to_csv(index=False).encode() + b"3,2,0\n"
+
+    resultado = importar_tabela_carga(
+        _upload(dados), "Guindaste 50t.csv", str(tmp_path), tamanho_bloco=50
+    )
+    assert resultado.caminho.endswith("Guindaste_50t.xlsx")
+    assert resultado.linhas == len(df) and resultado.total_erros == 1
+
+    curva = CurvaCarga(pd.read_excel(resultado.caminho))
+    assert curva.capacidade(3.0, 11.4) == pytest.approx(90.0)
+
+
+def test_tabela_de_carga_nao_substitui_id_existente(tmp_path):
+    shutil.copy("data/guindaste_80TON.xlsx", tmp_path)
+    original = (tmp_path / "guindaste_80TON.xlsx").read_bytes()
+    dados = pd.read_excel("data/guindaste_80TON.xlsx").to_csv(index=False).encode()
+
+    caminhos = [
+        importar_tabela_carga(_upload(dados), "guindaste_80TON.csv", str(tmp_path)).caminho
+        for _ in range(2)
+    ]
+    assert [os.path.basename(c) for c in caminhos] == [
+        "guindaste_80TON_2.xlsx", "guindaste_80TON_3.xlsx",
+    ]
+    assert (tmp_path / "guindaste_80TON.xlsx").read_bytes() == original
+    assert sorted(os.listdir(tmp_path)) == [
+        "guindaste_80TON.xlsx", "guindaste_80TON_2.xlsx", "guindaste_80TON_3.xlsx",
+    ]
+
+
+def test_arquivo_corrompido_vira_value_error():
+    conjunto = ConjuntoDados.de_colunas_tabela(tab1Columns)
+    with pytest.raises(ValueError, match="Arquivo inválido"):
+        importar_para_conjunto(
+            _upload(b"PK\x03\x04 nao e um zip"), "p.xlsx", conjunto, tab1Columns
+        )
+    with pytest.raises(ValueError, match="Arquivo inválido"):
+        importar_para_conjunto(
+            _upload(_xlsx([["Ponto"]])[:200]), "p.xlsx", conjunto, tab1Columns
+        )
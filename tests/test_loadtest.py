@@ -0,0 +1,26 @@
+from benchmarks import loadtest
+
+
+def test_payload_multi_output():
+    import index
+
+    chave, payload = loadtest.montar_payload(
+        index.app.callback_map,
+        "msg-validacao.children",
+        {"angulo-giro.value": 10},
+        ["angulo-giro.value"],
+    )
+    assert chave == "..btn-calcular.disabled...msg-validacao.children.."
+    assert payload["outputs"][1] == {"id": "msg-validacao", "property": "children"}
+    angulo = [i for i in payload["inputs"] if i["id"] == "angulo-giro"][0]
+    assert angulo["value"] == 10
+
+
+def test_sequencia_calcular_relata_percentis():
+    relatorio, _ = loadtest.executar(
+        usuarios=2, duracao=60, iteracoes=1, sequencias=["calcular"]
+    )
+    calculo = relatorio["..store-reacoes.data...resultado-calculo.children.."]
+    assert calculo["chamadas"] == 2
+    assert calculo["erros"] == 0
+    assert calculo["p50_ms"] <= calculo["p95_ms"] <= calculo["p99_ms"]
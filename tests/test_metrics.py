@@ -0,0 +1,87 @@
+import json
+
+import dash
+from dash import html, Input, Output
+
+from monitoring.metrics import MetricasCallbacks, instrumentar_app
+
+
+def criar_app():
+    app = dash.Dash(__name__)
+    metricas = instrumentar_app(app, MetricasCallbacks())
+    app.layout = html.Div([html.Div(id="entrada"), html.Div(id="saida")])
+
+    @app.callback(Output("saida", "children"), Input("entrada", "children"))
+    def eco(valor):
+        return f"eco {valor}"
+
+    return app, metricas
+
+
+def chamar_eco(client, valor):
+    payload = {
+        "output": "saida.children",
+        "outputs": {"id": "saida", "property": "children"},
+        "inputs": [{"id": "entrada", "property": "children", "value": valor}],
+        "changedPropIds": ["entrada.children"],
+    }
+    return client.post(
+        "/_dash-update-component",
+        data=json.dumps(payload),
+        content_type="application/json",
+    )
+
+
+def test_callback_instrumentado_e_exposto_em_metrics():
+    app, metricas = criar_app()
+    client = app.server.test_client()
+
+    for i in range(3):
+        assert chamar_eco(client, i).status_code == 200
+
+    resumo = metricas.resumo()
+    assert resumo[("eco", "saida.children")]["chamadas"] == 3
+
+    texto = client.get("/metrics").get_data(as_text=True)
+    assert 'dash_callback_calls_total{callback="eco",output="saida.children"} 3' in texto
+    assert "dash_callback_duration_seconds_bucket" in texto
+    assert 'dash_callback_response_bytes_count{callback="eco",output="saida.children"} 3' in texto
+
+
+def test_callback_lento_gera_log(caplog):
+    metricas = MetricasCallbacks(limite_lento_s=0.0)
+    metricas.inicio(("f", "x.y"))
+    with caplog.at_level("WARNING"):
+        metricas.fim(("f", "x.y"), 0.2)
+    assert "Callback lento" in caplog.text
+
+
+def test_medicao_de_memoria_serializa_callbacks():
+    import threading
+    import time
+    import tracemalloc
+    from concurrent.futures import ThreadPoolExecutor
+
+    app = dash.Dash(__name__)
+    instrumentar_app(app, MetricasCallbacks(tracemalloc_ativo=True))
+    app.layout = html.Div([html.Div(id="entrada"), html.Div(id="saida")])
+    ativos, maximo, lock = [0], [0], threading.Lock()
+
+    @app.callback(Output("saida", "children"), Input("entrada", "children"))
+    def eco(valor):
+        with lock:
+            ativos[0] += 1
+            maximo[0] = max(maximo[0], ativos[0])
+        time.sleep(0.02)
+        with lock:
+            ativos[0] -= 1
+        return valor
+
+    try:
+        client = app.server.test_client()
+        with ThreadPoolExecutor(4) as pool:
+            codigos = list(pool.map(lambda i: chamar_eco(client, i).status_code, range(8)))
+    finally:
+        tracemalloc.stop()
+    assert codigos == [200] * 8
+    assert maximo[0] == 1
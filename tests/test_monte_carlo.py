@@ -0,0 +1,47 @@
+import numpy as np
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.monte_carlo import Distribuicao, analise_monte_carlo
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_sem_incerteza_reproduz_caso_deterministico():
+    entrada = criar_entrada_dummy()
+    res = analise_monte_carlo(entrada, {}, n_amostras=10, n_processos=1)
+
+    X = calc_reactions_lote(**parametros_entrada(entrada))
+    np.testing.assert_allclose(res.percentis["p50"].to_numpy(), X[2:])
+    assert res.prob_descolamento_qualquer == 0.0
+    assert res.n_rejeitadas == 0
+
+
+def test_resultado_independe_do_numero_de_processos():
+    entrada = criar_entrada_dummy()
+    dist = {
+        "carga": Distribuicao.normal(7.8, 2.0),
+        "vento_i": Distribuicao.uniforme(-5e3, 5e3),
+        "Xcm": Distribuicao.normal(0.0, 0.3),
+        "soil_k": Distribuicao.lognormal(1e8, 0.3),
+    }
+    kw = dict(n_amostras=5_000, tamanho_lote=1_000, semente=42)
+
+    serial = analise_monte_carlo(entrada, dist, n_processos=1, **kw)
+    paralelo = analise_monte_carlo(entrada, dist, n_processos=2, **kw)
+
+    np.testing.assert_array_equal(serial.percentis, paralelo.percentis)
+    np.testing.assert_array_equal(serial.prob_descolamento, paralelo.prob_descolamento)
+    assert (serial.percentis["p1"] <= serial.percentis["p99"]).all()
+
+
+def test_amostras_fora_do_dominio_rejeitadas():
+    entrada = criar_entrada_dummy()
+    lanca = parametros_entrada(entrada)["lanca"]
+    dist = {
+        "carga": Distribuicao.normal(0.5, 1.0),
+        "raio": Distribuicao.uniforme(0.0, 2 * lanca),
+    }
+    res = analise_monte_carlo(entrada, dist, n_amostras=2_000, n_processos=1)
+
+    # P(carga >= 0) ≈ 0.69 e P(raio <= lança) = 0.5
+    assert 0.55 * 2_000 < res.n_rejeitadas < 0.75 * 2_000
+    assert np.isfinite(res.percentis.to_numpy()).all()
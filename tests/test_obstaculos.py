@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+from engine.obstaculos import (
+    Obstaculos,
+    _aproximacao_triangulo,
+    _parametro_caixa,
+    _parametro_triangulo,
+    ler_obj,
+    verificar_interferencias,
+)
+
+
+def _caixas_aleatorias(n, semente=0):
+    rng = np.random.default_rng(semente)
+    cmin = rng.uniform(-30, 30, (n, 3))
+    cmin[:, 2] = rng.uniform(0, 10, n)
+    cmax = cmin + rng.uniform(0.5, 4.0, (n, 3))
+    df = pd.DataFrame(np.hstack([cmin, cmax]), columns=COLS)
+    df.insert(0, "Nome", [f"E{i}" for i in range(n)])
+    return df
+
+
+COLS = ["Xmin", "Ymin", "Zmin", "Xmax", "Ymax", "Zmax"]
+
+
+def test_bvh_igual_forca_bruta():
+    caixas = _caixas_aleatorias(300)
+    obs = Obstaculos(caixas)
+    rng = np.random.default_rng(1)
+    p0 = rng.uniform(-30, 30, (500, 3))
+    p1 = rng.uniform(-30, 30, (500, 3))
+
+    hit = obs.intersecoes(p0, p1, folga=0.3)
+
+    cmin = caixas[COLS[:3]].to_numpy() - 0.3
+    cmax = caixas[COLS[3:]].to_numpy() + 0.3
+    for i in range(len(p0)):
+        bruto = _parametro_caixa(
+            np.repeat(p0[i : i + 1], 300, 0),
+            np.repeat(p1[i : i + 1], 300, 0),
+            cmin,
+            cmax,
+        )
+        esperado = np.argmin(bruto) if np.isfinite(bruto).any() else -1
+        assert hit[i] == esperado
+
+
+def test_obstaculo_mais_proximo_do_inicio():
+    caixas = pd.DataFrame(
+        [
+            ["Longe", 8.0, -1.0, 0.0, 9.0, 1.0, 5.0],
+            ["Perto", 3.0, -1.0, 0.0, 4.0, 1.0, 5.0],
+        ],
+        columns=["Nome"] + COLS,
+    )
+    obs = Obstaculos(caixas)
+    hit = obs.intersecoes([[0, 0, 2], [10, 0, 2]], [[10, 0, 2], [0, 0, 2]])
+    assert obs.nomes[hit].tolist() == ["Perto", "Longe"]
+
+
+def test_folga_em_triangulos():
+    parede = np.array(
+        [[[5, -5, 0], [5, 5, 0], [5, 5, 20]], [[5, -5, 0], [5, 5, 20], [5, -5, 20]]]
+    )
+    obs = Obstaculos(triangulos=parede)
+    p0, p1 = [[0, 0, 2]], [[4.7, 0, 2]]  # para a 0,3 m da parede
+    assert obs.intersecoes(p0, p1)[0] == -1
+    assert obs.intersecoes(p0, p1, folga=0.5)[0] >= 0
+    assert obs.intersecoes(p0, p1, folga=0.2)[0] == -1
+
+
+def test_aproximacao_triangulo_igual_amostragem():
+    rng = np.random.default_rng(2)
+    p0, p1 = rng.uniform(-5, 5, (200, 3)), rng.uniform(-5, 5, (200, 3))
+    v0, v1, v2 = (rng.uniform(-5, 5, (200, 3)) for _ in range(3))
+    dist, _ = _aproximacao_triangulo(p0, p1, v0, v1, v2)
+    cruza = np.isfinite(_parametro_triangulo(p0, p1, v0, v1, v2))
+
+    s = np.linspace(0, 1, 201)[:, None, None]
+    u, v = np.meshgrid(np.linspace(0, 1, 101), np.linspace(0, 1, 101))
+    u, v = u[u + v <= 1][:, None, None], v[u + v <= 1][:, None, None]
+    for i in np.flatnonzero(~cruza)[:20]:
+        seg = p0[i] + s * (p1[i] - p0[i])  # (201, 1, 3)
+        tri = v0[i] + u * (v1[i] - v0[i]) + v * (v2[i] - v0[i])  # (m, 1, 3)
+        amostrada = np.linalg.norm(seg - tri.reshape(1, -1, 3), axis=-1).min()
+        assert dist[i] <= amostrada + 1e-9
+        assert amostrada - dist[i] < 0.15
+
+
+def test_malha_obj(tmp_path):
+    arquivo = tmp_path / "parede.obj"
+    arquivo.write_text(
+        "o parede\nv 5 -5 0\nv 5 5 0\nv 5 5 20\nv 5 -5 20\nf 1 2 3 4\n",
+        encoding="utf-8",
+    )
+    tri, nomes = ler_obj(arquivo)
+    assert tri.shape == (2, 3, 3) and nomes == ["parede", "parede"]
+
+    obs = Obstaculos.de_arquivo(str(arquivo))
+    res = verificar_interferencias(
+        obs, pivo=[0, 0, 2], lanca=20.0, raios=[3.0, 8.0], giros=[0.0, 180.0]
+    )
+    # raio 8 no giro 0 atravessa a parede em x = 5; raio 3 não alcança
+    assert res.colide.tolist() == [[False, False], [True, False]]
+    assert res.nome_obstaculo()[1, 0] == "parede"
+
+
+def test_carga_pendurada():
+    caixas = pd.DataFrame(
+        [["Tanque", 9.0, -1.0, 0.0, 11.0, 1.0, 3.0]], columns=["Nome"] + COLS
+    )
+    obs = Obstaculos(caixas)
+    res = verificar_interferencias(obs, [0, 0, 2], 20.0, [10.0], [0.0, 90.0])
+    assert res.elemento.tolist() == [["carga", ""]]
+
+    res = verificar_interferencias(
+        obs, [0, 0, 2], 20.0, [10.0], [0.0], altura_carga=5.0
+    )
+    assert not res.colide.any()
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.otimizador_apoio import otimizar_apoio
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def _forca_bruta(entrada, contrapesos, areas, p_adm):
+    p = parametros_entrada(entrada)
+    p["angulo_giro_deg"] = np.arange(0.0, 360.0, 1.0)
+    melhor = None
+    for cp in contrapesos:
+        p["contrapeso"] = cp
+        R = calc_reactions_lote(**p)[..., 2:]
+        for a in areas:
+            if R.min() > 0 and R.max() / a <= p_adm:
+                custo = cp + 4 * a
+                if melhor is None or custo < melhor[0]:
+                    melhor = (custo, cp, a)
+    return melhor
+
+
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test_otimizador_igual_forca_bruta(n_threads):
+    entrada = criar_entrada_dummy()
+    contrapesos = np.arange(0.0, 40.1, 2.5)
+    areas = np.arange(0.5, 4.01, 0.25)
+
+    res = otimizar_apoio(
+        entrada,
+        contrapesos,
+        areas,
+        pressao_admissivel=150e3,
+        tamanho_bloco=2,
+        n_threads=n_threads,
+    )
+    custo, cp, a = _forca_bruta(entrada, contrapesos, areas, 150e3)
+
+    assert res.melhor["Custo"] == pytest.approx(custo)
+    assert res.melhor["Contrapeso"] == cp
+    assert res.melhor["Area"] == a
+    assert (res.candidatos["Status"] == "podado").any()
+    assert (res.viaveis["Custo"] >= custo - 1e-9).all()
+
+
+def test_otimizador_sem_solucao():
+    entrada = criar_entrada_dummy()
+    res = otimizar_apoio(entrada, [0.0, 1.0], [0.1], pressao_admissivel=1.0)
+    assert res.melhor is None
+    assert not len(res.viaveis)
@@ -0,0 +1,87 @@
+import os
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import calc_reactions
+from engine.icamento import calcular_icamento
+from relatorios import planos_icamento as pl
+from storage.catalogo import Catalogo
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def _base():
+    base = criar_entrada_dummy()
+    return replace(base, solo=pd.concat([base.solo, pd.Series({"soil_adm": 250e3})]))
+
+
+def test_calcular_icamento_igual_ao_calculo_da_tela():
+    entrada = _base()
+    X, _, _, _ = calc_reactions(entrada)
+    resultado = calcular_icamento(entrada)
+    np.testing.assert_allclose(list(resultado.reacoes.values()), X[2:, 0])
+    assert resultado.utilizacao == max(resultado.reacoes.values()) / (250e3 * 2.25)
+
+
+def test_gerar_planos_pdf_e_resumo_xlsx(tmp_path):
+    lista = pd.DataFrame(
+        {
+            "Ponto": ["Bomba 1", "Trocador", "Sem carga"],
+            "Lanca": [30.0, 37.5, 30.0],
+            "Raio": [12.0, 16.0, 10.0],
+            "Carga": [8.0, 5.0, np.nan],
+            "Giro": [0.0, 90.0, np.nan],
+        }
+    )
+    casos = pl.casos_da_lista(lista, _base(), "guindaste_80TON")
+    assert casos[2].entrada.angulo_giro_deg == _base().angulo_giro_deg
+
+    resumo = pl.gerar_planos(casos, str(tmp_path), n_processos=1)
+    assert list(resumo["Valido"]) == [True, True, False]
+    assert resumo.loc[0, "P1 [kN]"] * 1e3 == calcular_icamento(
+        casos[0].entrada
+    ).reacoes["P1"]
+    assert 0 < resumo.loc[0, "Utilizacao_tabela"] < 1
+    assert np.isnan(resumo.loc[2, "P1 [kN]"])
+
+    pdfs = list(resumo["Arquivo"])
+    for pdf in pdfs:
+        assert open(pdf, "rb").read(5) == b"%PDF-"
+
+    abas = pd.read_excel(tmp_path / "resumo.xlsx", sheet_name=None)
+    assert list(abas["Resumo"]["Caso"]) == ["Bomba 1", "Trocador", "Sem carga"]
+    assert len(abas["Envoltoria"]) == 2 * 360
+
+    # mesmo lote: PDFs reaproveitados
+    mtimes = [os.path.getmtime(p) for p in pdfs]
+    os.utime(pdfs[0], (1, 1))
+    pl.gerar_planos(casos, str(tmp_path), n_processos=1)
+    assert os.path.getmtime(pdfs[0]) == 1
+    assert [os.path.getmtime(p) for p in pdfs[1:]] == mtimes[1:]
+
+
+def test_gerar_planos_em_paralelo_usa_o_catalogo_recebido(tmp_path):
+    dados = tmp_path / "dados"
+    dados.mkdir()
+    df = pd.read_excel("data/guindaste_80TON.xlsx")
+    df.assign(Carga=df.Carga * 0.5).to_excel(dados / "guindaste_40TON.xlsx", index=False)
+    catalogo = Catalogo(
+        str(dados), str(tmp_path / "i.json"), diretorio_cache=str(tmp_path / "c")
+    )
+    lista = pd.DataFrame(
+        {"Ponto": ["A", "B"], "Lanca": [30.0, 30.0], "Raio": [12.0, 14.0],
+         "Carga": [4.0, 3.0]}
+    )
+    casos = pl.casos_da_lista(lista, _base(), "guindaste_40TON")
+
+    paralelo = pl.gerar_planos(
+        casos, str(tmp_path / "p"), n_processos=2, catalogo=catalogo
+    )
+    serial = pl.gerar_planos(
+        casos, str(tmp_path / "s"), n_processos=1, catalogo=catalogo
+    )
+    assert paralelo["Utilizacao_tabela"].notna().all()
+    pd.testing.assert_series_equal(
+        paralelo["Capacidade_tabela [ton]"], serial["Capacidade_tabela [ton]"]
+    )
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.curva_carga import CurvaCarga
+from engine.posicionamento import avaliar_posicoes
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def _curva():
+    raios = [3.0, 8.0, 14.0, 3.0, 10.0, 20.0, 4.0, 14.0, 28.0]
+    lancas = [15.0, 15.0, 15.0, 22.0, 22.0, 22.0, 30.0, 30.0, 30.0]
+    cargas = [20.0, 10.0, 5.0, 15.0, 8.0, 3.0, 10.0, 5.0, 1.5]
+    return CurvaCarga(pd.DataFrame({"Raio": raios, "Lanca": lancas, "Carga": cargas}))
+
+
+def test_posicoes_igual_avaliacao_individual():
+    entrada = criar_entrada_dummy()
+    curva = _curva()
+    pontos = pd.DataFrame({"X": [5.0, 12.0], "Y": [9.0, -3.0], "Carga": [2.0, 1.0]})
+    x = np.linspace(-5, 15, 11)
+    y = np.linspace(-5, 5, 6)
+
+    res = avaliar_posicoes(
+        entrada, curva, pontos, x, y, pressao_admissivel=1e9, tamanho_lote=7
+    )
+    assert res.utilizacao.shape == (6, 11)
+
+    j, i = 3, 4
+    dx = pontos["X"].to_numpy() - x[i]
+    dy = pontos["Y"].to_numpy() - y[j]
+    raio = np.hypot(dx, dy)
+    np.testing.assert_allclose(res.raio[j, i], raio)
+
+    # lança escolhida = menor utilização entre as que alcançam
+    for k in range(2):
+        caps = curva.capacidade(raio[k], curva.lancas)
+        util = np.where(curva.lancas >= raio[k], pontos["Carga"][k] / caps, np.inf)
+        util = np.nan_to_num(util, nan=np.inf)
+        assert res.lanca[j, i, k] == curva.lancas[np.argmin(util)]
+        np.testing.assert_allclose(res.utilizacao_tabela[j, i, k], util.min())
+
+    p = parametros_entrada(entrada)
+    p["raio"] = raio
+    p["lanca"] = res.lanca[j, i]
+    p["angulo_giro_deg"] = np.degrees(np.arctan2(dy, dx))
+    p["carga"] = pontos["Carga"].to_numpy()
+    R = calc_reactions_lote(**p)[..., 2:]
+    np.testing.assert_allclose(res.reacao_min[j, i], R.min(), rtol=1e-9)
+
+
+def test_ponto_fora_de_alcance_inviavel():
+    entrada = criar_entrada_dummy()
+    pontos = pd.DataFrame({"X": [100.0], "Y": [0.0], "Carga": [1.0]})
+    res = avaliar_posicoes(entrada, _curva(), pontos, [0.0], [0.0])
+    assert not res.viavel.any()
+    assert np.isnan(res.lanca).all()
+    assert res.melhor_posicao() is None
@@ -0,0 +1,38 @@
+import numpy as np
+
+from engine.pressao_solo import campo_pressao, envoltoria_pressao, fatores_influencia
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_fator_de_influencia_boussinesq():
+    centro = np.array([[0.0, 0.0]])
+    x = np.array([0.0, 50.0])
+
+    # logo abaixo do centro -> 1; longe -> 0
+    raso = fatores_influencia(centro, 2.0, 2.0, x, np.array([0.0]), 1e-4)
+    np.testing.assert_allclose(raso[0, 0], [1.0, 0.0], atol=1e-3)
+
+    # centro de sapata quadrada com z = B/2: fator tabelado 0.701
+    medio = fatores_influencia(centro, 2.0, 2.0, x[:1], np.array([0.0]), 1.0)
+    np.testing.assert_allclose(medio[0, 0, 0], 0.701, atol=2e-3)
+
+
+def test_campo_em_profundidade_conserva_a_forca():
+    entrada = criar_entrada_dummy()
+    env = envoltoria_pressao(entrada, angulos=[0.0, 90.0])
+
+    x, y, campo = campo_pressao(entrada, env, profundidade=0.5, n_malha=200)
+    dA = (x[1] - x[0]) * (y[1] - y[0])
+    forca = campo.sum(axis=(1, 2)) * dA
+
+    np.testing.assert_allclose(forca, env.reacoes.clip(min=0).sum(axis=1), rtol=0.05)
+
+
+def test_resumo_utilizacao():
+    entrada = criar_entrada_dummy()
+    env = envoltoria_pressao(entrada, pressao_admissivel=200e3)
+    resumo = env.resumo()
+    assert list(resumo.index) == ["P1", "P2", "P3", "P4"]
+    np.testing.assert_allclose(
+        resumo["Utilizacao"], resumo["Pressao_max"] / 200e3
+    )
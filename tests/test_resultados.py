@@ -0,0 +1,64 @@
+from dataclasses import replace
+
+import pandas as pd
+
+from storage.resultados import BancoResultados, hash_entrada
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_hash_canonico():
+    entrada = criar_entrada_dummy()
+    mesma = replace(entrada, angulo_giro_deg=45, contrapeso=entrada.contrapeso + 0.0)
+    outra = replace(entrada, angulo_giro_deg=46.0)
+
+    assert hash_entrada(entrada) == hash_entrada(mesma)
+    assert hash_entrada(entrada) != hash_entrada(outra)
+    assert hash_entrada(entrada) != hash_entrada(entrada, versao_tabela="v2")
+
+
+def test_salvar_obter_buscar_e_podar(tmp_path):
+    banco = BancoResultados(str(tmp_path / "r.sqlite"), limite_bytes=10_000)
+
+    banco.salvar("a", {"x": 1}, guindaste="G90", projeto="P1", utilizacao=0.5)
+    # visível antes de gravar
+    assert banco.obter("a") == {"x": 1}
+    banco.esvaziar(timeout=5)
+    assert banco.obter("a") == {"x": 1}
+    assert banco.obter("nao-existe") is None
+
+    banco.salvar("b", {"x": 2}, guindaste="G90", projeto="P2", utilizacao=0.9)
+    banco.esvaziar(timeout=5)
+    df = banco.buscar(guindaste="G90", utilizacao_min=0.8)
+    assert df["hash"].tolist() == ["b"]
+
+    # poda: blocos grandes expulsam os menos acessados
+    for i in range(5):
+        banco.salvar(f"g{i}", {"dados": "x" * 3000})
+    banco.esvaziar(timeout=5)
+    assert banco.tamanho_total() <= 10_000
+    assert banco.obter("a") is None
+    assert banco.obter("g4") is not None
+
+    # outro processo/instância enxerga os dados gravados
+    outro = BancoResultados(banco.caminho)
+    assert isinstance(outro.buscar(), pd.DataFrame)
+    assert outro.obter("g4") == {"dados": "x" * 3000}
+
+
+def test_calculo_da_pagina_encontrado_por_guindaste():
+    from pages import calc_patolas as pg
+    from storage.catalogo import catalogo_padrao
+    from storage.resultados import banco_padrao
+    from tests.dados import dados_tabelas_patolas
+
+    guindaste = next(iter(catalogo_padrao().opcoes()))[0]
+    d = dados_tabelas_patolas(angulo=137)
+    pg.executar_calculo(
+        1, d["pat"], d["cm"], d["lanca"], d["carga"], d["vento"], d["solo"],
+        d["pesos"], d["angulo"], guindaste, " Obra 7 ",
+    )
+
+    banco = banco_padrao()
+    banco.esvaziar(timeout=5)
+    df = banco.buscar(guindaste=guindaste, projeto="Obra 7")
+    assert len(df) == 1 and df["utilizacao"].notna().all()
@@ -0,0 +1,52 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.sensibilidade import (
+    PARAMETROS,
+    calc_sensibilidade,
+    carga_ate_descolamento,
+    jacobiano_lote,
+)
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def entrada_com_vento():
+    return replace(criar_entrada_dummy(), vento=pd.Series({"Vi": 2000.0, "Vj": 500.0}))
+
+
+def test_jacobiano_igual_a_diferencas_finitas():
+    p = parametros_entrada(entrada_com_vento())
+    _, J = jacobiano_lote(**p)
+
+    for k, nome in enumerate(PARAMETROS):
+        h = 1e-4 * max(1.0, abs(p[nome]))
+        mais = calc_reactions_lote(**{**p, nome: p[nome] + h})
+        menos = calc_reactions_lote(**{**p, nome: p[nome] - h})
+        np.testing.assert_allclose(
+            J[:, k], (mais - menos) / (2 * h), rtol=1e-5, atol=1e-3, err_msg=nome
+        )
+
+
+def test_jacobiano_em_lote_com_centro_de_massa_variavel():
+    p = parametros_entrada(entrada_com_vento())
+    p["centro_massa"] = np.array([[0.0, 0.0, 2.0], [0.3, -0.2, 2.0]])
+    X, J = jacobiano_lote(**p)
+    assert X.shape == (2, 6) and J.shape == (2, 6, len(PARAMETROS))
+    np.testing.assert_allclose(X, calc_reactions_lote(**p))
+
+
+def test_carga_ate_descolamento_zera_a_reacao():
+    entrada = entrada_com_vento()
+    reacoes, sens = calc_sensibilidade(entrada)
+    margem = carga_ate_descolamento(reacoes, sens)
+
+    critica = margem.idxmin()
+    assert np.isfinite(margem[critica])
+
+    p = parametros_entrada(entrada)
+    p["carga"] += margem[critica]
+    X = calc_reactions_lote(**p)
+    assert abs(X[2 + list(reacoes.index).index(critica)]) < 1e-6
@@ -0,0 +1,68 @@
+import time
+
+import numpy as np
+
+from storage.sessao import ArmazemDisco, ArmazemMemoria
+
+
+def test_memoria_lru_e_ttl():
+    armazem = ArmazemMemoria(ttl_s=0.2, max_itens=2)
+    a = armazem.guardar({"x": np.arange(3)})
+    b = armazem.guardar("b")
+    assert armazem.guardar("b") == b  # mesmo conteúdo, mesmo handle
+    armazem.obter(a)  # a passa a ser o mais recente
+    armazem.guardar("c")
+    assert armazem.obter(b) is None
+    np.testing.assert_array_equal(armazem.obter(a)["x"], np.arange(3))
+
+    time.sleep(0.25)
+    assert armazem.obter(a) is None
+    assert len(armazem) == 0
+
+
+def test_disco_compartilhado_entre_instancias(tmp_path):
+    escrita = ArmazemDisco(str(tmp_path), ttl_s=60, max_itens=3)
+    leitura = ArmazemDisco(str(tmp_path), ttl_s=60, max_itens=3)
+
+    grande = np.zeros((500, 500))
+    handle = escrita.guardar({"malha": grande})
+    assert len(handle) == 20
+    assert leitura.obter(handle)["malha"].shape == (500, 500)
+
+    for i in range(5):
+        escrita.guardar(i)
+    assert len(escrita) == 3
+    assert leitura.obter("../fora") is None
+
+
+def test_handle_invalido_nao_e_consultado():
+    armazem = ArmazemMemoria()
+    handle = armazem.guardar("x")
+    assert armazem.obter(handle) == "x"
+    for invalido in (None, 3, "", "../x", ["a"], {"a": 1}):
+        assert armazem.obter(invalido, "padrao") == "padrao"
+
+
+def test_grafico_avisa_resultado_expirado():
+    from pages import calc_patolas as pg
+    from tests.dados import dados_tabelas_patolas
+
+    d = dados_tabelas_patolas()
+    args = (d["pat"], d["cm"], d["lanca"], d["vento"], d["angulo"])
+    fig, _ = pg.atualizar_graficos(*args, "naoexiste0000", 1, [])
+    assert "expirado" in fig.layout.annotations[0].text
+    fig, _ = pg.atualizar_graficos(*args, None, None, [])
+    assert not fig.layout.annotations
+
+
+def test_disco_e_o_padrao(tmp_path, monkeypatch):
+    from storage.sessao import armazem_do_ambiente
+
+    monkeypatch.delenv("CRANE_SESSION_DIR", raising=False)
+    monkeypatch.setenv("CRANE_CACHE_DIR", str(tmp_path))
+    armazem = armazem_do_ambiente()
+    assert isinstance(armazem, ArmazemDisco)
+    assert armazem.diretorio == str(tmp_path / "sessao")
+
+    monkeypatch.setenv("CRANE_SESSION_DIR", "")
+    assert isinstance(armazem_do_ambiente(), ArmazemMemoria)
@@ -0,0 +1,75 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from engine.curva_carga import CurvaCarga
+from relatorios import tabelas_carga as tc
+from storage.catalogo import Catalogo
+
+
+def _catalogo(tmp_path):
+    dados = tmp_path / "dados"
+    dados.mkdir()
+    shutil.copy("data/guindaste_80TON.xlsx", dados)
+    return Catalogo(
+        str(dados), str(tmp_path / "i.json"), diretorio_cache=str(tmp_path / "c")
+    )
+
+
+def test_malha_do_catalogo_igual_a_do_mapa(tmp_path):
+    catalogo = _catalogo(tmp_path)
+    malha = catalogo.malha("guindaste_80TON", 40)
+    assert len(os.listdir(tmp_path / "c")) == 1
+
+    esperada = CurvaCarga(catalogo.tabela("guindaste_80TON")).malha(40)
+    np.testing.assert_array_equal(malha.carga, esperada.carga)
+    np.testing.assert_array_equal(malha.lanca, esperada.lanca)
+    # segunda leitura vem do disco
+    np.testing.assert_array_equal(catalogo.malha("guindaste_80TON", 40).x, malha.x)
+
+
+def test_renderizar_catalogo_reaproveita_e_troca_arquivos(tmp_path):
+    catalogo = _catalogo(tmp_path)
+    saida = tmp_path / "saida"
+
+    indice = tc.renderizar_catalogo(("png", "svg"), str(saida), catalogo=catalogo)
+    assert list(indice["gerado"]) == [True, True]
+    png = indice.loc[indice.formato == "png", "arquivo"].item()
+    assert open(png, "rb").read(8) == b"\x89PNG\r\n\x1a\n"
+
+    indice = tc.renderizar_catalogo(("png", "svg"), str(saida), catalogo=catalogo)
+    assert not indice["gerado"].any()
+
+    # tabela alterada: novo arquivo, o antigo sai
+    arquivo = tmp_path / "dados" / "guindaste_80TON.xlsx"
+    df = pd.read_excel(arquivo)
+    df.assign(Carga=df.Carga * 0.9).to_excel(arquivo, index=False)
+    catalogo.atualizar()
+    indice = tc.renderizar_catalogo(("png",), str(saida), catalogo=catalogo)
+    assert indice["gerado"].all()
+    assert sorted(p.suffix for p in saida.iterdir()) == [".png", ".svg"]
+    assert not os.path.exists(png)
+
+
+def test_renderizar_catalogo_em_paralelo_usa_o_catalogo_recebido(tmp_path):
+    catalogo = _catalogo(tmp_path)
+    df = pd.read_excel("data/guindaste_80TON.xlsx")
+    df.assign(Carga=df.Carga * 0.5).to_excel(
+        tmp_path / "dados" / "guindaste_40TON.xlsx", index=False
+    )
+    catalogo.atualizar()
+    saida = tmp_path / "saida"
+
+    indice = tc.renderizar_catalogo(
+        ("png",), str(saida), n_processos=2, catalogo=catalogo
+    )
+    assert sorted(indice["id"]) == ["guindaste_40TON", "guindaste_80TON"]
+    assert indice["gerado"].all()
+    for r in indice.itertuples():
+        assert os.path.basename(r.arquivo) == tc.nome_arquivo(
+            catalogo.entrada(r.id), "png"
+        )
+    # a malha foi gravada no cache deste catálogo, não no do ambiente
+    assert len(os.listdir(tmp_path / "c")) == 2
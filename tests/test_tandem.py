@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.tandem import (
+    CargaTandem,
+    GuindasteTandem,
+    caminho_linear,
+    calc_tandem,
+    divisao_carga,
+)
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_divisao_carga_pelo_cg():
+    f1, f2 = divisao_carga(
+        np.array([1.0, 0.0]), np.array([0.0, 0.0]), np.array([4.0, 0.0]), 10.0
+    )
+    assert (f1, f2) == pytest.approx((7.5, 2.5))
+
+
+def test_divisao_carga_cg_fora_do_segmento():
+    with pytest.raises(ValueError, match="CG fora"):
+        divisao_carga(
+            np.array([5.0, 0.0]), np.array([0.0, 0.0]), np.array([4.0, 0.0]), 10.0
+        )
+
+
+def test_tandem_igual_solver_individual():
+    entrada = criar_entrada_dummy()
+    g1 = GuindasteTandem(entrada, posicao=(-10.0, 0.0), acessorios=0.5)
+    g2 = GuindasteTandem(entrada, posicao=(10.0, 0.0), rumo_deg=180.0)
+    carga = CargaTandem(peso=8.0, pontos=((-2.0, 0.0), (3.0, 0.0)))
+    caminho = caminho_linear(
+        {"X": 0.0, "Y": -2.0, "Rumo": 0.0}, {"X": 0.0, "Y": 6.0, "Rumo": 30.0}, n=25
+    )
+
+    res = calc_tandem([g1, g2], carga, caminho)
+    am = res.amostras
+
+    np.testing.assert_allclose(am[("G1", "Parcela")] + am[("G2", "Parcela")], 1.0)
+    # rumo 0: CG a 2 m de A e 3 m de B -> 60 % em G1
+    assert am[("G1", "Parcela")].iloc[0] == pytest.approx(0.6)
+
+    p = parametros_entrada(entrada)
+    p["raio"] = am[("G2", "Raio")].to_numpy()
+    p["angulo_giro_deg"] = am[("G2", "Giro")].to_numpy()
+    p["carga"] = am[("G2", "Carga")].to_numpy()
+    R = calc_reactions_lote(**p)[:, 2:]
+    np.testing.assert_allclose(am[("G2", "Reacao_min")], R.min(axis=1))
+
+    # raio da ponta de G2 (em x = 10) até o ponto B na primeira amostra
+    assert am[("G2", "Raio")].iloc[0] == pytest.approx(np.hypot(7.0, 2.0))
+    assert am[("G1", "Carga")].iloc[0] == pytest.approx(8.0 * 0.6 + 0.5)
+
+
+def test_tandem_sinaliza_perda_de_contato():
+    entrada = criar_entrada_dummy()
+    g1 = GuindasteTandem(entrada, posicao=(-15.0, 0.0))
+    g2 = GuindasteTandem(entrada, posicao=(15.0, 0.0))
+    carga = CargaTandem(peso=60.0)
+    caminho = pd.DataFrame({"X": [0.0], "Y": [0.0], "Rumo": [0.0]})
+
+    res = calc_tandem([g1, g2], carga, caminho)
+    assert not res.viavel
+    assert len(res.alertas()) == 1
@@ -0,0 +1,52 @@
+import json
+import os
+
+from engine.calc_reactions import calc_reactions
+from monitoring import tracing
+from monitoring.tracing import span
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_span_desativado_nao_registra():
+    tracing.desativar()
+    tracing.limpar()
+    with span("nada"):
+        pass
+    assert tracing.eventos() == []
+
+
+def test_spans_aninhados_exportados(tmp_path):
+    tracing.limpar()
+    tracing.ativar()
+    try:
+        with span("externo"):
+            with span("interno", n=3):
+                pass
+    finally:
+        tracing.desativar()
+
+    caminho = tracing.exportar_trace(tmp_path / "trace.json")
+    eventos = json.loads(caminho.read_text())["traceEvents"]
+
+    interno, externo = eventos
+    assert (interno["name"], externo["name"]) == ("interno", "externo")
+    assert interno["args"] == {"n": 3}
+    assert externo["ts"] <= interno["ts"]
+    assert interno["ts"] + interno["dur"] <= externo["ts"] + externo["dur"]
+
+
+def test_solvers_do_engine_rastreados():
+    tracing.limpar()
+    tracing.ativar()
+    try:
+        with span("calcular"):
+            calc_reactions(criar_entrada_dummy())
+    finally:
+        tracing.desativar()
+
+    assert [e["name"] for e in tracing.eventos()] == ["calc_reactions", "calcular"]
+
+
+def test_arquivo_de_trace_por_processo(tmp_path):
+    caminho = tracing.arquivo_do_processo(str(tmp_path / "trace.json"))
+    assert caminho == str(tmp_path / f"trace.{os.getpid()}.json")
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.curva_carga import CurvaCarga
+from engine.trajetoria import amostrar_trajetoria, verificar_trajetoria
+from tests.test_calc_reactions import criar_entrada_dummy
+
+INICIO = {"giro": 350.0, "raio": 8.0, "lanca": 22.0, "altura": 2.0}
+FIM = {"giro": 100.0, "raio": 14.0, "lanca": 22.0, "altura": 10.0}
+
+
+def test_giro_pelo_caminho_mais_curto():
+    df = amostrar_trajetoria(INICIO, FIM, n=11)
+    assert df["giro"].iloc[-1] - df["giro"].iloc[0] == pytest.approx(110.0)
+
+    df = amostrar_trajetoria(INICIO, FIM, n=11, sentido="horario")
+    assert df["giro"].iloc[-1] - df["giro"].iloc[0] == pytest.approx(-250.0)
+
+
+def test_trajetoria_em_fases():
+    df = amostrar_trajetoria(INICIO, FIM, n=5, ordem=("altura", "giro"))
+    assert len(df) == 20
+    # durante o içamento do gancho, giro e raio não mudam
+    assert (df["giro"].iloc[:5] == 350.0).all()
+    assert df["altura"].iloc[4] == 10.0
+    assert (df["raio"].iloc[:10] == 8.0).all()
+    assert df["raio"].iloc[-1] == 14.0
+
+
+def test_verificacao_igual_ao_solver():
+    entrada = criar_entrada_dummy()
+    curva = CurvaCarga(
+        pd.DataFrame(
+            {
+                "Raio": [3.0, 10.0, 20.0, 3.0, 14.0, 21.0],
+                "Lanca": [21.0, 21.0, 21.0, 30.0, 30.0, 30.0],
+                "Carga": [20.0, 10.0, 2.0, 15.0, 8.0, 3.0],
+            }
+        )
+    )
+    res = verificar_trajetoria(entrada, curva, INICIO, FIM, n=200)
+
+    p = parametros_entrada(entrada)
+    p["raio"] = res.amostras["raio"].to_numpy()
+    p["lanca"] = res.amostras["lanca"].to_numpy()
+    p["angulo_giro_deg"] = res.amostras["giro"].to_numpy()
+    R = calc_reactions_lote(**p)[:, 2:]
+    np.testing.assert_allclose(res.amostras["Reacao_min"], R.min(axis=1))
+
+    cap = curva.capacidade(p["raio"], p["lanca"])
+    np.testing.assert_allclose(res.amostras["Utilizacao"], p["carga"] / cap)
+    assert res.critico["Utilizacao"] == res.amostras["Utilizacao"].max()
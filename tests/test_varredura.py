@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.curva_carga import CurvaCarga
+from engine.varredura import varrer
+from tests.dados import dados_tabelas_patolas
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_grade_igual_a_casos_isolados():
+    entrada = criar_entrada_dummy()
+    x = np.linspace(0.0, 30.0, 7)
+    y = np.linspace(4.0, 30.0, 5)  # raio > lança (22 m) fora do domínio
+    res = varrer(entrada, "contrapeso", x, "raio", y, pressao_admissivel=250e3)
+    assert res.reacoes.shape == (5, 7, 4)
+
+    p = parametros_entrada(entrada)
+    p["contrapeso"], p["raio"] = x[3], y[1]
+    esperado = calc_reactions_lote(**p)[2:]
+    np.testing.assert_allclose(res.reacoes[1, 3], esperado)
+    np.testing.assert_allclose(
+        res.utilizacao_sapata[1, 3], esperado.max() / (250e3 * 2.25)
+    )
+    assert np.isnan(res.reacao_min[-1]).all()
+    assert np.isnan(res.utilizacao_tabela).all()
+
+
+def test_utilizacao_da_tabela_e_governante():
+    entrada = criar_entrada_dummy()
+    curva = CurvaCarga(
+        pd.DataFrame(
+            {
+                "Raio": [3.0, 3.0, 20.0, 20.0, 10.0],
+                "Lanca": [11.0, 30.0, 21.0, 30.0, 22.0],
+                "Carga": [10.0, 10.0, 10.0, 10.0, 10.0],
+            }
+        )
+    )
+    res = varrer(entrada, "carga", [5.0, 20.0], "raio", [8.0], curva=curva)
+    np.testing.assert_allclose(res.utilizacao_tabela, [[0.5, 2.0]])
+    np.testing.assert_allclose(res.utilizacao, res.utilizacao_tabela)
+
+    with pytest.raises(ValueError):
+        varrer(entrada, "carga", [1.0, 2.0], "carga", [1.0, 2.0])
+
+
+def test_varredura_da_pagina_usa_cache(monkeypatch):
+    from pages import calc_patolas as pg
+
+    d = dados_tabelas_patolas()
+    entradas = [d[k] for k in ("pat", "cm", "lanca", "carga", "vento", "solo")]
+    entradas += [d["pesos"], d["angulo"]]
+    eixos = ["raio", 2, 30, 200, "carga", 1, 30, 200, "guindaste_80TON"]
+
+    fig_reacao, fig_utilizacao, msg = pg.executar_varredura(1, *entradas, *eixos)
+    assert fig_reacao.data[0].z.shape == (200, 200)
+    assert "do cache" not in msg.children
+
+    def falhar(*args, **kwargs):
+        raise AssertionError("varredura recalculada")
+
+    monkeypatch.setattr(pg, "varrer", falhar)
+    fig_cache, _, msg = pg.executar_varredura(1, *entradas, *eixos)
+    assert "do cache" in msg.children
+    np.testing.assert_array_equal(fig_cache.data[0].z, fig_reacao.data[0].z)
+
+
+def test_resumo_guardado_em_float32():
+    entrada = criar_entrada_dummy()
+    res = varrer(entrada, "carga", np.linspace(1, 30, 40), "raio", np.linspace(2, 30, 30))
+    resumo = res.resumo()
+    assert resumo.reacao_min.dtype == np.float32
+    assert resumo.reacao_min.nbytes * 3 < res.reacoes.nbytes
+    np.testing.assert_allclose(resumo.reacao_min, res.reacao_min, rtol=1e-6)
+    np.testing.assert_allclose(resumo.utilizacao, res.utilizacao, rtol=1e-6)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from engine.calc_reactions import calc_reactions_lote, parametros_entrada
+from engine.vento import DENSIDADE_AR, PerfilVento, forcas_vento, pior_direcao_vento
+from tests.test_calc_reactions import criar_entrada_dummy
+
+
+def test_vento_uniforme_perpendicular_a_lanca():
+    entrada = criar_entrada_dummy()
+    perfil = PerfilVento(velocidade=20.0, expoente=0.0)
+    # giro 0: lança no plano XZ; vento em Y é perpendicular
+    f = forcas_vento(entrada, perfil, [90.0], [0.0], [1.0] * 4, area_carga=0.0)
+    q = 0.5 * DENSIDADE_AR * 20.0**2
+    assert f.forca_lanca[0, 0] == pytest.approx(q * 1.2 * 4.0)
+    assert f.fator[0, 0] == pytest.approx(0.5)
+    assert f.fx[0, 0] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_resultante_igual_superposicao_dos_segmentos():
+    entrada = criar_entrada_dummy()
+    perfil = PerfilVento(velocidade=25.0)
+    areas = np.array([2.0, 1.5, 1.0])
+    res = pior_direcao_vento(
+        entrada, perfil, areas, direcoes=[30.0, 200.0], giros=[0.0, 120.0]
+    )
+
+    p = parametros_entrada(entrada)
+    p["angulo_giro_deg"] = 120.0
+    p["vento_i"] = p["vento_j"] = 0.0
+    sem_vento = calc_reactions_lote(**p)[2:]
+
+    d = np.radians(200.0)
+    h = np.sqrt(p["lanca"] ** 2 - p["raio"] ** 2)
+    s = (np.arange(3) + 0.5) / 3
+    cos_phi = p["raio"] / p["lanca"] * np.cos(np.radians(120.0) - d)
+    forcas = perfil.pressao(2.0 + s * h) * 1.2 * areas * np.sqrt(1 - cos_phi**2)
+    forcas = np.append(forcas, res.forcas.forca_carga[1, 1])
+    fatores = np.append(s, 1.0)
+
+    esperado = sem_vento.copy()
+    for F, fator in zip(forcas, fatores):
+        p["vento_i"], p["vento_j"] = F * np.cos(d), F * np.sin(d)
+        p["fator_vento"] = fator
+        esperado += calc_reactions_lote(**p)[2:] - sem_vento
+
+    np.testing.assert_allclose(res.reacoes[1, 1], esperado, rtol=1e-9)
+    assert res.pior["Reacao_min"] == res.reacoes.min()